@@ -1,8 +1,43 @@
 #!/bin/bash
 cd ./gem5
 
-yes '' | scons build/X86_MESI_Three_Level_Prepush/gem5.opt -j64
-yes '' | scons build/X86_MESI_Three_Level_PrepushAck/gem5.opt -j64
-yes '' | scons build/X86_MESI_Three_Level_PrepushAck_Bingo/gem5.opt -j64
-yes '' | scons build/X86_MESI_Three_Level_Prepush_Feedback_Restart_Ratio/gem5.opt -j64
-yes '' | scons build/X86_MESI_Three_Level_PrepushAck_Feedback_Restart_Ratio/gem5.opt -j64
\ No newline at end of file
+# Protocol variants, they only differ in PROTOCOL
+VARIANTS="X86_MESI_Three_Level_Prepush
+X86_MESI_Three_Level_PrepushAck
+X86_MESI_Three_Level_PrepushAck_Bingo
+X86_MESI_Three_Level_Prepush_Feedback_Restart_Ratio
+X86_MESI_Three_Level_PrepushAck_Feedback_Restart_Ratio"
+
+# Objects are cached by content under M5_BUILD_CACHE, so a variant (or a
+# protocol switch) never recompiles an object that was built before
+M5_BUILD_CACHE=${M5_BUILD_CACHE:-$(pwd)/build/cache}
+JOBS=${JOBS:-64}
+
+# Ruby node sets hold NUMBER_BITS_PER_SET nodes per controller type, set it
+# to the core count for 256 or 1024 cores. SCons keeps the value of the last
+# build of a directory, so it is always passed to go back to 128
+NUMBER_BITS_PER_SET=${NUMBER_BITS_PER_SET:-128}
+SCONS_VARS="M5_BUILD_CACHE=$M5_BUILD_CACHE"
+SCONS_VARS+=" NUMBER_BITS_PER_SET=$NUMBER_BITS_PER_SET"
+
+# GEM5_BUILD_MODE=shared (default) builds every protocol in the single
+# build directory SHARED, switching its PROTOCOL: only the SLICC output and
+# the Ruby objects depending on it are rebuilt for each protocol, while the
+# ISA/CPU objects are compiled once, and the binary is copied to the build
+# directory of its variant. GEM5_BUILD_MODE=separate builds every variant
+# in its own build directory.
+SHARED=X86_MESI_Three_Level_Shared
+
+for VARIANT in $VARIANTS; do
+    if [ "${GEM5_BUILD_MODE:-shared}" = "separate" ]; then
+        yes '' | scons build/$VARIANT/gem5.opt -j$JOBS \
+            $SCONS_VARS || exit 1
+    else
+        PROTOCOL=$(sed -n "s/^PROTOCOL = '\(.*\)'$/\1/p" build_opts/$VARIANT)
+        yes '' | scons build/$SHARED/gem5.opt -j$JOBS \
+            $SCONS_VARS PROTOCOL=$PROTOCOL || exit 1
+        mkdir -p build/$VARIANT
+        # replace rather than overwrite a binary that may be running
+        cp --remove-destination build/$SHARED/gem5.opt build/$VARIANT/gem5.opt
+    fi
+done
@@ -315,6 +315,9 @@ def addCommonOptions(parser):
         help="restore from checkpoint <N>")
     parser.add_option("--checkpoint-at-end", action="store_true",
                       help="take a checkpoint at end of run")
+    parser.add_option("--checkpoint-at-roi", action="store_true",
+                      help="take a checkpoint and exit when fast-forwarding "
+                      "reaches the ROI begin (m5_switch_cpu)")
     parser.add_option("--work-begin-checkpoint-count", action="store", type="int",
                       help="checkpoint at specified work begin count")
     parser.add_option("--work-end-checkpoint-count", action="store", type="int",
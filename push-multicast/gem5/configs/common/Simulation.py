@@ -442,6 +442,9 @@ def run(options, root, testsys, cpu_class):
     if options.fast_forward and options.checkpoint_restore != None:
         fatal("Can't specify both --fast-forward and --checkpoint-restore")
 
+    if options.checkpoint_at_roi and not options.fast_forward:
+        fatal("--checkpoint-at-roi requires --fast-forward")
+
     if options.standard_switch and not options.caches:
         fatal("Must specify --caches when using --standard-switch")
 
@@ -675,6 +678,17 @@ def run(options, root, testsys, cpu_class):
         else:
             print("Switch at curTick count:%s" % str(10000))
             exit_event = m5.simulate(10000)
+
+        # Checkpoint the state at the ROI begin so that many detailed
+        # runs can restore from it instead of fast-forwarding again
+        if options.checkpoint_at_roi:
+            if exit_event.getCause() != "switchcpu":
+                fatal("Fast-forward ended before the ROI begin: %s",
+                      exit_event.getCause())
+            m5.checkpoint(joinpath(cptdir, "cpt.%d" % m5.curTick()))
+            print("Checkpoint @ tick %i at ROI begin" % m5.curTick())
+            return
+
         print("Switched CPUS @ tick %s" % (m5.curTick()))
 
         m5.switchCpus(testsys, switch_cpu_list)
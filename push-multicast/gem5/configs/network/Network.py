@@ -41,6 +41,23 @@ def define_options(parser):
                       help="check configs/topologies for complete set")
     parser.add_option("--mesh-rows", type="int", default=0,
                       help="the number of rows in the mesh topology")
+    parser.add_option("--concentration", type="int", default=1,
+                      help="number of cores per router in the "
+                           "ConcentratedMesh_XY topology")
+    parser.add_option("--dir-placement", type="choice", default="corners",
+                      choices=['corners', 'edges', 'diagonal', 'interleaved'],
+                      help="""placement of the directories in the
+                            ConcentratedMesh_XY topology:
+                            'corners'|'edges'|'diagonal'|'interleaved'""")
+    parser.add_option("--express-interval", type="int", default=4,
+                      help="hops covered by an express link in the "
+                           "ExpressMesh_XY topology")
+    parser.add_option("--cluster-rows", type="int", default=4,
+                      help="router rows of a cluster in the ClusteredMesh "
+                           "topology")
+    parser.add_option("--cluster-cols", type="int", default=4,
+                      help="router columns of a cluster in the "
+                           "ClusteredMesh topology")
     parser.add_option("--network", type="choice", default="simple",
                       choices=['simple', 'garnet'],
                       help="""'simple'|'garnet' (garnet2.0 will be
@@ -75,7 +92,12 @@ def define_options(parser):
                             1: XY (for Mesh. see garnet/RoutingUnit.cc)
                             2: Custom (see garnet/RoutingUnit.cc)
                             3: YX (for Mesh. see garnet/RoutingUnit.cc)
-                            4: XY-YX (for Mesh. see garnet/RoutingUnit.cc)""")
+                            4: XY-YX (for Mesh. see garnet/RoutingUnit.cc)
+                            5: Express XY (for ExpressMesh_XY)
+                            6: Flattened butterfly (for FlattenedButterfly)
+                            7: Clustered (for ClusteredMesh)
+                            8: Quadrant XY-YX (for Mesh. XY to the east, YX
+                               to the west)""")
     parser.add_option("--network-fault-model", action="store_true",
                       default=False,
                       help="""enable network fault model:
@@ -0,0 +1,104 @@
+# Copyright (c) 2010 Advanced Micro Devices, Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from __future__ import print_function
+from __future__ import absolute_import
+
+from m5.params import *
+from m5.objects import *
+
+from topologies.ConcentratedMesh_XY import ConcentratedMesh_XY
+
+# Creates a two-level mesh on the routers of a ConcentratedMesh_XY. The
+# routers are grouped in clusters of --cluster-rows x --cluster-cols
+# routers, linked by a local mesh inside each cluster only. The router in
+# the middle of each cluster is its hub: every other router of the cluster
+# has an Up link to the hub and a Down link back from it, and the hubs of
+# neighbouring clusters are linked by a global mesh (GlobalEast,
+# GlobalWest, GlobalNorth and GlobalSouth ports).
+# Use with --routing-algorithm=7 (clustered): packets use XY routing on the
+# local mesh within a cluster, otherwise they go up to the hub of their
+# source cluster, follow XY routing on the global mesh to the hub of the
+# destination cluster and go down to their destination.
+
+class ClusteredMesh(ConcentratedMesh_XY):
+    description='ClusteredMesh'
+
+    def makeIntLinks(self, options, network, IntLink, routers, num_rows,
+                     num_columns):
+        cluster_rows = options.cluster_rows
+        cluster_cols = options.cluster_cols
+        assert(cluster_rows > 0 and num_rows % cluster_rows == 0)
+        assert(cluster_cols > 0 and num_columns % cluster_cols == 0)
+        network.cluster_rows = cluster_rows
+        network.cluster_cols = cluster_cols
+        global_rows = num_rows // cluster_rows
+        global_cols = num_columns // cluster_cols
+
+        def cluster(router):
+            return (router // num_columns // cluster_rows,
+                    router % num_columns // cluster_cols)
+
+        def hub(row, col):
+            return (row * cluster_rows + cluster_rows // 2) * num_columns + \
+                   col * cluster_cols + cluster_cols // 2
+
+        # Local mesh links within each cluster (weights 1 and 2)
+        def local(src, dst):
+            return cluster(src) == cluster(dst)
+
+        self.makeMeshLinks(IntLink, routers, num_rows, num_columns,
+                           linked=local)
+
+        # Up and Down links between the routers and their hub (weight = 3)
+        for i in range(len(routers)):
+            h = hub(*cluster(i))
+            if i == h:
+                continue
+            self.connect(IntLink, routers[i], routers[h],
+                         "Up", "Up%d" % i, 3)
+            self.connect(IntLink, routers[h], routers[i],
+                         "Down%d" % i, "Down", 3)
+
+        # Global mesh links between the hubs, East-West (weight = 4)
+        for row in range(global_rows):
+            for col in range(global_cols - 1):
+                west = routers[hub(row, col)]
+                east = routers[hub(row, col + 1)]
+                self.connect(IntLink, west, east,
+                             "GlobalEast", "GlobalWest", 4)
+                self.connect(IntLink, east, west,
+                             "GlobalWest", "GlobalEast", 4)
+
+        # Global mesh links between the hubs, North-South (weight = 5)
+        for col in range(global_cols):
+            for row in range(global_rows - 1):
+                north = routers[hub(row, col)]
+                south = routers[hub(row + 1, col)]
+                self.connect(IntLink, north, south,
+                             "GlobalNorth", "GlobalSouth", 5)
+                self.connect(IntLink, south, north,
+                             "GlobalSouth", "GlobalNorth", 5)
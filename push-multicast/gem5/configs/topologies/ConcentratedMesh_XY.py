@@ -0,0 +1,291 @@
+# Copyright (c) 2010 Advanced Micro Devices, Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from __future__ import print_function
+from __future__ import absolute_import
+
+import math
+
+from m5.params import *
+from m5.objects import *
+
+from common import FileSystemConfig
+
+from topologies.BaseTopology import SimpleTopology
+
+# Creates a (possibly concentrated) Mesh with --concentration cores per
+# router and any number of directories placed according to
+# --dir-placement:
+#   corners:     one directory at each corner (at most four)
+#   edges:       evenly spread along the perimeter of the mesh
+#   diagonal:    evenly spread along the main diagonal
+#   interleaved: one directory in the middle of each block of a grid
+#                dividing the mesh
+# The L0/L1/L2 controllers of core i are connected to router
+# i // concentration. Without --mesh-rows, the mesh is made as square as
+# possible. Each directory is a NUMA node holding the cores of the routers
+# closest to it.
+# XY routing is enforced (using link weights) to guarantee deadlock freedom.
+
+def closest_factors(num):
+    """Rows and columns of the most square rectangle of num routers, with
+    at least as many rows as columns"""
+
+    col = int(math.sqrt(num))
+    while num % col != 0:
+        col -= 1
+    return num // col, col
+
+class ConcentratedMesh_XY(SimpleTopology):
+    description='ConcentratedMesh_XY'
+
+    def __init__(self, controllers):
+        self.nodes = controllers
+
+    def dirRouters(self, placement, num_dirs, num_rows, num_columns):
+        """Router of each directory"""
+
+        num_routers = num_rows * num_columns
+
+        if placement == 'corners':
+            assert(num_dirs <= 4)
+            corners = [0, num_columns - 1, num_routers - num_columns,
+                       num_routers - 1]
+            return corners[:num_dirs]
+
+        if placement == 'edges':
+            # perimeter routers, clockwise from router 0
+            perimeter = list(range(num_columns))
+            perimeter += [row * num_columns + num_columns - 1
+                          for row in range(1, num_rows)]
+            if num_rows > 1:
+                perimeter += [(num_rows - 1) * num_columns + col
+                              for col in reversed(range(num_columns - 1))]
+            if num_columns > 1:
+                perimeter += [row * num_columns
+                              for row in reversed(range(1, num_rows - 1))]
+            assert(num_dirs <= len(perimeter))
+            return [perimeter[(2 * i + 1) * len(perimeter) // (2 * num_dirs)]
+                    for i in range(num_dirs)]
+
+        if placement == 'diagonal':
+            assert(num_dirs <= min(num_rows, num_columns))
+            return [((2 * i + 1) * num_rows // (2 * num_dirs)) * num_columns +
+                    (2 * i + 1) * num_columns // (2 * num_dirs)
+                    for i in range(num_dirs)]
+
+        if placement == 'interleaved':
+            # a grid of blocks shaped like the mesh, one directory each
+            block_rows, block_columns = closest_factors(num_dirs)
+            if num_rows < num_columns:
+                block_rows, block_columns = block_columns, block_rows
+            assert(block_rows <= num_rows and block_columns <= num_columns)
+            return [((2 * r + 1) * num_rows // (2 * block_rows)) *
+                    num_columns +
+                    (2 * c + 1) * num_columns // (2 * block_columns)
+                    for r in range(block_rows)
+                    for c in range(block_columns)]
+
+        raise RuntimeError("Unknown directory placement {}".format(
+            placement))
+
+    def makeTopology(self, options, network, IntLink, ExtLink, Router):
+        nodes = self.nodes
+
+        concentration = options.concentration
+        assert(concentration > 0 and options.num_cpus % concentration == 0)
+        num_routers = options.num_cpus // concentration
+        num_rows = options.mesh_rows
+        if num_rows == 0:
+            num_rows, _ = closest_factors(num_routers)
+            # the network uses the rows for XY routing
+            options.mesh_rows = num_rows
+
+        # default values for link latency and router latency.
+        # Can be over-ridden on a per link/router basis
+        link_latency = options.link_latency # used by simple and garnet
+        router_latency = options.router_latency # only used by garnet
+
+
+        # First determine which nodes are cache cntrls vs. dirs vs. dma,
+        # keeping the cache cntrls of each level in order
+        cache_nodes = {}
+        dir_nodes = []
+        dma_nodes = []
+        for node in nodes:
+            if node.type == 'L0Cache_Controller' or \
+                node.type == 'L1Cache_Controller' or \
+                node.type == 'L2Cache_Controller':
+                cache_nodes.setdefault(node.type, []).append(node)
+            elif node.type == 'Directory_Controller':
+                dir_nodes.append(node)
+            elif node.type == 'DMA_Controller':
+                dma_nodes.append(node)
+            else:
+                raise RuntimeError("Unknown controller {}".format(node.type))
+
+        # Obviously the number or rows must be <= the number of routers
+        # and evenly divisible.  Also the number of caches of each level
+        # must be a multiple of the number of routers.
+        assert(num_rows > 0 and num_rows <= num_routers)
+        num_columns = int(num_routers / num_rows)
+        assert(num_columns * num_rows == num_routers)
+
+        # Create the routers in the mesh
+        routers = [Router(router_id=i, latency = router_latency) \
+            for i in range(num_routers)]
+        network.routers = routers
+
+        # link counter to set unique link ids
+        link_count = 0
+
+        # Connect each cache controller to the router of its core, the
+        # consecutive controllers of a level share a router
+        ext_links = []
+        for cntrl_type in sorted(cache_nodes):
+            level_nodes = cache_nodes[cntrl_type]
+            per_router, remainder = divmod(len(level_nodes), num_routers)
+            assert(remainder == 0)
+            for (i, n) in enumerate(level_nodes):
+                ext_links.append(ExtLink(link_id=link_count, ext_node=n,
+                                        int_node=routers[i // per_router],
+                                        latency = link_latency))
+                link_count += 1
+
+        # Connect the dir nodes to their routers
+        self.dir_routers = self.dirRouters(options.dir_placement,
+                                           len(dir_nodes), num_rows,
+                                           num_columns)
+        for (node, router_id) in zip(dir_nodes, self.dir_routers):
+            ext_links.append(ExtLink(link_id=link_count, ext_node=node,
+                                    int_node=routers[router_id],
+                                    latency = link_latency))
+            link_count += 1
+
+        # NUMA Node for each directory, holding the cores of the routers
+        # closest to it (the smallest node on ties)
+        self.numa_nodes = [[] for _ in self.dir_routers]
+        for i in range(num_routers):
+            distances = [abs(i % num_columns - d % num_columns) +
+                         abs(i // num_columns - d // num_columns)
+                         for d in self.dir_routers]
+            numa_node = min(range(len(distances)),
+                key=lambda n: (distances[n], len(self.numa_nodes[n])))
+            self.numa_nodes[numa_node].extend(
+                range(i * concentration, (i + 1) * concentration))
+
+        # Connect the dma nodes to router 0.  These should only be DMA nodes.
+        for (i, node) in enumerate(dma_nodes):
+            assert(node.type == 'DMA_Controller')
+            ext_links.append(ExtLink(link_id=link_count, ext_node=node,
+                                     int_node=routers[0],
+                                     latency = link_latency))
+            link_count += 1
+
+        network.ext_links = ext_links
+
+        # Create the links between the routers
+        self.int_links = []
+        self.link_count = link_count
+        self.link_latency = link_latency
+        self.makeIntLinks(options, network, IntLink, routers, num_rows,
+                          num_columns)
+        network.int_links = self.int_links
+
+    def connect(self, IntLink, src, dst, src_outport, dst_inport, weight):
+        self.int_links.append(IntLink(link_id=self.link_count,
+                                      src_node=src,
+                                      dst_node=dst,
+                                      src_outport=src_outport,
+                                      dst_inport=dst_inport,
+                                      latency = self.link_latency,
+                                      weight=weight))
+        self.link_count += 1
+
+    def makeMeshLinks(self, IntLink, routers, num_rows, num_columns,
+                      span=1, suffix="", linked=lambda src, dst: True):
+        """Mesh links between the routers span apart in each dimension for
+        which linked() holds, with ports named after their direction and
+        suffix"""
+
+        # East output to West input links (weight = 1)
+        for row in range(num_rows):
+            for col in range(num_columns - span):
+                east_out = col + (row * num_columns)
+                west_in = (col + span) + (row * num_columns)
+                if linked(east_out, west_in):
+                    self.connect(IntLink, routers[east_out],
+                                 routers[west_in], "East" + suffix,
+                                 "West" + suffix, 1)
+
+        # West output to East input links (weight = 1)
+        for row in range(num_rows):
+            for col in range(num_columns - span):
+                east_in = col + (row * num_columns)
+                west_out = (col + span) + (row * num_columns)
+                if linked(east_in, west_out):
+                    self.connect(IntLink, routers[west_out],
+                                 routers[east_in], "West" + suffix,
+                                 "East" + suffix, 1)
+
+        # North output to South input links (weight = 2)
+        for col in range(num_columns):
+            for row in range(num_rows - span):
+                north_out = col + (row * num_columns)
+                south_in = col + ((row + span) * num_columns)
+                if linked(north_out, south_in):
+                    self.connect(IntLink, routers[north_out],
+                                 routers[south_in], "North" + suffix,
+                                 "South" + suffix, 2)
+
+        # South output to North input links (weight = 2)
+        for col in range(num_columns):
+            for row in range(num_rows - span):
+                north_in = col + (row * num_columns)
+                south_out = col + ((row + span) * num_columns)
+                if linked(north_in, south_out):
+                    self.connect(IntLink, routers[south_out],
+                                 routers[north_in], "South" + suffix,
+                                 "North" + suffix, 2)
+
+    def makeIntLinks(self, options, network, IntLink, routers, num_rows,
+                     num_columns):
+        """Links between the routers, overridden by the topologies built
+        on this one"""
+
+        self.makeMeshLinks(IntLink, routers, num_rows, num_columns)
+
+    # Register nodes with filesystem
+    def registerTopology(self, options):
+        num_numa_nodes = sum(map(bool, self.numa_nodes))
+        assert(num_numa_nodes > 0)
+
+        i = 0
+        for n in self.numa_nodes:
+            if n:
+                FileSystemConfig.register_node(n,
+                    MemorySize(options.mem_size) // num_numa_nodes, i)
+            i += 1
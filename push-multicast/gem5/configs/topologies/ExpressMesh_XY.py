@@ -0,0 +1,62 @@
+# Copyright (c) 2010 Advanced Micro Devices, Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from __future__ import print_function
+from __future__ import absolute_import
+
+from m5.params import *
+from m5.objects import *
+
+from topologies.ConcentratedMesh_XY import ConcentratedMesh_XY
+
+# Creates a ConcentratedMesh_XY with express links in addition to the mesh
+# links: every --express-interval routers along a row or column, the router
+# is also linked to the router --express-interval hops away, through the
+# EastExpress/WestExpress/NorthExpress/SouthExpress ports.
+# Use with --routing-algorithm=5 (express XY): packets follow XY routing and
+# take the express links while at least --express-interval hops remain in
+# the current dimension.
+
+class ExpressMesh_XY(ConcentratedMesh_XY):
+    description='ExpressMesh_XY'
+
+    def makeIntLinks(self, options, network, IntLink, routers, num_rows,
+                     num_columns):
+        interval = options.express_interval
+        assert(interval > 1)
+        network.express_interval = interval
+
+        self.makeMeshLinks(IntLink, routers, num_rows, num_columns)
+
+        # Express links start at the routers whose position along the link
+        # dimension is a multiple of the interval
+        def aligned(src, dst):
+            if src // num_columns == dst // num_columns:
+                return (src % num_columns) % interval == 0
+            return (src // num_columns) % interval == 0
+
+        self.makeMeshLinks(IntLink, routers, num_rows, num_columns,
+                           span=interval, suffix="Express", linked=aligned)
@@ -0,0 +1,67 @@
+# Copyright (c) 2010 Advanced Micro Devices, Inc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from __future__ import print_function
+from __future__ import absolute_import
+
+from m5.params import *
+from m5.objects import *
+
+from topologies.ConcentratedMesh_XY import ConcentratedMesh_XY
+
+# Creates a 2-D flattened butterfly on the routers of a ConcentratedMesh_XY:
+# every router is directly linked to all the routers of its row, through
+# port X<column>, and to all the routers of its column, through port Y<row>,
+# so any router is at most two hops away.
+# Use with --routing-algorithm=6 (flattened butterfly): packets first jump
+# to the column of their destination, then to its row.
+
+class FlattenedButterfly(ConcentratedMesh_XY):
+    description='FlattenedButterfly'
+
+    def makeIntLinks(self, options, network, IntLink, routers, num_rows,
+                     num_columns):
+        # Row links (weight = 1)
+        for row in range(num_rows):
+            for src_col in range(num_columns):
+                for dst_col in range(num_columns):
+                    if src_col == dst_col:
+                        continue
+                    self.connect(IntLink,
+                                 routers[src_col + (row * num_columns)],
+                                 routers[dst_col + (row * num_columns)],
+                                 "X%d" % dst_col, "X%d" % src_col, 1)
+
+        # Column links (weight = 2)
+        for col in range(num_columns):
+            for src_row in range(num_rows):
+                for dst_row in range(num_rows):
+                    if src_row == dst_row:
+                        continue
+                    self.connect(IntLink,
+                                 routers[col + (src_row * num_columns)],
+                                 routers[col + (dst_row * num_columns)],
+                                 "Y%d" % dst_row, "Y%d" % src_row, 2)
@@ -532,6 +532,7 @@ registerHandlers(Handler reset_handler, Handler dump_handler)
 
 CallbackQueue dumpQueue;
 CallbackQueue resetQueue;
+CallbackQueue sampleQueue;
 
 void
 processResetQueue()
@@ -545,6 +546,12 @@ processDumpQueue()
     dumpQueue.process();
 }
 
+void
+processSampleQueue()
+{
+    sampleQueue.process();
+}
+
 void
 registerResetCallback(const std::function<void()> &callback)
 {
@@ -603,6 +610,12 @@ registerDumpCallback(const std::function<void()> &callback)
     dumpQueue.push_back(callback);
 }
 
+void
+registerSampleCallback(const std::function<void()> &callback)
+{
+    sampleQueue.push_back(callback);
+}
+
 } // namespace Stats
 
 void
@@ -3439,6 +3439,20 @@ void processResetQueue();
  */
 void processDumpQueue();
 
+/**
+ * Register a callback that should be called before statistics are
+ * sampled into a time series without being dumped. Unlike dump
+ * callbacks, the callback may be called any number of times between two
+ * dumps, so it has to recompute the statistics it collates rather than
+ * accumulate into them.
+ */
+void registerSampleCallback(const std::function<void()> &callback);
+
+/**
+ * Process all the callbacks in the sample callbacks queue
+ */
+void processSampleQueue();
+
 std::list<Info *> &statsList();
 
 typedef std::map<const void *, Info *> MapType;
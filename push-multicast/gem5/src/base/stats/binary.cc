@@ -0,0 +1,376 @@
+/*
+ * Copyright (c) 2021 The Push Multicast Authors
+ * All rights reserved.
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are
+ * met: redistributions of source code must retain the above copyright
+ * notice, this list of conditions and the following disclaimer;
+ * redistributions in binary form must reproduce the above copyright
+ * notice, this list of conditions and the following disclaimer in the
+ * documentation and/or other materials provided with the distribution;
+ * neither the name of the copyright holders nor the names of its
+ * contributors may be used to endorse or promote products derived from
+ * this software without specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ * "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ * LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+ * A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+ * OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+ * SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+ * LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+ * DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+ * THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+ * (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+ * OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+ */
+
+#include "base/stats/binary.hh"
+
+#include <cassert>
+
+#include "base/cprintf.hh"
+#include "base/logging.hh"
+#include "base/output.hh"
+#include "base/stats/info.hh"
+#include "sim/core.hh"
+
+namespace Stats {
+
+Binary::Binary(const std::string &file, bool desc, bool formulas,
+               bool delta)
+    : enableDescriptions(desc), enableFormula(formulas), enableDelta(delta),
+      stream(file, std::ios::out | std::ios::trunc | std::ios::binary),
+      dumpCount(0)
+{
+    if (!valid())
+        fatal("Unable to open binary statistics file %s for writing\n", file);
+
+    const char magic[8] = { 'M', '5', 'S', 'T', 'A', 'T', 'B', 'N' };
+    stream.write(magic, sizeof(magic));
+    write<uint32_t>(version);
+    write<uint32_t>(0x01020304);
+    write<uint32_t>(delta ? DELTA : 0);
+}
+
+Binary::~Binary()
+{
+}
+
+
+void
+Binary::begin()
+{
+    write<uint8_t>(BEGIN_DUMP);
+    write<uint32_t>(dumpCount);
+    write<uint64_t>(curTick());
+}
+
+void
+Binary::end()
+{
+    assert(valid());
+
+    write<uint8_t>(END_DUMP);
+    write<uint32_t>(dumpCount);
+    // Every dump is complete on disk, readers can follow a running
+    // simulation
+    stream.flush();
+
+    dumpCount++;
+}
+
+bool
+Binary::valid() const
+{
+    return stream.good();
+}
+
+
+void
+Binary::beginGroup(const char *name)
+{
+    if (path.empty()) {
+        path.push(name);
+    } else {
+        path.push(csprintf("%s.%s", path.top(), name));
+    }
+}
+
+void
+Binary::endGroup()
+{
+    assert(!path.empty());
+    path.pop();
+}
+
+std::string
+Binary::statName(const std::string &name) const
+{
+    if (path.empty())
+        return name;
+    else
+        return csprintf("%s.%s", path.top(), name);
+}
+
+bool
+Binary::noOutput(const Info &info)
+{
+    if (!info.flags.isSet(display))
+        return true;
+
+    if (info.prereq && info.prereq->zero())
+        return true;
+
+    return false;
+}
+
+uint32_t
+Binary::intern(const std::string &str, bool *added)
+{
+    auto it = strings.find(str);
+    if (added)
+        *added = it == strings.end();
+    if (it != strings.end())
+        return it->second;
+
+    uint32_t id = strings.size();
+    strings.emplace(str, id);
+
+    write<uint8_t>(STRING);
+    write<uint32_t>(id);
+    write<uint32_t>(str.size());
+    stream.write(str.data(), str.size());
+
+    return id;
+}
+
+void
+Binary::writeSubnames(Tag tag, uint32_t id,
+                      const std::vector<std::string> &subnames)
+{
+    bool named = false;
+    for (const auto &subname : subnames)
+        named = named || !subname.empty();
+    if (!named)
+        return;
+
+    std::vector<uint32_t> ids;
+    for (const auto &subname : subnames)
+        ids.push_back(intern(subname));
+
+    write<uint8_t>(tag);
+    write<uint32_t>(id);
+    write<uint32_t>(ids.size());
+    for (auto subname : ids)
+        write<uint32_t>(subname);
+}
+
+void
+Binary::writeRecord(Tag tag, const Info &info, const std::string &name,
+                    const std::string &payload,
+                    const std::vector<std::string> *subnames,
+                    const std::vector<std::string> *y_subnames)
+{
+    bool added;
+    uint32_t id = intern(name, &added);
+
+    // Descriptions and subnames don't change between dumps, only write
+    // them the first time the stat is seen.
+    if (added && enableDescriptions && !info.desc.empty()) {
+        uint32_t desc = intern(info.desc);
+        write<uint8_t>(DESC);
+        write<uint32_t>(id);
+        write<uint32_t>(desc);
+    }
+
+    if (added && subnames)
+        writeSubnames(SUBNAMES, id, *subnames);
+    if (added && y_subnames)
+        writeSubnames(Y_SUBNAMES, id, *y_subnames);
+
+    if (enableDelta) {
+        // Payloads are compared bytewise, so an unchanged NaN is skipped
+        // too
+        auto it = previous.find(id);
+        if (it != previous.end() && it->second == payload)
+            return;
+        previous[id] = payload;
+    }
+
+    write<uint8_t>(tag);
+    write<uint32_t>(id);
+    stream.write(payload.data(), payload.size());
+}
+
+void
+Binary::writeVector(Tag tag, const Info &info, const std::string &name,
+                    std::string payload, const Counter *values, size_t n,
+                    const std::vector<std::string> *subnames,
+                    const std::vector<std::string> *y_subnames)
+{
+    size_t header = payload.size();
+    payload.append(reinterpret_cast<const char *>(values),
+                   n * sizeof(Counter));
+
+    auto it = enableDelta ? strings.find(name) : strings.end();
+    if (it == strings.end()) {
+        writeRecord(tag, info, name, payload, subnames, y_subnames);
+        return;
+    }
+
+    auto last = previous.find(it->second);
+    if (last == previous.end() || last->second.size() != payload.size() ||
+        last->second.compare(0, header, payload, 0, header) != 0) {
+        writeRecord(tag, info, name, payload, subnames, y_subnames);
+        return;
+    }
+
+    std::string update;
+    uint32_t changed = 0;
+    const size_t value_size = sizeof(Counter);
+    for (size_t i = 0; i < n; ++i) {
+        size_t offset = header + i * value_size;
+        if (last->second.compare(offset, value_size,
+                                 payload, offset, value_size) != 0) {
+            append<uint32_t>(update, i);
+            append<Counter>(update, values[i]);
+            changed++;
+        }
+    }
+
+    if (changed == 0)
+        return;
+
+    if (sizeof(uint32_t) + update.size() >= payload.size()) {
+        writeRecord(tag, info, name, payload, subnames, y_subnames);
+        return;
+    }
+
+    write<uint8_t>(UPDATE);
+    write<uint32_t>(it->second);
+    write<uint32_t>(changed);
+    stream.write(update.data(), update.size());
+    last->second = payload;
+}
+
+void
+Binary::visit(const ScalarInfo &info)
+{
+    if (noOutput(info))
+        return;
+
+    std::string payload;
+    append<double>(payload, info.result());
+    writeRecord(SCALAR, info, statName(info.name), payload);
+}
+
+void
+Binary::visit(const VectorInfo &info)
+{
+    if (noOutput(info))
+        return;
+
+    const VResult &values = info.result();
+    std::string payload;
+    append<uint32_t>(payload, values.size());
+    writeVector(VECTOR, info, statName(info.name), payload, values.data(),
+                values.size(), &info.subnames);
+}
+
+void
+Binary::visit(const Vector2dInfo &info)
+{
+    if (noOutput(info))
+        return;
+
+    std::string payload;
+    append<uint32_t>(payload, info.x);
+    append<uint32_t>(payload, info.y);
+    writeVector(VECTOR2D, info, statName(info.name), payload,
+                info.cvec.data(), info.cvec.size(), &info.subnames,
+                &info.y_subnames);
+}
+
+void
+Binary::writeDist(const Info &info, const std::string &name,
+                  const DistData &data)
+{
+    std::string payload;
+    append<uint8_t>(payload, data.type);
+    append<double>(payload, data.min);
+    append<double>(payload, data.max);
+    append<double>(payload, data.bucket_size);
+    append<double>(payload, data.min_val);
+    append<double>(payload, data.max_val);
+    append<double>(payload, data.underflow);
+    append<double>(payload, data.overflow);
+    append<double>(payload, data.sum);
+    append<double>(payload, data.squares);
+    append<double>(payload, data.logs);
+    append<double>(payload, data.samples);
+    append<uint32_t>(payload, data.cvec.size());
+    payload.append(reinterpret_cast<const char *>(data.cvec.data()),
+                   data.cvec.size() * sizeof(Counter));
+    writeRecord(DIST, info, name, payload);
+}
+
+void
+Binary::visit(const DistInfo &info)
+{
+    if (noOutput(info))
+        return;
+
+    writeDist(info, statName(info.name), info.data);
+}
+
+void
+Binary::visit(const VectorDistInfo &info)
+{
+    if (noOutput(info))
+        return;
+
+    for (off_type i = 0; i < info.size(); ++i) {
+        std::string name = info.name + "_" +
+            (i >= info.subnames.size() || info.subnames[i].empty() ?
+             std::to_string(i) : info.subnames[i]);
+        writeDist(info, statName(name), info.data[i]);
+    }
+}
+
+void
+Binary::visit(const FormulaInfo &info)
+{
+    if (!enableFormula)
+        return;
+
+    visit((const VectorInfo &)info);
+}
+
+void
+Binary::visit(const SparseHistInfo &info)
+{
+    if (noOutput(info))
+        return;
+
+    std::string payload;
+    append<double>(payload, info.data.samples);
+    append<uint32_t>(payload, info.data.cmap.size());
+    for (const auto &bucket : info.data.cmap) {
+        append<double>(payload, bucket.first);
+        append<double>(payload, bucket.second);
+    }
+    writeRecord(SPARSE_HIST, info, statName(info.name), payload);
+}
+
+
+std::unique_ptr<Output>
+initBinary(const std::string &filename, bool desc, bool formulas,
+           bool delta)
+{
+    return std::unique_ptr<Output>(
+        new Binary(simout.resolve(filename), desc, formulas, delta));
+}
+
+} // namespace Stats
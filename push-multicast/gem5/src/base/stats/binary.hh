@@ -0,0 +1,219 @@
+/*
+ * Copyright (c) 2021 The Push Multicast Authors
+ * All rights reserved.
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are
+ * met: redistributions of source code must retain the above copyright
+ * notice, this list of conditions and the following disclaimer;
+ * redistributions in binary form must reproduce the above copyright
+ * notice, this list of conditions and the following disclaimer in the
+ * documentation and/or other materials provided with the distribution;
+ * neither the name of the copyright holders nor the names of its
+ * contributors may be used to endorse or promote products derived from
+ * this software without specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ * "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ * LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+ * A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+ * OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+ * SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+ * LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+ * DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+ * THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+ * (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+ * OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+ */
+
+#ifndef __BASE_STATS_BINARY_HH__
+#define __BASE_STATS_BINARY_HH__
+
+#include <cstdint>
+#include <fstream>
+#include <memory>
+#include <stack>
+#include <string>
+#include <unordered_map>
+#include <vector>
+
+#include "base/stats/output.hh"
+#include "base/stats/types.hh"
+
+namespace Stats {
+
+struct DistData;
+
+/**
+ * Compact binary stat file.
+ *
+ * The file starts with the 8-byte magic "M5STATBN", a uint32 format
+ * version, a uint32 byte order mark (0x01020304 written in host byte
+ * order) and uint32 flags (DELTA), followed by a stream of records. Every
+ * record is a uint8 tag and a payload, integers are uint32 and values are
+ * float64 unless noted otherwise:
+ *
+ *   STRING      id, length, bytes     interns a stat name or subname
+ *   DESC        name id, string id    description, once per stat
+ *   SUBNAMES    name id, n, n ids     vector subnames, once per stat
+ *   Y_SUBNAMES  name id, n, n ids     2-D vector column subnames, once
+ *                                     per stat
+ *   BEGIN_DUMP  dump number, uint64 tick
+ *   END_DUMP    dump number
+ *   SCALAR      name id, value
+ *   VECTOR      name id, n, n values
+ *   VECTOR2D    name id, x, y, x * y values (row major)
+ *   DIST        name id, uint8 type, min, max, bucket_size, min_val,
+ *               max_val, underflow, overflow, sum, squares, logs, samples,
+ *               n, n bucket values
+ *   SPARSE_HIST name id, samples, n, n (value, count) pairs
+ *   UPDATE      name id, n, n (index, value) pairs
+ *
+ * Names are full stat paths, written once as STRING records the first time
+ * they are used and referenced by id afterwards. Each stat dump is appended
+ * between BEGIN_DUMP and END_DUMP records, so a file holding several dumps
+ * is a time series of the stats. Vector distributions are written as one
+ * DIST record per element, named <stat>_<subname or index> as in the text
+ * format, and formulas as VECTOR records.
+ *
+ * With the DELTA flag, a dump only has the records of the stats that
+ * changed since the previous dump, a stat keeping its last value
+ * otherwise. A vector or 2-D vector of which only a few elements changed
+ * is written as an UPDATE record of these elements (indices into the row
+ * major values) applying to its last VECTOR or VECTOR2D record.
+ */
+class Binary : public Output
+{
+  public:
+    enum Tag : uint8_t {
+        STRING = 1,
+        DESC,
+        SUBNAMES,
+        BEGIN_DUMP,
+        END_DUMP,
+        SCALAR,
+        VECTOR,
+        VECTOR2D,
+        DIST,
+        SPARSE_HIST,
+        UPDATE,
+        Y_SUBNAMES,
+    };
+
+    enum Flags : uint32_t {
+        DELTA = 1,
+    };
+
+    static const uint32_t version = 3;
+
+    Binary(const std::string &file, bool desc, bool formulas, bool delta);
+
+    ~Binary();
+
+    Binary() = delete;
+    Binary(const Binary &other) = delete;
+
+  public: // Output interface
+    void begin() override;
+    void end() override;
+    bool valid() const override;
+
+    void beginGroup(const char *name) override;
+    void endGroup() override;
+
+    void visit(const ScalarInfo &info) override;
+    void visit(const VectorInfo &info) override;
+    void visit(const DistInfo &info) override;
+    void visit(const VectorDistInfo &info) override;
+    void visit(const Vector2dInfo &info) override;
+    void visit(const FormulaInfo &info) override;
+    void visit(const SparseHistInfo &info) override;
+
+  protected:
+    bool noOutput(const Info &info);
+
+    std::string statName(const std::string &name) const;
+
+    /**
+     * Id of an interned string, writing its STRING record the first time
+     * it is seen.
+     *
+     * @param str String to intern.
+     * @param added Set to whether the string was new.
+     */
+    uint32_t intern(const std::string &str, bool *added = nullptr);
+
+    /**
+     * Helper function to write the SUBNAMES or Y_SUBNAMES record of a
+     * stat, unless all its subnames are empty.
+     */
+    void writeSubnames(Tag tag, uint32_t id,
+                       const std::vector<std::string> &subnames);
+
+    /**
+     * Helper function to write the record of a stat, interning its name
+     * and writing its description and subnames the first time it is
+     * seen. In delta mode, the record is skipped if its payload didn't
+     * change since the previous dump.
+     *
+     * @param tag Record type.
+     * @param info Stat info structure.
+     * @param name Full stat name.
+     * @param payload Record payload, after the name id.
+     * @param subnames Subnames of a vector stat.
+     * @param y_subnames Column subnames of a 2-D vector stat.
+     */
+    void writeRecord(Tag tag, const Info &info, const std::string &name,
+                     const std::string &payload,
+                     const std::vector<std::string> *subnames = nullptr,
+                     const std::vector<std::string> *y_subnames = nullptr);
+
+    /**
+     * Helper function to write the record of a vector stat, whose payload
+     * is a header followed by its values. In delta mode, only the changed
+     * values are written as an UPDATE record when that is smaller.
+     */
+    void writeVector(Tag tag, const Info &info, const std::string &name,
+                     std::string payload, const Counter *values, size_t n,
+                     const std::vector<std::string> *subnames,
+                     const std::vector<std::string> *y_subnames = nullptr);
+
+    void writeDist(const Info &info, const std::string &name,
+                   const DistData &data);
+
+    template <typename T>
+    static void
+    append(std::string &buf, T value)
+    {
+        buf.append(reinterpret_cast<const char *>(&value), sizeof(value));
+    }
+
+    template <typename T>
+    void
+    write(T value)
+    {
+        stream.write(reinterpret_cast<const char *>(&value), sizeof(value));
+    }
+
+  protected:
+    const bool enableDescriptions;
+    const bool enableFormula;
+    const bool enableDelta;
+
+    std::ofstream stream;
+    std::stack<std::string> path;
+    std::unordered_map<std::string, uint32_t> strings;
+
+    /** Last payload written for every stat name id, in delta mode. */
+    std::unordered_map<uint32_t, std::string> previous;
+
+    uint32_t dumpCount;
+};
+
+std::unique_ptr<Output> initBinary(
+    const std::string &filename, bool desc = false, bool formulas = true,
+    bool delta = false);
+
+} // namespace Stats
+
+#endif // __BASE_STATS_BINARY_HH__
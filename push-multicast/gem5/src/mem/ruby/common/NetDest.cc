@@ -103,16 +103,15 @@ NetDest::broadcast(MachineType machineType)
 
 //For Princeton Network
 std::vector<NodeID>
-NetDest::getAllDest()
+NetDest::getAllDest() const
 {
     std::vector<NodeID> dest;
-    dest.clear();
+    dest.reserve(count());
     for (int i = 0; i < m_bits.size(); i++) {
-        for (int j = 0; j < m_bits[i].getSize(); j++) {
-            if (m_bits[i].isElement(j)) {
-                int id = MachineType_base_number((MachineType)i) + j;
-                dest.push_back((NodeID)id);
-            }
+        for (NodeID j = m_bits[i].nextElement(0); j < m_bits[i].getSize();
+             j = m_bits[i].nextElement(j + 1)) {
+            int id = MachineType_base_number((MachineType)i) + j;
+            dest.push_back((NodeID)id);
         }
     }
     return dest;
@@ -139,11 +138,10 @@ NetDest::smallestElement() const
 {
     assert(count() > 0);
     for (int i = 0; i < m_bits.size(); i++) {
-        for (NodeID j = 0; j < m_bits[i].getSize(); j++) {
-            if (m_bits[i].isElement(j)) {
-                MachineID mach = {MachineType_from_base_level(i), j};
-                return mach;
-            }
+        NodeID j = m_bits[i].nextElement(0);
+        if (j < m_bits[i].getSize()) {
+            MachineID mach = {MachineType_from_base_level(i), j};
+            return mach;
         }
     }
     panic("No smallest element of an empty set.");
@@ -152,17 +150,31 @@ NetDest::smallestElement() const
 MachineID
 NetDest::smallestElement(MachineType machine) const
 {
-    int size = m_bits[MachineType_base_level(machine)].getSize();
-    for (NodeID j = 0; j < size; j++) {
-        if (m_bits[MachineType_base_level(machine)].isElement(j)) {
-            MachineID mach = {machine, j};
-            return mach;
-        }
+    const Set &set = m_bits[MachineType_base_level(machine)];
+    NodeID j = set.nextElement(0);
+    if (j < set.getSize()) {
+        MachineID mach = {machine, j};
+        return mach;
     }
 
     panic("No smallest element of given MachineType.");
 }
 
+MachineID
+NetDest::nextElement(MachineID index) const
+{
+    NodeID num = index.num;
+    for (int i = vecIndex(index); i < m_bits.size(); i++) {
+        NodeID j = m_bits[i].nextElement(num);
+        if (j < m_bits[i].getSize()) {
+            MachineID mach = {MachineType_from_base_level(i), j};
+            return mach;
+        }
+        num = 0;
+    }
+    return MachineID();
+}
+
 // Returns true iff all bits are set
 bool
 NetDest::isBroadcast() const
@@ -258,8 +270,7 @@ NetDest::isElement(MachineID element) const
 void
 NetDest::resize()
 {
-    m_bits.resize(MachineType_base_level(MachineType_NUM));
-    assert(m_bits.size() == MachineType_NUM);
+    assert(m_bits.size() == MachineType_base_level(MachineType_NUM));
 
     for (int i = 0; i < m_bits.size(); i++) {
         m_bits[i].setSize(MachineType_base_count((MachineType)i));
@@ -296,10 +307,7 @@ NetDest::getHash() const
 {
     uint64_t hval = 0;
     for (int i = 0; i < m_bits.size(); i++) {
-        if (!m_bits[i].isEmpty()) {
-            hval = m_bits[i].toUllong();
-            break;
-        }
+        hval = hval * 31 + m_bits[i].getHash();
     }
     return hval;
 }
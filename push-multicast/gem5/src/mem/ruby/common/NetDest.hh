@@ -29,6 +29,7 @@
 #ifndef __MEM_RUBY_COMMON_NETDEST_HH__
 #define __MEM_RUBY_COMMON_NETDEST_HH__
 
+#include <array>
 #include <iostream>
 #include <vector>
 
@@ -79,11 +80,18 @@ class NetDest
     bool isEmpty() const;
 
     // For Princeton Network
-    std::vector<NodeID> getAllDest();
+    std::vector<NodeID> getAllDest() const;
 
     MachineID smallestElement() const;
     MachineID smallestElement(MachineType machine) const;
 
+    // Returns the smallest element >= index, in machine type then number
+    // order, or an invalid MachineID if there is none. The elements are
+    // iterated without allocating with
+    //   for (MachineID m = dest.nextElement(MachineID(MachineType_FIRST, 0));
+    //        m.isValid(); m = dest.nextElement(MachineID(m.type, m.num + 1)))
+    MachineID nextElement(MachineID index) const;
+
     void resize();
     int getSize() const { return m_bits.size(); }
 
@@ -107,7 +115,9 @@ class NetDest
 
     NodeID bitIndex(NodeID index) const { return index; }
 
-    std::vector<Set> m_bits;  // a vector of bit vectors - i.e. Sets
+    // a bit vector - i.e. Set - per machine type, stored inline so that
+    // copying a NetDest (e.g. forking a multicast route) doesn't allocate
+    std::array<Set, MachineType_NUM> m_bits;
 };
 
 inline bool
@@ -28,27 +28,40 @@
 
 // modified by Dan Gibson on 05/20/05 to accomidate FASTER
 // >32 set lengths, using an array of ints w/ 32 bits/int
-
 #ifndef __MEM_RUBY_COMMON_SET_HH__
 #define __MEM_RUBY_COMMON_SET_HH__
 
-#include <bitset>
 #include <cassert>
+#include <cstdint>
 #include <iostream>
 
+#include "base/bitfield.hh"
 #include "base/logging.hh"
 #include "mem/ruby/common/TypeDefines.hh"
 
 class Set
 {
   private:
+    // The bits are packed in an inline array of 64-bit words, so that
+    // copying a set never allocates and the set operations are a few
+    // word-wise operations for the usual node counts.
+    static const int bitsPerWord = 64;
+    static const int numWords =
+        (NUMBER_BITS_PER_SET + bitsPerWord - 1) / bitsPerWord;
+
     // Number of bits in use in this set.
     // can be defined in build_opts file (default=64).
     int m_nSize;
-    std::bitset<NUMBER_BITS_PER_SET> bits;
+    uint64_t words[numWords];
+
+    static uint64_t
+    mask(NodeID index)
+    {
+        return 1ULL << (index % bitsPerWord);
+    }
 
   public:
-    Set() : m_nSize(0) {}
+    Set() : m_nSize(0) { clear(); }
 
     Set(int size) : m_nSize(size)
     {
@@ -56,22 +69,19 @@ class Set
             fatal("Number of bits(%d) < size specified(%d). "
                   "Increase the number of bits and recompile.\n",
                   NUMBER_BITS_PER_SET, size);
+        clear();
     }
 
-    Set(const Set& obj) : m_nSize(obj.m_nSize), bits(obj.bits) {}
+    Set(const Set& obj) = default;
     ~Set() {}
 
-    Set& operator=(const Set& obj)
-    {
-        m_nSize = obj.m_nSize;
-        bits = obj.bits;
-        return *this;
-    }
+    Set& operator=(const Set& obj) = default;
 
     void
     add(NodeID index)
     {
-        bits.set(index);
+        assert(index < NUMBER_BITS_PER_SET);
+        words[index / bitsPerWord] |= mask(index);
     }
 
     /*
@@ -82,7 +92,8 @@ class Set
     addSet(const Set& obj)
     {
         assert(m_nSize == obj.m_nSize);
-        bits |= obj.bits;
+        for (int i = 0; i < numWords; i++)
+            words[i] |= obj.words[i];
     }
 
     /*
@@ -91,7 +102,8 @@ class Set
     void
     remove(NodeID index)
     {
-        bits.reset(index);
+        assert(index < NUMBER_BITS_PER_SET);
+        words[index / bitsPerWord] &= ~mask(index);
     }
 
     /*
@@ -101,31 +113,61 @@ class Set
     removeSet(const Set& obj)
     {
         assert(m_nSize == obj.m_nSize);
-        bits &= (~obj.bits);
+        for (int i = 0; i < numWords; i++)
+            words[i] &= ~obj.words[i];
     }
 
-    void clear() { bits.reset(); }
+    void
+    clear()
+    {
+        for (int i = 0; i < numWords; i++)
+            words[i] = 0;
+    }
 
     /*
      * this function sets all bits in the set
      */
     void broadcast()
     {
-        bits.set();
-        for (int j = m_nSize; j < NUMBER_BITS_PER_SET; ++j) {
-            bits.reset(j);
+        for (int i = 0; i < numWords; i++) {
+            int used = m_nSize - i * bitsPerWord;
+            if (used >= bitsPerWord)
+                words[i] = ~0ULL;
+            else if (used > 0)
+                words[i] = (1ULL << used) - 1;
+            else
+                words[i] = 0;
         }
     }
 
     /*
      * This function returns the population count of 1's in the set
      */
-    int count() const { return bits.count(); }
+    int
+    count() const
+    {
+        int count = 0;
+        for (int i = 0; i < numWords; i++)
+            count += popCount(words[i]);
+        return count;
+    }
+
+    /*
+     * This function returns the lowest 64 bits of the set.
+     */
+    uint64_t toUllong() const { return words[0]; }
 
     /*
-     * This function returns the unsigned long integer of the bitset data.
+     * This function returns a hash of all the bits of the set.
      */
-    uint64_t toUllong() const { return bits.to_ullong(); }
+    uint64_t
+    getHash() const
+    {
+        uint64_t hval = 0;
+        for (int i = 0; i < numWords; i++)
+            hval ^= words[i] * (2 * i + 1);
+        return hval;
+    }
 
     /*
      * This function checks for set equality
@@ -134,7 +176,11 @@ class Set
     isEqual(const Set& obj) const
     {
         assert(m_nSize == obj.m_nSize);
-        return bits == obj.bits;
+        for (int i = 0; i < numWords; i++) {
+            if (words[i] != obj.words[i])
+                return false;
+        }
+        return true;
     }
 
     // return the logical OR of this set and orSet
@@ -142,8 +188,8 @@ class Set
     OR(const Set& obj) const
     {
         assert(m_nSize == obj.m_nSize);
-        Set r(m_nSize);
-        r.bits = bits | obj.bits;
+        Set r(*this);
+        r.addSet(obj);
         return r;
     };
 
@@ -152,8 +198,9 @@ class Set
     AND(const Set& obj) const
     {
         assert(m_nSize == obj.m_nSize);
-        Set r(m_nSize);
-        r.bits = bits & obj.bits;
+        Set r(*this);
+        for (int i = 0; i < numWords; i++)
+            r.words[i] &= obj.words[i];
         return r;
     }
 
@@ -161,8 +208,11 @@ class Set
     bool
     intersectionIsEmpty(const Set& obj) const
     {
-        std::bitset<NUMBER_BITS_PER_SET> r = bits & obj.bits;
-        return r.none();
+        for (int i = 0; i < numWords; i++) {
+            if (words[i] & obj.words[i])
+                return false;
+        }
+        return true;
     }
 
     /*
@@ -173,13 +223,21 @@ class Set
     isSuperset(const Set& test) const
     {
         assert(m_nSize == test.m_nSize);
-        std::bitset<NUMBER_BITS_PER_SET> r = bits | test.bits;
-        return (r == bits);
+        for (int i = 0; i < numWords; i++) {
+            if (test.words[i] & ~words[i])
+                return false;
+        }
+        return true;
     }
 
     bool isSubset(const Set& test) const { return test.isSuperset(*this); }
 
-    bool isElement(NodeID element) const { return bits.test(element); }
+    bool
+    isElement(NodeID element) const
+    {
+        assert(element < NUMBER_BITS_PER_SET);
+        return words[element / bitsPerWord] & mask(element);
+    }
 
     /*
      * this function returns true iff all bits in use are set
@@ -187,22 +245,50 @@ class Set
     bool
     isBroadcast() const
     {
-        return (bits.count() == m_nSize);
+        return (count() == m_nSize);
     }
 
-    bool isEmpty() const { return bits.none(); }
+    bool
+    isEmpty() const
+    {
+        for (int i = 0; i < numWords; i++) {
+            if (words[i])
+                return false;
+        }
+        return true;
+    }
 
-    NodeID smallestElement() const
+    /*
+     * This function returns the smallest element >= index, or
+     * NUMBER_BITS_PER_SET if there is none. The elements of a set are
+     * iterated with
+     *   for (NodeID i = set.nextElement(0); i < set.getSize();
+     *        i = set.nextElement(i + 1))
+     */
+    NodeID
+    nextElement(NodeID index) const
     {
-        for (int i = 0; i < m_nSize; ++i) {
-            if (bits.test(i)) {
-                return i;
-            }
+        if (index >= NUMBER_BITS_PER_SET)
+            return NUMBER_BITS_PER_SET;
+        int i = index / bitsPerWord;
+        uint64_t word = words[i] & (~0ULL << (index % bitsPerWord));
+        while (!word) {
+            if (++i == numWords)
+                return NUMBER_BITS_PER_SET;
+            word = words[i];
         }
+        return i * bitsPerWord + ctz64(word);
+    }
+
+    NodeID smallestElement() const
+    {
+        NodeID index = nextElement(0);
+        if (index < m_nSize)
+            return index;
         panic("No smallest element of an empty set.");
     }
 
-    bool elementAt(int index) const { return bits[index]; }
+    bool elementAt(int index) const { return isElement(index); }
 
     int getSize() const { return m_nSize; }
 
@@ -214,12 +300,15 @@ class Set
                   "Increase the number of bits and recompile.\n",
                   NUMBER_BITS_PER_SET, size);
         m_nSize = size;
-        bits.reset();
+        clear();
     }
 
     void print(std::ostream& out) const
     {
-        out << "[Set (" << m_nSize << "): " << bits << "]";
+        out << "[Set (" << m_nSize << "): ";
+        for (int i = NUMBER_BITS_PER_SET - 1; i >= 0; i--)
+            out << isElement(i);
+        out << "]";
     }
 };
 
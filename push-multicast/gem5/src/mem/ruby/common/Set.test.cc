@@ -0,0 +1,193 @@
+/*
+ * Copyright (c) 2021 The Push Multicast Authors
+ * All rights reserved.
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are
+ * met: redistributions of source code must retain the above copyright
+ * notice, this list of conditions and the following disclaimer;
+ * redistributions in binary form must reproduce the above copyright
+ * notice, this list of conditions and the following disclaimer in the
+ * documentation and/or other materials provided with the distribution;
+ * neither the name of the copyright holders nor the names of its
+ * contributors may be used to endorse or promote products derived from
+ * this software without specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ * "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ * LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+ * A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+ * OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+ * SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+ * LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+ * DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+ * THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+ * (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+ * OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+ */
+
+/*
+ * The sets are tested with the NUMBER_BITS_PER_SET of the default build
+ * (128) and of the 1024 core systems (see Set1024.test.cc), whatever the
+ * build is configured with, so that the operations are checked across the
+ * 64-bit word boundaries of both layouts.
+ */
+#ifndef SET_TEST_BITS
+#define SET_TEST_BITS 128
+#endif
+#undef NUMBER_BITS_PER_SET
+#define NUMBER_BITS_PER_SET SET_TEST_BITS
+
+#include <gtest/gtest.h>
+
+#include <vector>
+
+#include "mem/ruby/common/Set.hh"
+
+namespace {
+
+// Set sizes around the word boundaries, up to the full set
+std::vector<int>
+testSizes()
+{
+    std::vector<int> sizes;
+    for (int size : {1, 63, 64, 65, 127, 128, 129, 511, 512, 513, 1023,
+                     1024}) {
+        if (size <= NUMBER_BITS_PER_SET)
+            sizes.push_back(size);
+    }
+    return sizes;
+}
+
+// Elements around the word boundaries of a set of the given size
+std::vector<NodeID>
+boundaryElements(int size)
+{
+    std::vector<NodeID> elements;
+    for (int word = 0; word * 64 < size; word++) {
+        for (int offset : {-1, 0, 1, 63}) {
+            int element = word * 64 + offset;
+            if (element >= 0 && element < size &&
+                (elements.empty() || elements.back() < element)) {
+                elements.push_back(element);
+            }
+        }
+    }
+    return elements;
+}
+
+} // anonymous namespace
+
+TEST(SetTest, EmptySet)
+{
+    for (int size : testSizes()) {
+        Set set(size);
+        EXPECT_TRUE(set.isEmpty());
+        EXPECT_EQ(0, set.count());
+        EXPECT_EQ((NodeID)NUMBER_BITS_PER_SET, set.nextElement(0));
+    }
+}
+
+TEST(SetTest, Broadcast)
+{
+    for (int size : testSizes()) {
+        Set set(size);
+        set.broadcast();
+        EXPECT_EQ(size, set.count());
+        EXPECT_TRUE(set.isBroadcast());
+        EXPECT_TRUE(set.isElement(size - 1));
+        if (size < NUMBER_BITS_PER_SET) {
+            EXPECT_FALSE(set.isElement(size));
+        }
+
+        set.remove(size - 1);
+        EXPECT_EQ(size - 1, set.count());
+        EXPECT_FALSE(set.isBroadcast());
+    }
+}
+
+TEST(SetTest, Count)
+{
+    for (int size : testSizes()) {
+        Set set(size);
+        std::vector<NodeID> elements = boundaryElements(size);
+        for (NodeID element : elements)
+            set.add(element);
+        EXPECT_EQ((int)elements.size(), set.count());
+
+        // adding an element twice doesn't change the count
+        set.add(elements.back());
+        EXPECT_EQ((int)elements.size(), set.count());
+    }
+}
+
+TEST(SetTest, NextElement)
+{
+    for (int size : testSizes()) {
+        Set set(size);
+        std::vector<NodeID> elements = boundaryElements(size);
+        for (NodeID element : elements)
+            set.add(element);
+
+        std::vector<NodeID> iterated;
+        for (NodeID i = set.nextElement(0); i < set.getSize();
+             i = set.nextElement(i + 1)) {
+            iterated.push_back(i);
+        }
+        EXPECT_EQ(elements, iterated);
+        EXPECT_EQ(elements.front(), set.smallestElement());
+
+        // the search starts within a word and skips the empty words
+        for (NodeID element : elements)
+            EXPECT_EQ(element, set.nextElement(element));
+        EXPECT_EQ((NodeID)NUMBER_BITS_PER_SET,
+                  set.nextElement(elements.back() + 1));
+        EXPECT_EQ((NodeID)NUMBER_BITS_PER_SET,
+                  set.nextElement(NUMBER_BITS_PER_SET));
+    }
+}
+
+TEST(SetTest, IsSuperset)
+{
+    for (int size : testSizes()) {
+        Set set(size);
+        Set subset(size);
+        for (NodeID element : boundaryElements(size)) {
+            set.add(element);
+            subset.add(element);
+            EXPECT_TRUE(set.isSuperset(subset));
+            EXPECT_TRUE(subset.isSubset(set));
+        }
+
+        // an element missing in any word breaks the superset relation
+        for (NodeID element : boundaryElements(size)) {
+            set.remove(element);
+            EXPECT_FALSE(set.isSuperset(subset));
+            EXPECT_TRUE(subset.isSuperset(set));
+            set.add(element);
+        }
+
+        Set empty(size);
+        EXPECT_TRUE(set.isSuperset(empty));
+        EXPECT_TRUE(empty.isSuperset(empty));
+    }
+}
+
+TEST(SetTest, AndOr)
+{
+    for (int size : testSizes()) {
+        Set low(size);
+        Set high(size);
+        low.add(0);
+        high.add(size - 1);
+
+        Set both = low.OR(high);
+        EXPECT_EQ(size == 1 ? 1 : 2, both.count());
+        EXPECT_TRUE(both.AND(low).isEqual(low));
+        EXPECT_TRUE(both.AND(high).isEqual(high));
+        if (size > 1) {
+            EXPECT_TRUE(low.AND(high).isEmpty());
+            EXPECT_TRUE(low.intersectionIsEmpty(high));
+        }
+    }
+}
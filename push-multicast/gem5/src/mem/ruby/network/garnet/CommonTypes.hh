@@ -33,7 +33,6 @@
 
 #include <map>
 #include <set>
-#include <vector>
 
 #include "mem/ruby/common/NetDest.hh"
 
@@ -46,6 +45,8 @@ enum VNET_type {CTRL_VNET_, DATA_VNET_, NULL_VNET_, NUM_VNET_TYPE_};
 enum flit_stage {I_, VA_, SA_, ST_, LT_, NUM_FLIT_STAGE_};
 enum link_type { EXT_IN_, EXT_OUT_, INT_, NUM_LINK_TYPES_ };
 enum RoutingAlgorithm { TABLE_ = 0, XY_ = 1, CUSTOM_ = 2, YX_ = 3, XY_YX_ = 4,
+                        EXPRESS_XY_ = 5, FLATTENED_BUTTERFLY_ = 6,
+                        CLUSTERED_ = 7, QUADRANT_XY_YX_ = 8,
                         NUM_ROUTING_ALGORITHM_};
 enum CoherenceConstraint { UNORDERED_ = 0, ORDERED_VNET_ = 1,
     ORDERED_PREPUSH_INV_ = 2, NUM_COHERENCE_CONSTRAINT_ };
@@ -54,10 +55,11 @@ struct RouteInfo
 {
     RouteInfo()
         : vnet(0), src_ni(0), src_router(0), dest_ni(0), dest_router(0),
-          hops_traversed(0)
+          hops_traversed(0), multicast(false)
     {}
 
-    // destination format for table-based routing
+    // destination format for table-based routing, and all the
+    // destinations of a multicast packet
     int vnet;
     NetDest net_dest;
 
@@ -68,14 +70,18 @@ struct RouteInfo
     int dest_router;
     int hops_traversed;
 
+    // injected as a multicast packet (for the multicast hops stats)
+    bool multicast;
+
     MachineID srcMachID;
 
-    // dest format for multicast packets
-    std::vector<SwitchID> destRouters;
-    std::vector<NodeID> destNIs;
-    std::vector<NetDest> netDests;
+    // demand requestors among the destinations of a multicast prepush
+    NetDest demand_dests;
+
+    // multicast fork at the current router: the branch of every outport,
+    // whose net_dest is the part of net_dest routed through it, and the
+    // outports leading to demand requestors
     std::map<int, RouteInfo> outportRouteMap;
-    std::set<NodeID> demandDestNIs;
     std::set<int> demandOutports;
 };
 
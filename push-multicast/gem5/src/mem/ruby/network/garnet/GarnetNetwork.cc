@@ -59,6 +59,9 @@ GarnetNetwork::GarnetNetwork(const Params &p)
     : Network(p)
 {
     m_num_rows = p.num_rows;
+    m_express_interval = p.express_interval;
+    m_cluster_rows = p.cluster_rows;
+    m_cluster_cols = p.cluster_cols;
     m_ni_flit_size = p.ni_flit_size;
     m_max_vcs_per_vnet = 0;
     m_buffers_per_data_vc = p.buffers_per_data_vc;
@@ -143,6 +146,10 @@ GarnetNetwork::GarnetNetwork(const Params &p)
     numCoherenceMsgType = CoherenceRequestType_NUM +
         CoherenceResponseType_NUM;
 
+    // The collated link and router stats are also sampled into stat time
+    // series between dumps
+    Stats::registerSampleCallback([this]() { collateStats(); });
+
     // Print Garnet version
     inform("Garnet version %s\n", garnetVersion);
 }
@@ -551,6 +558,20 @@ GarnetNetwork::regStats()
     m_avg_hops.name(name() + ".average_hops");
     m_avg_hops = m_total_hops / sum(m_flits_received);
 
+    // Depth of the multicast trees, hops from the source to each
+    // destination of a multicast packet
+    m_multicast_hops
+        .init(16)
+        .name(name() + ".multicast_hops")
+        .flags(Stats::nozero | Stats::pdf);
+
+    // Branches of the multicast trees, output ports a multicast packet
+    // forks into at each router (its sum is the number of tree links)
+    m_multicast_branches
+        .init(8)
+        .name(name() + ".multicast_branches")
+        .flags(Stats::nozero | Stats::pdf);
+
     // Links
     m_total_ext_in_link_utilization
         .name(name() + ".ext_in_link_utilization");
@@ -732,6 +753,34 @@ GarnetNetwork::collateStats()
     RubySystem *rs = params().ruby_system;
     double time_delta = double(curCycle() - rs->getStartCycle());
 
+    // The totals are recomputed from the link, router and NI counters,
+    // so collating more than once between two resets doesn't count them
+    // twice
+    m_total_ext_in_link_utilization.reset();
+    m_total_ext_out_link_utilization.reset();
+    m_total_int_link_utilization.reset();
+    m_average_link_utilization.reset();
+    m_average_vc_load.reset();
+    extInLinkUtilization.reset();
+    extOutLinkUtilization.reset();
+    intLinkUtilization.reset();
+    extInLinkCtrlUtilization.reset();
+    extInLinkDataUtilization.reset();
+    extOutLinkCtrlUtilization.reset();
+    extOutLinkDataUtilization.reset();
+    intLinkCtrlUtilization.reset();
+    intLinkDataUtilization.reset();
+    extInLinkPrepushUtilization.reset();
+    extOutLinkPrepushUtilization.reset();
+    intLinkPrepushUtilization.reset();
+    routerPrepushFilterQueries.reset();
+    routerPrepushFilterRegistries.reset();
+    routerPrepushFilterActivity.reset();
+    coreNIPrepushFilterActivity.reset();
+    llcNIPrepushFilterActivity.reset();
+    corePrepushFilterActivity.reset();
+    llcPrepushFilterActivity.reset();
+
     for (int i = 0; i < m_networklinks.size(); i++) {
         link_type type = m_networklinks[i]->getType();
 
@@ -63,6 +63,9 @@ class GarnetNetwork : public Network
     // for 2D topology
     int getNumRows() const { return m_num_rows; }
     int getNumCols() { return m_num_cols; }
+    int getExpressInterval() const { return m_express_interval; }
+    int getClusterRows() const { return m_cluster_rows; }
+    int getClusterCols() const { return m_cluster_cols; }
 
     // for network
     uint32_t getNiFlitSize() const { return m_ni_flit_size; }
@@ -164,10 +167,25 @@ class GarnetNetwork : public Network
         m_total_hops += hops;
     }
 
+    void
+    sample_multicast_hops(int hops)
+    {
+        m_multicast_hops.sample(hops);
+    }
+
+    void
+    sample_multicast_branches(int branches)
+    {
+        m_multicast_branches.sample(branches);
+    }
+
   protected:
     // Configuration
     int m_num_rows;
     int m_num_cols;
+    int m_express_interval;
+    int m_cluster_rows;
+    int m_cluster_cols;
     uint32_t m_ni_flit_size;
     uint32_t m_max_vcs_per_vnet;
     uint32_t m_buffers_per_ctrl_vc;
@@ -236,6 +254,8 @@ class GarnetNetwork : public Network
 
     Stats::Scalar  m_total_hops;
     Stats::Formula m_avg_hops;
+    Stats::Histogram m_multicast_hops;
+    Stats::Histogram m_multicast_branches;
 
   private:
     GarnetNetwork(const GarnetNetwork& obj);
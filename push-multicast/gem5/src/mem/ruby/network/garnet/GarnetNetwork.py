@@ -43,7 +43,15 @@ class GarnetNetwork(RubyNetwork):
     buffers_per_data_vc = Param.UInt32(4, "buffers per data virtual channel");
     buffers_per_ctrl_vc = Param.UInt32(1, "buffers per ctrl virtual channel");
     routing_algorithm = Param.Int(0,
-            "0: Weight-based Table, 1: XY, 2: Custom, 3: YX, 4: XY-YX");
+            "0: Weight-based Table, 1: XY, 2: Custom, 3: YX, 4: XY-YX, "
+            "5: Express XY, 6: Flattened butterfly, 7: Clustered, "
+            "8: Quadrant XY-YX");
+    express_interval = Param.Int(0, "hops covered by an express link "
+            "(express XY routing)");
+    cluster_rows = Param.Int(0, "router rows of a cluster (clustered "
+            "routing)");
+    cluster_cols = Param.Int(0, "router columns of a cluster (clustered "
+            "routing)");
     enable_fault_model = Param.Bool(False, "enable network fault model");
     fault_model = Param.FaultModel(NULL, "network fault model");
     garnet_deadlock_threshold = Param.UInt32(50000,
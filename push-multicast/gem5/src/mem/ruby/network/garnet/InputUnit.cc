@@ -119,22 +119,27 @@ InputUnit::wakeup()
                 vector<int> outports = m_router->multicastRouteCompute(
                         t_flit->getRoute(), m_id, m_direction, vnet);
 
-                std::map<int, RouteInfo> outport_route_map =
+                const std::map<int, RouteInfo> &outport_route_map =
                     t_flit->get_route().outportRouteMap;
 
-                std::ostringstream oss;
-                oss << "{";
-                for (auto outport: outports)
-                    oss << outport << " ("
-                        << m_router->getOutportDirection(outport) << "): {"
-                        << outport_route_map[outport].destRouters << " } ";
-                oss << "}";
-
-                DPRINTF(GarnetMulticast, "Router[%d]: InputUnit %d (%s): "
-                        "computed routes for multicast packet: Flit:%s, "
-                        "outports: %s\n",
-                        m_router->get_id(), m_id, m_direction,
-                        *t_flit, oss.str());
+                if (DTRACE(GarnetMulticast)) {
+                    std::ostringstream oss;
+                    oss << "{";
+                    for (auto outport: outports)
+                        oss << outport << " ("
+                            << m_router->getOutportDirection(outport)
+                            << "): {"
+                            << outport_route_map.at(outport).net_dest
+                                .getAllDest()
+                            << " } ";
+                    oss << "}";
+
+                    DPRINTF(GarnetMulticast, "Router[%d]: InputUnit %d (%s)"
+                            ": computed routes for multicast packet: Flit:%s"
+                            ", outports: %s\n",
+                            m_router->get_id(), m_id, m_direction,
+                            *t_flit, oss.str());
+                }
 
                 // Update output ports in VC
                 // All flits in this packet will be replicated and sent to the
@@ -152,7 +157,7 @@ InputUnit::wakeup()
                         auto prepush_filter =
                             m_router->getPrepushFilter(outport);
                         prepush_filter->registerPrepush(t_flit->getAddr(),
-                                outport_route_map[outport].net_dest,
+                                outport_route_map.at(outport).net_dest,
                                 m_id, vc);
 
                         DPRINTF(PrepushFilter, "Router[%d]: InputUnit %d (%s)"
@@ -162,7 +167,7 @@ InputUnit::wakeup()
                                 outport,
                                 m_router->getOutportDirection(outport),
                                 t_flit->getAddr(),
-                                outport_route_map[outport].net_dest);
+                                outport_route_map.at(outport).net_dest);
                     }
                 }
             } else {
@@ -174,14 +179,14 @@ InputUnit::wakeup()
                         t_flit->isPrepush()) {
                     auto prepush_filter = m_router->getPrepushFilter(outport);
                     prepush_filter->registerPrepush(t_flit->getAddr(),
-                            t_flit->getRoute().net_dest, m_id, vc);
+                            t_flit->get_route().net_dest, m_id, vc);
 
                     DPRINTF(PrepushFilter, "Router[%d]: InputUnit %d (%s): "
                             "register prepush in PrepushFilter %d (%s) for "
                             "address %#x, destinations %s\n",
                             m_router->get_id(), m_id, m_direction,
                             outport, m_router->getOutportDirection(outport),
-                            t_flit->getAddr(), t_flit->getRoute().net_dest);
+                            t_flit->getAddr(), t_flit->get_route().net_dest);
                 }
 
                 // Update output port in VC
@@ -74,10 +74,10 @@ class InputUnit : public Consumer
     }
 
     inline void
-    grantMulticastOutports(int vc, std::vector<int> outports,
-            std::set<int> demand_outports,
-            std::map<int, RouteInfo> outport_route_map,
-            std::map<NodeID, MsgPtr> msg_ptrs_map)
+    grantMulticastOutports(int vc, const std::vector<int> &outports,
+            const std::set<int> &demand_outports,
+            const std::map<int, RouteInfo> &outport_route_map,
+            const std::map<NodeID, MsgPtr> &msg_ptrs_map)
     {
         virtualChannels[vc].setMulticastOutports(
                 outports, demand_outports, outport_route_map, msg_ptrs_map);
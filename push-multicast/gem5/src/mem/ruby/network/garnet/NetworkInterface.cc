@@ -185,6 +185,11 @@ NetworkInterface::incrementStats(flit *t_flit)
 
     // Hops
     m_net_ptr->increment_total_hops(t_flit->get_route().hops_traversed);
+    if (t_flit->get_route().multicast &&
+        (t_flit->get_type() == HEAD_ || t_flit->get_type() == HEAD_TAIL_)) {
+        m_net_ptr->sample_multicast_hops(
+            t_flit->get_route().hops_traversed);
+    }
 }
 
 /*
@@ -595,7 +600,6 @@ NetworkInterface::flitisizeMessage(MsgPtr msg_ptr, int vnet)
         }
 
         map<NodeID, MsgPtr> msg_ptrs_map;
-        vector<NetDest> net_dests;
         for (int ctr = 0; ctr < dest_nodes.size(); ctr++) {
             MsgPtr new_msg_ptr = msg_ptr->clone();
             NodeID destID = dest_nodes[ctr];
@@ -621,7 +625,6 @@ NetworkInterface::flitisizeMessage(MsgPtr msg_ptr, int vnet)
             net_msg_dest.removeNetDest(personal_dest);
 
             msg_ptrs_map[destID] = new_msg_ptr;
-            net_dests.push_back(personal_dest);
         }
 
         // indicate if prepush or not for in-network filtering
@@ -653,17 +656,11 @@ NetworkInterface::flitisizeMessage(MsgPtr msg_ptr, int vnet)
         route.dest_ni = -1; // multicast has multiple destinations
         if (prepush) {
             route.dest_ni = net_msg_ptr->getPrepushRequestor().getNodeID();
-            std::vector<NodeID> demand_dest_nis =
-                net_msg_ptr->getDemandDests().getAllDest();
-            for (auto dest_ni: demand_dest_nis) {
-                route.demandDestNIs.insert(dest_ni);
-            }
+            route.demand_dests = net_msg_ptr->getDemandDests();
         }
         route.srcMachID = machineID;
         route.dest_router = -1; // multicast has multiple destination routers
-        route.destRouters = m_net_ptr->getRouterIDs(dest_nodes, vnet);
-        route.destNIs = dest_nodes;
-        route.netDests = net_dests;
+        route.multicast = true;
 
         // initialize hops_traversed to -1
         // so that the first router increments it to 0
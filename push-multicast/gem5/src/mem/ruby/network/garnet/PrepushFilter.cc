@@ -29,16 +29,16 @@ PrepushFilter::clearPrepushes(Tick cur_time)
             auto pend_it = it->second.netDestCount.find(net_dest);
             assert(pend_it != it->second.netDestCount.end());
 
-            it->second.netDestCount[net_dest]--;
+            pend_it->second--;
 
             DPRINTF(PrepushFilter, "Router[%d]: PrepushFilter %d (%s): "
                     "clears prepush addr %#x, dest %s, remaining count %d\n",
                     router->get_id(), id, router->getInportDirection(id),
-                    addr, net_dest, it->second.netDestCount[net_dest]);
+                    addr, net_dest, pend_it->second);
 
-            if (it->second.netDestCount[net_dest] == 0) {
+            if (pend_it->second == 0) {
                 // account for the repetition
-                for (auto iter: it->second.netDestCount) {
+                for (const auto &iter: it->second.netDestCount) {
                     if (iter.first == pendingClearPrepushBuffer[0].netDest) {
                         assert(iter.second == 0);
                         continue;
@@ -97,25 +97,20 @@ PrepushFilter::queryToDropRequest(Addr addr, MachineID mach_id)
 }
 
 void
-PrepushFilter::registerPrepush(Addr addr, NetDest net_dest, int inport,
-        int invc)
+PrepushFilter::registerPrepush(Addr addr, const NetDest &net_dest,
+        int inport, int invc)
 {
-    if (filter.find(addr) == filter.end()) {
-        PrepushFilterEntry entry;
+    auto it = filter.find(addr);
+    if (it == filter.end()) {
+        PrepushFilterEntry &entry = filter[addr];
         entry.netDest = net_dest;
         entry.netDestCount[net_dest] = 1;
         entry.inport = inport;
         entry.invc = invc;
-
-        filter[addr] = entry;
     } else {
-        filter[addr].netDest.addNetDest(net_dest);
-
-        if (filter[addr].netDestCount.find(net_dest) !=
-                filter[addr].netDestCount.end())
-            filter[addr].netDestCount[net_dest]++;
-        else
-            filter[addr].netDestCount[net_dest] = 1;
+        it->second.netDest.addNetDest(net_dest);
+        // a new destination set starts at 0
+        it->second.netDestCount[net_dest]++;
     }
 
     registries++;
@@ -20,7 +20,7 @@ class PrepushFilter
     void clearPrepushes(Tick cur_time);
 
     inline void
-    clearPrepushAtTime(Addr addr, Tick time, NetDest net_dest)
+    clearPrepushAtTime(Addr addr, Tick time, const NetDest &net_dest)
     {
         pendingClearPrepushBuffer.push_back(
                 PendingClearPrepush(addr, time, net_dest));
@@ -29,7 +29,8 @@ class PrepushFilter
     std::pair<int, int> getInportAndInvc(Addr addr);
 
     bool queryToDropRequest(Addr addr, MachineID mach_id);
-    void registerPrepush(Addr addr, NetDest net_dest, int inport, int invc);
+    void registerPrepush(Addr addr, const NetDest &net_dest, int inport,
+                         int invc);
 
     inline bool
     addrHasRegistry(Addr addr) {
@@ -57,7 +58,7 @@ class PrepushFilter
     class PendingClearPrepush
     {
       public:
-        PendingClearPrepush(Addr address, Tick time, NetDest net_dest)
+        PendingClearPrepush(Addr address, Tick time, const NetDest &net_dest)
           : addr(address), clearTime(time), netDest(net_dest) {}
         virtual ~PendingClearPrepush() {};
 
@@ -157,8 +157,8 @@ Router::getInportDirection(int inport)
 }
 
 int
-Router::route_compute(RouteInfo route, int inport, PortDirection inport_dirn,
-        int vnet)
+Router::route_compute(const RouteInfo &route, int inport,
+        PortDirection inport_dirn, int vnet)
 {
     return routingUnit.outportCompute(route, inport, inport_dirn, vnet);
 }
@@ -249,6 +249,11 @@ Router::regStats()
 void
 Router::collateStats()
 {
+    m_buffer_reads.reset();
+    m_buffer_writes.reset();
+    prepushFilterQueries.reset();
+    prepushFilterRegistries.reset();
+
     for (int j = 0; j < m_virtual_networks; j++) {
         for (int i = 0; i < m_input_unit.size(); i++) {
             m_buffer_reads += m_input_unit[i]->get_buf_read_activity(j);
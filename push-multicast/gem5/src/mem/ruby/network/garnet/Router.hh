@@ -120,8 +120,8 @@ class Router : public BasicRouter, public Consumer
     PortDirection getOutportDirection(int outport);
     PortDirection getInportDirection(int inport);
 
-    int route_compute(RouteInfo route, int inport, PortDirection direction,
-            int vnet);
+    int route_compute(const RouteInfo &route, int inport,
+            PortDirection direction, int vnet);
     void grant_switch(int inport, flit *t_flit);
     void schedule_wakeup(Cycles time);
 
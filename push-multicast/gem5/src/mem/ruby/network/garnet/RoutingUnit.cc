@@ -30,6 +30,8 @@
 
 #include "mem/ruby/network/garnet/RoutingUnit.hh"
 
+#include <utility>
+
 #include "base/cast.hh"
 #include "debug/RubyNetwork.hh"
 #include "mem/ruby/network/garnet/InputUnit.hh"
@@ -84,7 +86,7 @@ RoutingUnit::supportsVnet(int vnet, std::vector<int> sVnets)
  * Correct weight assignments are critical to provide deadlock avoidance.
  */
 int
-RoutingUnit::lookupRoutingTable(int vnet, NetDest msg_destination)
+RoutingUnit::lookupRoutingTable(int vnet, const NetDest &msg_destination)
 {
     // First find all possible output link candidates
     // For ordered vnet, just choose the first
@@ -156,7 +158,7 @@ RoutingUnit::addOutDirection(PortDirection outport_dirn, int outport_idx)
 // table is provided here.
 
 int
-RoutingUnit::outportCompute(RouteInfo route, int inport,
+RoutingUnit::outportCompute(const RouteInfo &route, int inport,
                             PortDirection inport_dirn,
                             int vnet)
 {
@@ -186,6 +188,15 @@ RoutingUnit::outportCompute(RouteInfo route, int inport,
             outportComputeCustom(route, inport, inport_dirn); break;
         case XY_YX_:  outport =
             outportComputeXYYX(route, inport, inport_dirn, vnet); break;
+        case QUADRANT_XY_YX_: outport =
+            outportComputeQuadrantXYYX(route, inport, inport_dirn); break;
+        case EXPRESS_XY_: outport =
+            outportComputeExpressXY(route, inport, inport_dirn); break;
+        case FLATTENED_BUTTERFLY_: outport =
+            outportComputeFlattenedButterfly(route, inport, inport_dirn);
+            break;
+        case CLUSTERED_: outport =
+            outportComputeClustered(route, inport, inport_dirn); break;
         default: outport =
             lookupRoutingTable(route.vnet, route.net_dest); break;
     }
@@ -198,7 +209,7 @@ RoutingUnit::outportCompute(RouteInfo route, int inport,
 // Only for reference purpose in a Mesh
 // By default Garnet uses the routing table
 int
-RoutingUnit::outportComputeXY(RouteInfo route,
+RoutingUnit::outportComputeXY(const RouteInfo &route,
                               int inport,
                               PortDirection inport_dirn)
 {
@@ -256,9 +267,9 @@ RoutingUnit::outportComputeXY(RouteInfo route,
 // Template for implementing custom routing algorithm
 // using port directions. (Example adaptive)
 int
-RoutingUnit::outportComputeCustom(RouteInfo route,
-                                 int inport,
-                                 PortDirection inport_dirn)
+RoutingUnit::outportComputeCustom(const RouteInfo &route,
+                                  int inport,
+                                  PortDirection inport_dirn)
 {
     panic("%s placeholder executed", __FUNCTION__);
 }
@@ -268,7 +279,7 @@ RoutingUnit::outportComputeCustom(RouteInfo route,
  * By default Garnet uses the routing table.
  */
 int
-RoutingUnit::outportComputeYX(RouteInfo route,
+RoutingUnit::outportComputeYX(const RouteInfo &route,
                               int inport,
                               PortDirection inport_dirn)
 {
@@ -330,7 +341,7 @@ RoutingUnit::outportComputeYX(RouteInfo route,
  * By default Garnet uses the routing table.
  */
 int
-RoutingUnit::outportComputeXYYX(RouteInfo route,
+RoutingUnit::outportComputeXYYX(const RouteInfo &route,
                                 int inport,
                                 PortDirection inport_dirn,
                                 int vnet)
@@ -360,85 +371,270 @@ RoutingUnit::outportComputeXYYX(RouteInfo route,
     return outport;
 }
 
-std::vector<int>
-RoutingUnit::multicastOutportsCompute(RouteInfo &route, int inport,
-        PortDirection inport_dirn, int vnet)
+/*
+ * Quadrant XY-YX routing for 2D mesh network. Destinations in the eastern
+ * quadrants of the current router use XY routing and the others use YX
+ * routing, so a multicast tree leaves its source on the row links towards
+ * the east and on the column links towards the west instead of piling up
+ * on the source row. The choice doesn't change along a path, and the turns
+ * of both halves (east then north/south, north/south then west) don't form
+ * a cycle, so this is deadlock free within a vnet.
+ */
+int
+RoutingUnit::outportComputeQuadrantXYYX(const RouteInfo &route,
+                                        int inport,
+                                        PortDirection inport_dirn)
 {
-    assert(route.dest_router == -1);
-    std::set<int> unique_outport_set;
-    std::vector<int> outports;
+    PortDirection outport_dirn = "Unknown";
 
-    assert(route.demandOutports.empty());
+    int num_cols = m_router->get_net_ptr()->getNumCols();
+    assert(num_cols > 0);
+
+    int my_id = m_router->get_id();
+    int my_x = my_id % num_cols;
+    int my_y = my_id / num_cols;
 
-    for (int i = 0; i < route.destRouters.size(); i++) {
-        RouteInfo single_route = route;
+    int dest_id = route.dest_router;
+    int dest_x = dest_id % num_cols;
+    int dest_y = dest_id / num_cols;
 
-        single_route.dest_router = route.destRouters[i];
-        single_route.net_dest = route.netDests[i];
+    if (dest_x > my_x) {
+        // XY to the east
+        assert(inport_dirn == "Local" || inport_dirn == "West");
+        outport_dirn = "East";
+    } else if (dest_y != my_y) {
+        // YX to the west, or the same column
+        if (dest_y > my_y) {
+            // "Local" or "South" or "West"
+            assert(inport_dirn != "North" && inport_dirn != "East");
+            outport_dirn = "North";
+        } else {
+            // "Local" or "North" or "West"
+            assert(inport_dirn != "South" && inport_dirn != "East");
+            outport_dirn = "South";
+        }
+    } else if (dest_x < my_x) {
+        // "Local" or "East" or "North" or "South"
+        assert(inport_dirn != "West");
+        outport_dirn = "West";
+    } else {
+        // already checked that in outportCompute() function
+        panic("x_hops == y_hops == 0");
+    }
 
-        int outport =
-            outportCompute(single_route, inport, inport_dirn, vnet);
+    return m_outports_dirn2idx[outport_dirn];
+}
+
+/*
+ * XY routing for a 2D mesh with express links (ExpressMesh_XY topology).
+ * Packets take the express link of their XY direction whenever the router
+ * has one and at least express_interval hops remain in that dimension, so
+ * they never overshoot their destination.
+ */
+int
+RoutingUnit::outportComputeExpressXY(const RouteInfo &route,
+                                     int inport,
+                                     PortDirection inport_dirn)
+{
+    PortDirection outport_dirn = "Unknown";
+
+    int interval = m_router->get_net_ptr()->getExpressInterval();
+    int num_cols = m_router->get_net_ptr()->getNumCols();
+    assert(interval > 1 && num_cols > 0);
+
+    int my_id = m_router->get_id();
+    int my_x = my_id % num_cols;
+    int my_y = my_id / num_cols;
 
-        unique_outport_set.insert(outport);
-        outports.push_back(outport);
+    int dest_id = route.dest_router;
+    int dest_x = dest_id % num_cols;
+    int dest_y = dest_id / num_cols;
+
+    int x_hops = abs(dest_x - my_x);
+    int y_hops = abs(dest_y - my_y);
+
+    int hops;
+    if (x_hops > 0) {
+        outport_dirn = (dest_x > my_x) ? "East" : "West";
+        hops = x_hops;
+    } else if (y_hops > 0) {
+        outport_dirn = (dest_y > my_y) ? "North" : "South";
+        hops = y_hops;
+    } else {
+        // already checked that in outportCompute() function
+        panic("x_hops == y_hops == 0");
     }
 
-    // Construct new route info
-    for (auto outport : unique_outport_set) {
-        RouteInfo new_route = route;
+    if (hops >= interval &&
+        m_outports_dirn2idx.count(outport_dirn + "Express")) {
+        outport_dirn += "Express";
+    }
 
-        new_route.dest_ni = -1;
-        if (route.dest_ni != -1) {
-            new_route.dest_ni = route.dest_ni;
-        }
-        new_route.dest_router = -1;
-        new_route.net_dest.clear();
-        new_route.destRouters.clear();
-        new_route.destNIs.clear();
-        new_route.netDests.clear();
+    return m_outports_dirn2idx[outport_dirn];
+}
+
+/*
+ * Routing for a 2D flattened butterfly (FlattenedButterfly topology).
+ * Packets take the row link to the column of their destination, then the
+ * column link to its row, in at most two hops.
+ */
+int
+RoutingUnit::outportComputeFlattenedButterfly(const RouteInfo &route,
+                                              int inport,
+                                              PortDirection inport_dirn)
+{
+    int num_cols = m_router->get_net_ptr()->getNumCols();
+    assert(num_cols > 0);
+
+    int my_id = m_router->get_id();
+    int my_x = my_id % num_cols;
 
-        new_route.demandDestNIs = route.demandDestNIs;
-        new_route.demandOutports.clear();
+    int dest_id = route.dest_router;
+    int dest_x = dest_id % num_cols;
+    int dest_y = dest_id / num_cols;
 
-        route.outportRouteMap[outport] = new_route;
+    PortDirection outport_dirn;
+    if (dest_x != my_x) {
+        outport_dirn = "X" + std::to_string(dest_x);
+    } else {
+        // already at the column of the destination
+        assert(inport_dirn.compare(0, 1, "Y") != 0);
+        outport_dirn = "Y" + std::to_string(dest_y);
     }
 
-    // Add new route multicast destinations info
-    for (int i = 0; i < outports.size(); i++) {
-        int outport = outports[i];
+    assert(m_outports_dirn2idx.count(outport_dirn));
+    return m_outports_dirn2idx[outport_dirn];
+}
 
-        RouteInfo &new_route = route.outportRouteMap[outport];
+/*
+ * Routing for a two-level clustered mesh (ClusteredMesh topology).
+ * Packets within a cluster use XY routing on its local mesh. Otherwise
+ * they go up to the hub of their source cluster, use XY routing on the
+ * global mesh of the hubs and go down from the hub of the destination
+ * cluster.
+ */
+int
+RoutingUnit::outportComputeClustered(const RouteInfo &route,
+                                     int inport,
+                                     PortDirection inport_dirn)
+{
+    GarnetNetwork *net_ptr = m_router->get_net_ptr();
+    int num_cols = net_ptr->getNumCols();
+    int cluster_rows = net_ptr->getClusterRows();
+    int cluster_cols = net_ptr->getClusterCols();
+    assert(num_cols > 0 && cluster_rows > 0 && cluster_cols > 0);
+
+    auto cluster_x = [&](int id) { return id % num_cols / cluster_cols; };
+    auto cluster_y = [&](int id) { return id / num_cols / cluster_rows; };
+    auto hub = [&](int id) {
+        return (cluster_y(id) * cluster_rows + cluster_rows / 2) * num_cols +
+               cluster_x(id) * cluster_cols + cluster_cols / 2;
+    };
 
-        // demand requestor
-        if (route.demandDestNIs.find(route.destNIs[i]) !=
-                route.demandDestNIs.end()) {
-            route.demandOutports.insert(outport);
-        }
+    int my_id = m_router->get_id();
+    int dest_id = route.dest_router;
 
-        new_route.net_dest.addNetDest(route.netDests[i]);
-        new_route.destRouters.push_back(route.destRouters[i]);
-        new_route.destNIs.push_back(route.destNIs[i]);
-        new_route.netDests.push_back(route.netDests[i]);
+    // Local mesh within the cluster
+    if (cluster_x(route.src_router) == cluster_x(dest_id) &&
+        cluster_y(route.src_router) == cluster_y(dest_id)) {
+        return outportComputeXY(route, inport, inport_dirn);
     }
 
-    // Update to be unicast if it becomes unicast
-    for (auto outport: unique_outport_set) {
-        RouteInfo &new_route = route.outportRouteMap[outport];
+    PortDirection outport_dirn;
+    if (my_id != hub(my_id)) {
+        // still in the source cluster
+        outport_dirn = "Up";
+    } else if (cluster_x(my_id) != cluster_x(dest_id)) {
+        outport_dirn = (cluster_x(dest_id) > cluster_x(my_id)) ?
+            "GlobalEast" : "GlobalWest";
+    } else if (cluster_y(my_id) != cluster_y(dest_id)) {
+        outport_dirn = (cluster_y(dest_id) > cluster_y(my_id)) ?
+            "GlobalNorth" : "GlobalSouth";
+    } else {
+        outport_dirn = "Down" + std::to_string(dest_id);
+    }
+
+    assert(m_outports_dirn2idx.count(outport_dirn));
+    return m_outports_dirn2idx[outport_dirn];
+}
+
+// Source and progress of a multicast route, without its destinations and
+// fork, to route one of its destinations or to start a branch
+static RouteInfo
+branchRoute(const RouteInfo &route)
+{
+    RouteInfo branch;
+    branch.vnet = route.vnet;
+    branch.src_ni = route.src_ni;
+    branch.src_router = route.src_router;
+    branch.dest_ni = route.dest_ni;
+    branch.dest_router = route.dest_router;
+    branch.hops_traversed = route.hops_traversed;
+    branch.multicast = route.multicast;
+    branch.srcMachID = route.srcMachID;
+    return branch;
+}
 
-        if (new_route.destNIs.size() == 1) {
-            new_route.dest_ni = new_route.destNIs[0];
-            new_route.dest_router = new_route.destRouters[0];
+std::vector<int>
+RoutingUnit::multicastOutportsCompute(RouteInfo &route, int inport,
+        PortDirection inport_dirn, int vnet)
+{
+    assert(route.dest_router == -1);
+    assert(route.outportRouteMap.empty());
+    assert(route.demandOutports.empty());
 
-            new_route.destNIs.clear();
-            new_route.destRouters.clear();
-            new_route.netDests.clear();
+    GarnetNetwork *net_ptr = m_router->get_net_ptr();
+
+    // The destinations of a branch are the ones of the packet routed
+    // through its outport, i.e. route.net_dest AND the outport mask built
+    // here one destination at a time, so that a fork copies no containers
+    RouteInfo single_route = branchRoute(route);
+    for (MachineID mach = route.net_dest.nextElement(
+             MachineID(MachineType_FIRST, 0));
+         mach.isValid();
+         mach = route.net_dest.nextElement(
+             MachineID(mach.type, mach.num + 1))) {
+        single_route.dest_router =
+            net_ptr->get_router_id(mach.getNodeID(), vnet);
+        single_route.net_dest.clear();
+        single_route.net_dest.add(mach);
+
+        int outport =
+            outportCompute(single_route, inport, inport_dirn, vnet);
+
+        auto it = route.outportRouteMap.find(outport);
+        if (it == route.outportRouteMap.end()) {
+            RouteInfo new_route = branchRoute(route);
+            new_route.dest_router = -1;
+            new_route.demand_dests = route.demand_dests;
+            it = route.outportRouteMap.emplace(outport,
+                                               std::move(new_route)).first;
         }
+        it->second.net_dest.add(mach);
 
-        new_route.outportRouteMap.clear();
+        // demand requestor
+        if (route.demand_dests.isElement(mach))
+            route.demandOutports.insert(outport);
+    }
+
+    // Update to be unicast if it becomes unicast
+    for (auto &outport_route : route.outportRouteMap) {
+        RouteInfo &new_route = outport_route.second;
+
+        if (new_route.net_dest.count() == 1) {
+            new_route.dest_ni = new_route.net_dest.smallestElement()
+                .getNodeID();
+            new_route.dest_router =
+                net_ptr->get_router_id(new_route.dest_ni, vnet);
+        }
     }
 
+    net_ptr->sample_multicast_branches(route.outportRouteMap.size());
+
     std::vector<int> unique_outports;
-    for (auto outport: unique_outport_set) {
+    unique_outports.reserve(route.outportRouteMap.size());
+    for (const auto &outport_route : route.outportRouteMap) {
+        int outport = outport_route.first;
         if (route.demandOutports.find(outport) != route.demandOutports.end())
             unique_outports.insert(unique_outports.begin(), outport);
         else
@@ -44,10 +44,10 @@ class RoutingUnit
 {
   public:
     RoutingUnit(Router *router);
-    int outportCompute(RouteInfo route,
-                      int inport,
-                      PortDirection inport_dirn,
-                      int vnet);
+    int outportCompute(const RouteInfo &route,
+                       int inport,
+                       PortDirection inport_dirn,
+                       int vnet);
     std::vector<int> multicastOutportsCompute(RouteInfo &route, int inport,
             PortDirection inport_dirn, int vnet);
 
@@ -56,32 +56,55 @@ class RoutingUnit
     void addWeight(int link_weight);
 
     // get output port from routing table
-    int  lookupRoutingTable(int vnet, NetDest net_dest);
+    int  lookupRoutingTable(int vnet, const NetDest &net_dest);
 
     // Topology-specific direction based routing
     void addInDirection(PortDirection inport_dirn, int inport);
     void addOutDirection(PortDirection outport_dirn, int outport);
 
     // Routing for Mesh
-    int outportComputeXY(RouteInfo route,
+    int outportComputeXY(const RouteInfo &route,
                          int inport,
                          PortDirection inport_dirn);
 
     // Custom Routing Algorithm using Port Directions
-    int outportComputeCustom(RouteInfo route,
+    int outportComputeCustom(const RouteInfo &route,
                              int inport,
                              PortDirection inport_dirn);
 
     // Routing for Mesh, control vnet uses XY and data vnet uses YX
-    int outportComputeXYYX(RouteInfo route,
+    int outportComputeXYYX(const RouteInfo &route,
                            int inport,
                            PortDirection inport_dirn,
                            int vnet);
 
-    int outportComputeYX(RouteInfo route,
+    int outportComputeYX(const RouteInfo &route,
                          int inport,
                          PortDirection inport_dirn);
 
+    // Routing for Mesh, XY to the east and YX to the west (or the same
+    // column) of the current router
+    int outportComputeQuadrantXYYX(const RouteInfo &route,
+                                   int inport,
+                                   PortDirection inport_dirn);
+
+    // Routing for Mesh with express links, XY using the express links
+    // whenever they don't overshoot the destination
+    int outportComputeExpressXY(const RouteInfo &route,
+                                int inport,
+                                PortDirection inport_dirn);
+
+    // Routing for Flattened Butterfly, to the column then to the row
+    int outportComputeFlattenedButterfly(const RouteInfo &route,
+                                         int inport,
+                                         PortDirection inport_dirn);
+
+    // Routing for Clustered Mesh, XY on the local mesh within a cluster,
+    // through the hubs and the global mesh between clusters
+    int outportComputeClustered(const RouteInfo &route,
+                                int inport,
+                                PortDirection inport_dirn);
+
     // Returns true if vnet is present in the vector
     // of vnets or if the vector supports all vnets.
     bool supportsVnet(int vnet, std::vector<int> sVnets);
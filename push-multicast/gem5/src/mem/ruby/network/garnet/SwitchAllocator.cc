@@ -585,14 +585,14 @@ SwitchAllocator::grantSwitch()
                     prepush_filter->clearPrepushAtTime(
                             t_flit->getAddr(),
                             clear_time,
-                            t_flit->getRoute().net_dest);
+                            t_flit->get_route().net_dest);
 
                     DPRINTF(PrepushFilter, "Router[%d]: PrepushFilter %d "
                             "(%s): clear prepush addr %#x dest %s at tick"
                             " %ld\n", m_router->get_id(),
                             outport, output_unit->get_direction(),
                             t_flit->getAddr(),
-                            t_flit->getRoute().net_dest,
+                            t_flit->get_route().net_dest,
                             clear_time);
 
                     if (!m_router->alreadyScheduled(clear_time))
@@ -76,10 +76,10 @@ VirtualChannel::need_stage(flit_stage stage, Tick time)
 }
 
 void
-VirtualChannel::setMulticastOutports(std::vector<int> outports,
-        std::set<int> demand_outports,
-        std::map<int, RouteInfo> outport_route_map,
-        std::map<NodeID, MsgPtr> msg_ptrs_map)
+VirtualChannel::setMulticastOutports(const std::vector<int> &outports,
+        const std::set<int> &demand_outports,
+        const std::map<int, RouteInfo> &outport_route_map,
+        const std::map<NodeID, MsgPtr> &msg_ptrs_map)
 {
     assert(!multicast);
     assert(_outputPorts.empty());
@@ -97,14 +97,20 @@ VirtualChannel::setMulticastOutports(std::vector<int> outports,
 
     // generate msg ptrs map
     for (auto outport: outports) {
-        auto route = _outportRouteMap[outport];
+        const RouteInfo &route = _outportRouteMap[outport];
 
         std::map<NodeID, MsgPtr> new_msg_ptrs_map;
         if (route.dest_router != -1) {
-            new_msg_ptrs_map[route.dest_ni] = msg_ptrs_map[route.dest_ni];
+            new_msg_ptrs_map[route.dest_ni] = msg_ptrs_map.at(route.dest_ni);
         } else {
-            for (auto dest_node: route.destNIs)
-                new_msg_ptrs_map[dest_node] = msg_ptrs_map[dest_node];
+            for (MachineID mach = route.net_dest.nextElement(
+                     MachineID(MachineType_FIRST, 0));
+                 mach.isValid();
+                 mach = route.net_dest.nextElement(
+                     MachineID(mach.type, mach.num + 1))) {
+                NodeID dest_node = mach.getNodeID();
+                new_msg_ptrs_map[dest_node] = msg_ptrs_map.at(dest_node);
+            }
         }
 
         _outportMsgPtrsMap[outport] = new_msg_ptrs_map;
@@ -121,7 +127,7 @@ VirtualChannel::updateDemandDests(Addr addr, MachineID mid, int outport)
         NodeID node_id = mid.getNodeID();
 
         _outportMsgPtrsMap[outport][node_id]->getDemandDests().add(mid);
-        _outportRouteMap[outport].demandDestNIs.insert(node_id);
+        _outportRouteMap[outport].demand_dests.add(mid);
     }
 }
 
@@ -209,9 +215,8 @@ VirtualChannel::printVCString(int vc) const
         for (auto outport: _outputPorts) {
             oss << outport << " (outvc:" << getMulticastOutvc(outport)
                 << ") : {";
-            std::map<int, RouteInfo> &ref =
-                const_cast<std::map<int, RouteInfo>&>(_outportRouteMap);
-            oss << ref[outport].destRouters << " }, ";
+            oss << _outportRouteMap.at(outport).net_dest.getAllDest()
+                << " }, ";
         }
         oss << "}, active outports: {" << _activeOutputPorts << " }, ";
         oss << "remaining outports: {" << _remainingOutputPorts << " }";
@@ -78,10 +78,10 @@ class VirtualChannel
         return _outportOutvcMap;
     }
 
-    void setMulticastOutports(std::vector<int> outports,
-                              std::set<int> demand_outports,
-                              std::map<int, RouteInfo> outport_route_map,
-                              std::map<NodeID, MsgPtr> msg_ptrs_map);
+    void setMulticastOutports(const std::vector<int> &outports,
+            const std::set<int> &demand_outports,
+            const std::map<int, RouteInfo> &outport_route_map,
+            const std::map<NodeID, MsgPtr> &msg_ptrs_map);
 
     inline std::vector<int> getMulticastOutports() { return _outputPorts; }
 
@@ -37,7 +37,7 @@
 uint64_t flit::globalPacketID = 0;
 
 // Constructor for the flit
-flit::flit(int id, int  vc, int vnet, RouteInfo route, int size,
+flit::flit(int id, int  vc, int vnet, const RouteInfo &route, int size,
     MsgPtr msg_ptr, int MsgSize, uint32_t bWidth, Tick curTime,
     bool replica)
 {
@@ -165,13 +165,11 @@ flit::print(std::ostream& out) const
     out << "VC=" << m_vc << " ";
     out << "Src NI=" << m_route.src_ni << " ";
     out << "Src Router=" << m_route.src_router << " ";
-    if (m_route.destNIs.size() <= 1) {
+    if (m_route.dest_router != -1) {
         out << "Dest NI=" << m_route.dest_ni << " ";
         out << "Dest Router=" << m_route.dest_router << " ";
     } else {
-        assert(m_route.dest_router == -1);
-        out << "Dest NIs={" << m_route.destNIs << " } ";
-        out << "Dest Routers={" << m_route.destRouters << " } ";
+        out << "Dest NIs={" << m_route.net_dest.getAllDest() << " } ";
     }
     out << "Set Time=" << m_time << " ";
     out << "Width=" << m_width<< " ";
@@ -43,7 +43,7 @@ class flit
 {
   public:
     flit() {}
-    flit(int id, int vc, int vnet, RouteInfo route, int size,
+    flit(int id, int vc, int vnet, const RouteInfo &route, int size,
          MsgPtr msg_ptr, int MsgSize, uint32_t bWidth, Tick curTime,
          bool replica = false);
 
@@ -57,7 +57,7 @@ class flit
     Tick get_time() { return m_time; }
     int get_vnet() { return m_vnet; }
     int get_vc() { return m_vc; }
-    RouteInfo get_route() { return m_route; }
+    const RouteInfo &get_route() const { return m_route; }
     MsgPtr& get_msg_ptr() { return m_msg_ptr; }
     flit_type get_type() { return m_type; }
     std::pair<flit_stage, Tick> get_stage() { return m_stage; }
@@ -81,7 +81,7 @@ class flit
     void set_outport(int port) { m_outport = port; }
     void set_time(Tick time) { m_time = time; }
     void set_vc(int vc) { m_vc = vc; }
-    void set_route(RouteInfo route) { m_route = route; }
+    void set_route(const RouteInfo &route) { m_route = route; }
     void set_src_delay(Tick delay) { src_delay = delay; }
     void set_dequeue_time(Tick time) { m_dequeue_time = time; }
     void set_enqueue_time(Tick time) { m_enqueue_time = time; }
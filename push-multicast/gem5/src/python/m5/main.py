@@ -118,6 +118,21 @@ def parse_options():
     option("--stats-help",
            action="callback", callback=_stats_help,
            help="Display documentation for available stat visitors")
+    option("--stats-timeseries", metavar="FILE", default=None,
+        help="Sample the stats every --stats-timeseries-period ticks into a "
+        "delta encoded binary time series, without resetting them "
+        "[Default: %default]")
+    option("--stats-timeseries-period", metavar="TICKS", type='int',
+        default=100000000,
+        help="Period of the stat time series samples [Default: %default]")
+    option("--stats-server", metavar="SOCKET", default=None,
+        help="Answer queries about the progress and the current stats on "
+        "a Unix domain socket, relative to the output directory "
+        "[Default: %default]")
+    option("--stats-server-period", metavar="TICKS", type='int',
+        default=10000000,
+        help="Period of the polls of the stats server socket "
+        "[Default: %default]")
 
     # Configuration Options
     group("Configuration Options")
@@ -130,6 +145,9 @@ def parse_options():
     option("--dot-dvfs-config", metavar="FILE", default=None,
         help="Create DOT & pdf outputs of the DVFS configuration" + \
              " [Default: %default]")
+    option("--time-instantiate", action="store_true", default=False,
+        help="Print the time spent in each pass over the SimObjects in "
+        "m5.instantiate()")
 
     # Debugging options
     group("Debugging Options")
@@ -370,6 +388,14 @@ def main(*args):
 
     # set stats options
     stats.addStatVisitor(options.stats_file)
+    if options.stats_timeseries:
+        stats.addTimeSeriesVisitor("bin://%s?delta=True" %
+                                   options.stats_timeseries,
+                                   options.stats_timeseries_period)
+    if options.stats_server:
+        from .stats import server
+        server.listen(os.path.join(options.outdir, options.stats_server),
+                      options.stats_server_period)
 
     # Disable listeners unless running interactively or explicitly
     # enabled
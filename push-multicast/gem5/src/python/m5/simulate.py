@@ -42,6 +42,8 @@ from __future__ import print_function
 import atexit
 import os
 import sys
+import time
+from contextlib import contextmanager
 
 # import the wrapped C++ functions
 import _m5.drain
@@ -49,6 +51,7 @@ import _m5.core
 from _m5.stats import updateEvents as updateStatEvents
 
 from . import stats
+from .stats import server as stats_server
 from . import SimObject
 from . import ticks
 from . import objects
@@ -69,9 +72,40 @@ _memory_modes = {
 
 _drain_manager = _m5.drain.DrainManager.instance()
 
+# All the SimObjects in descendants() order, flattened once the hierarchy
+# is final in instantiate(), so that the many passes over the objects do
+# not walk and sort the whole hierarchy again
+_objects = None
+
+# Time spent in each pass of instantiate()
+_pass_times = []
+
+def _descendants(root):
+    """SimObjects under root, from the flattened list if root is the
+    instantiated Root"""
+
+    if _objects is not None and root is objects.Root.getInstance():
+        return _objects
+    return root.descendants()
+
+@contextmanager
+def _timed_pass(name):
+    start = time.time()
+    yield
+    _pass_times.append((name, time.time() - start))
+
+def _print_pass_times():
+    total = sum(seconds for name, seconds in _pass_times)
+    print("instantiate() of %d SimObjects took %.2fs" %
+          (len(_objects), total))
+    for name, seconds in _pass_times:
+        print("  %-20s %8.3fs" % (name, seconds))
+
 # The final hook to generate .ini files.  Called from the user script
 # once the config is built.
 def instantiate(ckpt_dir=None):
+    global _objects
+
     from m5 import options
 
     root = objects.Root.getInstance()
@@ -83,53 +117,68 @@ def instantiate(ckpt_dir=None):
     ticks.fixGlobalFrequency()
 
     # Make sure SimObject-valued params are in the configuration
-    # hierarchy so we catch them with future descendants() walks
-    for obj in root.descendants(): obj.adoptOrphanParams()
+    # hierarchy so we catch them with future descendants() walks. The
+    # adopted params are walked as they are added, the hierarchy is final
+    # afterwards.
+    with _timed_pass("adoptOrphanParams"):
+        for obj in root.descendants(): obj.adoptOrphanParams()
+        _objects = list(root.descendants())
 
     # Unproxy in sorted order for determinism
-    for obj in root.descendants(): obj.unproxyParams()
+    with _timed_pass("unproxyParams"):
+        for obj in _objects: obj.unproxyParams()
 
     if options.dump_config:
-        ini_file = open(os.path.join(options.outdir, options.dump_config), 'w')
-        # Print ini sections in sorted order for easier diffing
-        for obj in sorted(root.descendants(), key=lambda o: o.path()):
-            obj.print_ini(ini_file)
-        ini_file.close()
+        with _timed_pass("dump_config"):
+            ini_file = open(os.path.join(options.outdir, options.dump_config),
+                            'w')
+            # Print ini sections in sorted order for easier diffing
+            for obj in sorted(_objects, key=lambda o: o.path()):
+                obj.print_ini(ini_file)
+            ini_file.close()
 
     if options.json_config:
-        try:
-            import json
-            json_file = open(
-                os.path.join(options.outdir, options.json_config), 'w')
-            d = root.get_config_as_dict()
-            json.dump(d, json_file, indent=4)
-            json_file.close()
-        except ImportError:
-            pass
+        with _timed_pass("json_config"):
+            try:
+                import json
+                json_file = open(
+                    os.path.join(options.outdir, options.json_config), 'w')
+                d = root.get_config_as_dict()
+                json.dump(d, json_file, indent=4)
+                json_file.close()
+            except ImportError:
+                pass
 
     if options.dot_config:
-        do_dot(root, options.outdir, options.dot_config)
-        do_ruby_dot(root, options.outdir, options.dot_config)
+        with _timed_pass("dot_config"):
+            do_dot(root, options.outdir, options.dot_config)
+            do_ruby_dot(root, options.outdir, options.dot_config)
 
     # Initialize the global statistics
     stats.initSimStats()
 
     # Create the C++ sim objects and connect ports
-    for obj in root.descendants(): obj.createCCObject()
-    for obj in root.descendants(): obj.connectPorts()
+    with _timed_pass("createCCObject"):
+        for obj in _objects: obj.createCCObject()
+    with _timed_pass("connectPorts"):
+        for obj in _objects: obj.connectPorts()
 
     # Do a second pass to finish initializing the sim objects
-    for obj in root.descendants(): obj.init()
+    with _timed_pass("init"):
+        for obj in _objects: obj.init()
 
     # Do a third pass to initialize statistics
-    stats._bindStatHierarchy(root)
-    root.regStats()
+    with _timed_pass("regStats"):
+        stats._bindStatHierarchy(root)
+        root.regStats()
 
     # Do a fourth pass to initialize probe points
-    for obj in root.descendants(): obj.regProbePoints()
+    with _timed_pass("regProbePoints"):
+        for obj in _objects: obj.regProbePoints()
 
     # Do a fifth pass to connect probe listeners
-    for obj in root.descendants(): obj.regProbeListeners()
+    with _timed_pass("regProbeListeners"):
+        for obj in _objects: obj.regProbeListeners()
 
     # We want to generate the DVFS diagram for the system. This can only be
     # done once all of the CPP objects have been created and initialised so
@@ -142,24 +191,29 @@ def instantiate(ckpt_dir=None):
 
     # Restore checkpoint (if any)
     if ckpt_dir:
-        _drain_manager.preCheckpointRestore()
-        ckpt = _m5.core.getCheckpoint(ckpt_dir)
-        _m5.core.unserializeGlobals(ckpt);
-        for obj in root.descendants(): obj.loadState(ckpt)
+        with _timed_pass("loadState"):
+            _drain_manager.preCheckpointRestore()
+            ckpt = _m5.core.getCheckpoint(ckpt_dir)
+            _m5.core.unserializeGlobals(ckpt);
+            for obj in _objects: obj.loadState(ckpt)
     else:
-        for obj in root.descendants(): obj.initState()
+        with _timed_pass("initState"):
+            for obj in _objects: obj.initState()
 
     # Check to see if any of the stat events are in the past after resuming from
     # a checkpoint, If so, this call will shift them to be at a valid time.
     updateStatEvents()
 
+    if options.time_instantiate:
+        _print_pass_times()
+
 need_startup = True
 def simulate(*args, **kwargs):
     global need_startup
 
     if need_startup:
         root = objects.Root.getInstance()
-        for obj in root.descendants(): obj.startup()
+        for obj in _descendants(root): obj.startup()
         need_startup = False
 
         # Python exit handlers happen in reverse order.
@@ -172,6 +226,12 @@ def simulate(*args, **kwargs):
         # Reset to put the stats in a consistent state.
         stats.reset()
 
+        # Start sampling the stat time series, if any
+        stats.startTimeSeries()
+
+        # Start polling the stats server, if any
+        stats_server.start()
+
     if _drain_manager.isDrained():
         _drain_manager.resume()
 
@@ -221,11 +281,11 @@ def drain():
     assert _drain_manager.isDrained(), "Drain state inconsistent"
 
 def memWriteback(root):
-    for obj in root.descendants():
+    for obj in _descendants(root):
         obj.memWriteback()
 
 def memInvalidate(root):
-    for obj in root.descendants():
+    for obj in _descendants(root):
         obj.memInvalidate()
 
 def checkpoint(dir):
@@ -322,7 +382,7 @@ def switchCpus(system, cpuList, verbose=True):
         new_cpu.takeOverFrom(old_cpu)
 
 def notifyFork(root):
-    for obj in root.descendants():
+    for obj in _descendants(root):
         obj.notifyFork()
 
 fork_count = 0
@@ -185,8 +185,36 @@ def _hdf5Factory(fn, chunking=10, desc=True, formulas=True):
 
     return _m5.stats.initHDF5(fn, chunking, desc, formulas)
 
-def addStatVisitor(url):
-    """Add a stat visitor specified using a URL string
+@_url_factory([ "bin", ])
+def _binaryFactory(fn, desc=False, formulas=True, delta=False):
+    """Output stats in a compact binary format.
+
+    Binary stat files are a stream of records with every stat name
+    written only once, so they are much smaller and faster to read than
+    text stat files. Unlike the HDF5 format, they include distributions,
+    histograms and sparse histograms. Each stat dump is appended to the
+    file, see src/base/stats/binary.hh for the record layout and
+    util/stats_binary.py for a reader.
+
+    With delta encoding, a dump only records the stats (and vector
+    elements) that changed since the previous one, which keeps frequent
+    dumps of a time series small.
+
+    Parameters:
+      * desc (bool): Output stat descriptions (default: False)
+      * formulas (bool): Output derived stats (default: True)
+      * delta (bool): Only output the changes between dumps
+        (default: False)
+
+    Example:
+      bin://stats.bin?desc=True;delta=True
+
+    """
+
+    return _m5.stats.initBinary(fn, desc, formulas, delta)
+
+def _createStatVisitor(url):
+    """Create a stat visitor specified using a URL string
 
     Stat visitors are specified using URLs on the following format:
     format://path[?param=value[;param=value]]
@@ -214,7 +242,37 @@ def addStatVisitor(url):
     if factory is None:
         fatal("Stat type '%s' disabled at compile time" % parsed.scheme)
 
-    outputList.append(factory(parsed))
+    return factory(parsed)
+
+def addStatVisitor(url):
+    """Add a stat visitor specified using a URL string, see
+    _createStatVisitor()"""
+
+    outputList.append(_createStatVisitor(url))
+
+# Stat visitors sampled periodically into a time series, see
+# addTimeSeriesVisitor(). They are not part of outputList, so the
+# samples neither reset the stats nor grow the regular stat files.
+timeSeriesList = []
+timeSeriesPeriod = 0
+
+def addTimeSeriesVisitor(url, period):
+    """Sample the stats every period ticks into the stat visitor specified
+    by url (see addStatVisitor), without resetting them
+
+    Only the stats that are kept up to date during the simulation, or
+    recomputed by the sample callbacks (Stats::registerSampleCallback),
+    change between samples. The sampling starts with the simulation.
+
+    """
+
+    global timeSeriesPeriod
+
+    if period <= 0:
+        fatal("Stat time series period must be positive.")
+
+    timeSeriesList.append(_createStatVisitor(url))
+    timeSeriesPeriod = period
 
 def printStatVisitorTypes():
     """List available stat visitors and their documentation"""
@@ -391,6 +449,36 @@ def dump(roots=None):
             _dump_to_visitor(output, roots=all_roots)
             output.end()
 
+def sample():
+    '''Sample all statistics to the time series outputs'''
+
+    if not timeSeriesList:
+        return
+
+    _m5.stats.processSampleQueue()
+    prepare()
+
+    for output in timeSeriesList:
+        if output.valid():
+            output.begin()
+            _dump_to_visitor(output)
+            output.end()
+
+def startTimeSeries():
+    '''Schedule the periodic samples of the time series outputs'''
+
+    if not timeSeriesList:
+        return
+
+    from m5 import event
+
+    def _sample():
+        sample()
+        event.mainq.schedule(sample_event, m5.curTick() + timeSeriesPeriod)
+
+    sample_event = event.create(_sample, event.Event.Stat_Event_Pri)
+    event.mainq.schedule(sample_event, m5.curTick() + timeSeriesPeriod)
+
 def reset():
     '''Reset all statistics to the base state'''
 
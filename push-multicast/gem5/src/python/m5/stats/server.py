@@ -0,0 +1,166 @@
+# Copyright (c) 2021 The Push Multicast Authors
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+# Local stats server, answering queries about the progress and the current
+# statistics of a running simulation on a Unix domain socket, without
+# dumping them to disk.
+#
+# A client connects, sends one JSON request line and receives one JSON
+# reply line:
+#
+#   request: {"stats": ["system.ruby.network.int_link_utilization", ...]}
+#   reply:   {"tick": ..., "sim_ticks": ..., "sim_insts": ...,
+#             "host_seconds": ..., "stats": {"system.ruby...": ...}}
+#
+# An empty request line only asks for the progress. Scalar stats are
+# numbers, vectors are lists and unknown or unsupported stats are null.
+# The socket is polled by a periodic event, so replies are only sent while
+# the simulation is running.
+
+from __future__ import print_function
+from __future__ import absolute_import
+
+import atexit
+import json
+import os
+import select
+import socket
+import time
+
+import m5
+import _m5.stats
+from m5.util import fatal, inform
+
+# Progress stats, always in the replies
+PROGRESS_STATS = ("sim_ticks", "sim_insts")
+
+# Longest time waiting for the request line of a connected client
+REQUEST_TIMEOUT = 1.0
+
+_server = None
+_period = 0
+_start_time = time.time()
+
+def listen(path, period):
+    """Create the server socket at path, it is polled every period ticks
+    once the simulation starts"""
+
+    global _server, _period
+
+    if period <= 0:
+        fatal("Stats server period must be positive.")
+
+    if os.path.exists(path):
+        os.remove(path)
+    _server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    _server.bind(path)
+    _server.listen(8)
+    _server.setblocking(False)
+    _period = period
+
+    atexit.register(_close, path)
+    inform("Stats server listening on %s" % path)
+
+def _close(path):
+    _server.close()
+    if os.path.exists(path):
+        os.remove(path)
+
+def start():
+    """Schedule the periodic polls of the server socket"""
+
+    if _server is None:
+        return
+
+    from m5 import event
+
+    def _poll():
+        poll()
+        event.mainq.schedule(poll_event, m5.curTick() + _period)
+
+    poll_event = event.create(_poll, event.Event.Stat_Event_Pri)
+    event.mainq.schedule(poll_event, m5.curTick() + _period)
+
+def _value(name):
+    try:
+        stat = _m5.stats.resolve(name)
+    except KeyError:
+        return None
+
+    if isinstance(stat, _m5.stats.ScalarInfo):
+        return stat.result()
+    elif isinstance(stat, _m5.stats.VectorInfo):
+        return list(stat.result())
+    return None
+
+def reply(request):
+    """Reply to a request, see the module description"""
+
+    names = request.get("stats", [])
+    if names:
+        # recompute the stats collated at dump time
+        _m5.stats.processSampleQueue()
+
+    stats = {}
+    for name in names:
+        stats[name] = _value(name)
+
+    result = {
+        "tick": m5.curTick(),
+        "host_seconds": time.time() - _start_time,
+        "stats": stats,
+    }
+    for name in PROGRESS_STATS:
+        result[name] = _value(name)
+    return result
+
+def _serve(conn):
+    conn.settimeout(REQUEST_TIMEOUT)
+    try:
+        line = conn.makefile("r").readline().strip()
+        try:
+            request = json.loads(line) if line else {}
+            if not isinstance(request, dict):
+                raise ValueError("not a JSON object")
+            result = reply(request)
+        except ValueError as e:
+            result = {"error": "invalid request: %s" % e}
+        conn.sendall((json.dumps(result) + "\n").encode())
+    except socket.error:
+        # the client went away or never sent its request
+        pass
+    finally:
+        conn.close()
+
+def poll():
+    """Serve the clients waiting on the server socket"""
+
+    while select.select([_server], [], [], 0)[0]:
+        try:
+            conn, _ = _server.accept()
+        except socket.error:
+            return
+        _serve(conn)
@@ -44,6 +44,7 @@
 #include "pybind11/stl.h"
 
 #include "base/statistics.hh"
+#include "base/stats/binary.hh"
 #include "base/stats/text.hh"
 #if USE_HDF5
 #include "base/stats/hdf5.hh"
@@ -67,6 +68,7 @@ cast_stat_info(const Stats::Info *info)
     } while (0)
 
     TRY_CAST(Stats::ScalarInfo);
+    TRY_CAST(Stats::VectorInfo);
 
     return py::cast(info);
 
@@ -99,6 +101,7 @@ pybind_init_stats(py::module &m_native)
     m
         .def("initSimStats", &Stats::initSimStats)
         .def("initText", &Stats::initText, py::return_value_policy::reference)
+        .def("initBinary", &Stats::initBinary)
 #if USE_HDF5
         .def("initHDF5", &Stats::initHDF5)
 #endif
@@ -109,9 +112,17 @@ pybind_init_stats(py::module &m_native)
         .def("updateEvents", &Stats::updateEvents)
         .def("processResetQueue", &Stats::processResetQueue)
         .def("processDumpQueue", &Stats::processDumpQueue)
+        .def("processSampleQueue", &Stats::processSampleQueue)
         .def("enable", &Stats::enable)
         .def("enabled", &Stats::enabled)
         .def("statsList", &Stats::statsList)
+        .def("resolve", [](const std::string &name) -> py::object {
+                 const Stats::Info *stat = Stats::resolve(name);
+                 if (!stat)
+                     throw pybind11::key_error("Unknown stat name");
+
+                 return cast_stat_info(stat);
+             })
         ;
 
     py::class_<Stats::Output>(m, "Output")
@@ -147,6 +158,16 @@ pybind_init_stats(py::module &m_native)
         .def("total", &Stats::ScalarInfo::total)
         ;
 
+    py::class_<Stats::VectorInfo, Stats::Info,
+               std::unique_ptr<Stats::VectorInfo, py::nodelete>>(
+                   m, "VectorInfo")
+        .def_readonly("subnames", &Stats::VectorInfo::subnames)
+        .def("size", &Stats::VectorInfo::size)
+        .def("value", &Stats::VectorInfo::value)
+        .def("result", &Stats::VectorInfo::result)
+        .def("total", &Stats::VectorInfo::total)
+        ;
+
     py::class_<Stats::Group, std::unique_ptr<Stats::Group, py::nodelete>>(
         m, "Group")
         .def("regStats", &Stats::Group::regStats)
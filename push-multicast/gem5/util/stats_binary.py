@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2021 The Push Multicast Authors
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+# Reader of the binary stat files written by the bin:// stat visitor
+# (src/base/stats/binary.hh), including the delta encoded time series of
+# --stats-timeseries. The file is memory mapped and indexed with a single
+# pass over the record headers, stat values are only decoded when they are
+# accessed, and the time series of a stat only replays its own records.
+#
+# Usage:
+#   from stats_binary import StatsBinary
+#   stats = StatsBinary("m5out/timeseries.bin")
+#   stats.value("sim_ticks")                  # last dump
+#   stats.ticks                               # tick of every dump
+#   stats.series("system.ruby.network.int_link_utilization_breakdown")
+#
+#   python3 util/stats_binary.py m5out/stats.bin [dump]
+
+import bisect
+import mmap
+import struct
+import sys
+
+import numpy as np
+
+MAGIC = b"M5STATBN"
+VERSIONS = (1, 2, 3)
+BYTE_ORDER_MARK = 0x01020304
+DELTA = 1
+
+(STRING, DESC, SUBNAMES, BEGIN_DUMP, END_DUMP, SCALAR, VECTOR, VECTOR2D,
+ DIST, SPARSE_HIST, UPDATE, Y_SUBNAMES) = range(1, 13)
+
+DIST_TYPES = ("deviation", "dist", "hist")
+DIST_FIELDS = ("min", "max", "bucket_size", "min_val", "max_val",
+               "underflow", "overflow", "sum", "squares", "logs", "samples")
+
+class StatsBinary(object):
+    """Stats of a binary stat file, indexed by name and dump."""
+
+    def __init__(self, filename):
+        with open(filename, "rb") as f:
+            self.buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self.buf[:8] != MAGIC:
+            raise ValueError("%s is not a binary stat file" % filename)
+        bom = struct.unpack_from("<I", self.buf, 12)[0]
+        if bom == BYTE_ORDER_MARK:
+            self.order = "<"
+        elif bom == 0x04030201:
+            self.order = ">"
+        else:
+            raise ValueError("%s has a corrupted header" % filename)
+        self.version = self._unpack("I", 8)[0]
+        if self.version not in VERSIONS:
+            raise ValueError("%s: unsupported version %d" % (filename,
+                                                              self.version))
+        if self.version == 1:
+            self.delta = False
+            offset = 16
+        else:
+            self.delta = bool(self._unpack("I", 16)[0] & DELTA)
+            offset = 20
+
+        self.strings = []
+        self.descs = {}
+        self.subnames = {}
+        # column subnames of the 2-D vectors (version 3)
+        self.y_subnames = {}
+        # tick of every complete dump (None before version 2)
+        self.ticks = []
+        # name: ([dump, ...], [(tag, payload offset), ...]) of its records
+        self.history = {}
+        self._index(offset)
+
+    def _unpack(self, fmt, offset):
+        return struct.unpack_from(self.order + fmt, self.buf, offset)
+
+    def _index(self, offset):
+        size = len(self.buf)
+        dump = None
+        while offset < size:
+            tag = self.buf[offset]
+            offset += 1
+            try:
+                offset = self._index_record(tag, offset, dump)
+            except struct.error:
+                # truncated by a simulation still running
+                break
+            if tag == BEGIN_DUMP:
+                tick = None
+                if self.version > 1:
+                    tick = self._unpack("Q", offset - 8)[0]
+                dump = (tick, [])
+            elif tag == END_DUMP and dump is not None:
+                # the records of a dump are only visible once complete
+                number = len(self.ticks)
+                self.ticks.append(dump[0])
+                for name, entry in dump[1]:
+                    dumps, entries = self.history.setdefault(name, ([], []))
+                    dumps.append(number)
+                    entries.append(entry)
+                dump = None
+
+    def _index_record(self, tag, offset, dump):
+        if tag == STRING:
+            _, length = self._unpack("II", offset)
+            offset += 8
+            if offset + length > len(self.buf):
+                raise struct.error("truncated string")
+            self.strings.append(self.buf[offset:offset + length].decode())
+            return offset + length
+        elif tag == DESC:
+            name, desc = self._unpack("II", offset)
+            self.descs[self.strings[name]] = self.strings[desc]
+            return offset + 8
+        elif tag in (SUBNAMES, Y_SUBNAMES):
+            name, n = self._unpack("II", offset)
+            ids = self._unpack("%dI" % n, offset + 8)
+            subnames = self.subnames if tag == SUBNAMES else self.y_subnames
+            subnames[self.strings[name]] = [self.strings[i] for i in ids]
+            return offset + 8 + 4 * n
+        elif tag == BEGIN_DUMP:
+            self._unpack("I", offset)
+            if self.version > 1:
+                self._unpack("Q", offset + 4)
+                return offset + 12
+            return offset + 4
+        elif tag == END_DUMP:
+            self._unpack("I", offset)
+            return offset + 4
+
+        name = self.strings[self._unpack("I", offset)[0]]
+        offset += 4
+        start = offset
+        if tag == SCALAR:
+            offset += 8
+        elif tag == VECTOR:
+            offset += 4 + 8 * self._unpack("I", offset)[0]
+        elif tag == VECTOR2D:
+            x, y = self._unpack("II", offset)
+            offset += 8 + 8 * x * y
+        elif tag == DIST:
+            offset += 1 + 8 * len(DIST_FIELDS)
+            offset += 4 + 8 * self._unpack("I", offset)[0]
+        elif tag == SPARSE_HIST:
+            offset += 8
+            offset += 4 + 16 * self._unpack("I", offset)[0]
+        elif tag == UPDATE:
+            offset += 4 + 12 * self._unpack("I", offset)[0]
+        else:
+            raise ValueError("unknown record tag %d at offset %d" %
+                             (tag, offset - 5))
+        if offset > len(self.buf):
+            raise struct.error("truncated record")
+        if dump is not None:
+            dump[1].append((name, (tag, start)))
+        return offset
+
+    def _array(self, offset, count):
+        return np.frombuffer(self.buf, dtype=self.order + "f8",
+                             count=count, offset=offset)
+
+    def _decode(self, tag, offset):
+        if tag == SCALAR:
+            return self._unpack("d", offset)[0]
+        elif tag == VECTOR:
+            n = self._unpack("I", offset)[0]
+            return self._array(offset + 4, n)
+        elif tag == VECTOR2D:
+            x, y = self._unpack("II", offset)
+            return self._array(offset + 8, x * y).reshape(x, y)
+        elif tag == DIST:
+            dist = {"type": DIST_TYPES[self.buf[offset]]}
+            offset += 1
+            dist.update(zip(DIST_FIELDS, self._unpack(
+                    "%dd" % len(DIST_FIELDS), offset)))
+            offset += 8 * len(DIST_FIELDS)
+            n = self._unpack("I", offset)[0]
+            dist["buckets"] = self._array(offset + 4, n)
+            return dist
+        elif tag == SPARSE_HIST:
+            samples, n = self._unpack("dI", offset)
+            pairs = self._array(offset + 12, 2 * n).reshape(n, 2)
+            return {"samples": samples, "values": pairs[:, 0],
+                    "counts": pairs[:, 1]}
+
+    def _update(self, value, offset):
+        """Copy of a vector value with the elements of an UPDATE record."""
+        n = self._unpack("I", offset)[0]
+        pairs = np.frombuffer(self.buf, count=n, offset=offset + 4,
+                              dtype=[("index", self.order + "u4"),
+                                     ("value", self.order + "f8")])
+        value = np.array(value)
+        value.reshape(-1)[pairs["index"]] = pairs["value"]
+        return value
+
+    def _dump_number(self, dump):
+        if dump < 0:
+            dump += len(self.ticks)
+        if not 0 <= dump < len(self.ticks):
+            raise IndexError("dump %d out of range" % dump)
+        return dump
+
+    def names(self):
+        """Names of all the stats."""
+        return list(self.history)
+
+    def value(self, name, dump=-1):
+        """Value of a stat in a dump: a float for scalars, a numpy array
+        for vectors and 2-D vectors, and a dict for distributions and
+        sparse histograms. None if the stat is not in the dump."""
+        dump = self._dump_number(dump)
+        if name not in self.history:
+            return None
+        dumps, entries = self.history[name]
+        last = bisect.bisect_right(dumps, dump) - 1
+        if last < 0 or (not self.delta and dumps[last] != dump):
+            return None
+
+        # replay the updates since the last complete record
+        first = last
+        while entries[first][0] == UPDATE:
+            first -= 1
+        value = self._decode(*entries[first])
+        for tag, offset in entries[first + 1:last + 1]:
+            value = self._update(value, offset)
+        return value
+
+    def dump(self, dump=-1):
+        """All the stats of a dump."""
+        values = {name: self.value(name, dump) for name in self.history}
+        return {name: value for name, value in values.items()
+                if value is not None}
+
+    def series(self, name):
+        """Values of a stat over all dumps, a numpy array (dumps first) for
+        scalars and vectors with NaN where the stat isn't in a dump, and a
+        list for distributions."""
+        values = [None] * len(self.ticks)
+        dumps, entries = self.history.get(name, ([], []))
+        value = None
+        for i, (dump, (tag, offset)) in enumerate(zip(dumps, entries)):
+            if tag == UPDATE:
+                value = self._update(value, offset)
+            else:
+                value = self._decode(tag, offset)
+            # in delta mode a stat keeps its value until its next record
+            end = dump + 1
+            if self.delta:
+                end = dumps[i + 1] if i + 1 < len(dumps) else len(values)
+            values[dump:end] = [value] * (end - dump)
+
+        shapes = {np.shape(v) for v in values if v is not None}
+        if len(shapes) != 1 or any(isinstance(v, dict) for v in values):
+            return values
+        shape = shapes.pop()
+        return np.array([np.full(shape, np.nan) if v is None else v
+                         for v in values], dtype=np.float64)
+
+def main():
+    if len(sys.argv) not in (2, 3):
+        print("Usage: %s <stats.bin> [dump]" % sys.argv[0])
+        exit(-1)
+
+    stats = StatsBinary(sys.argv[1])
+    dump = int(sys.argv[2]) if len(sys.argv) == 3 else -1
+    for name, value in stats.dump(dump).items():
+        if isinstance(value, dict):
+            for key, field in value.items():
+                print("%s::%s %s" % (name, key, field))
+        else:
+            print("%s %s" % (name, value))
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,54 @@
 import os
 import sys
 import argparse
+import hashlib
+import json
+import re
+import bisect
+import itertools
+import time
+import io
+import shutil
+import contextlib
+import concurrent.futures
+import multiprocessing
 import numpy as np
 import math
-from scipy import stats
 from copy import deepcopy
-import matplotlib.pyplot as plt
-import pandas as pd
-import seaborn as sns
-from easypyplot import pdf, barchart
-from easypyplot import format as fmt
 
+# plotting modules, imported by import_plotting() only when figures are drawn
+plt = None
+pd = None
+sns = None
+pdf = None
+barchart = None
+fmt = None
 
-# plot minus sign (for negative numbers) properly
-plt.rcParams['axes.unicode_minus'] = False
+
+def import_plotting(show=False):
+    """Import matplotlib, pandas, seaborn and easypyplot on first use. The
+    Agg backend is forced unless the figures are shown."""
+    global plt, pd, sns, pdf, barchart, fmt
+    if plt is not None:
+        return
+
+    import matplotlib
+    if not show:
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    import pandas as pd
+    import seaborn as sns
+    from easypyplot import pdf, barchart
+    from easypyplot import format as fmt
+
+    # plot minus sign (for negative numbers) properly
+    plt.rcParams['axes.unicode_minus'] = False
+
+
+def gmean(values):
+    """Geometric mean of values, as scipy.stats.mstats.gmean."""
+    with np.errstate(divide="ignore"):
+        return np.exp(np.mean(np.log(np.asarray(values, dtype=np.float64))))
 
 def main():
 
@@ -60,7 +95,8 @@ def main():
                                  "interval-dist", "concurrent-req-hist",
                                  "runtime", "traffic", "filter-dist",
                                  "prepush", "misses", "all", "motivation", "sensitivity",
-                                 "link-load", "runtime-link-widths", "runtime-cache-size"],
+                                 "link-load", "runtime-link-widths", "runtime-cache-size",
+                                 "export"],
                         help="Sharer stat process actions")
     parser.add_argument("--link-widths", type=int, nargs="*",
                         default=[64, 128, 256, 512],
@@ -108,7 +144,16 @@ def main():
     parser.add_argument("--disable-pdf", default=False, action="store_true",
                         help="Disable pdf generation")
     parser.add_argument("--new", default=False, action="store_true",
-                        help="Process new stats without reusing the stored npy")
+                        help="Process new stats without reusing the stats cache")
+    parser.add_argument("--cache-dir", default=".stats-cache", type=str,
+                        help="Directory caching the parsed stats.txt files, "
+                             "empty to disable it [Default: .stats-cache]")
+    parser.add_argument("--cache-size", default=1024, type=int,
+                        help="Size bound of the stats cache in MByte, least "
+                             "recently used runs are evicted [Default: 1024]")
+    parser.add_argument("--jobs", default=1, type=int,
+                        help="Number of processes parsing the stats.txt files "
+                             "in parallel, plotting stays serial [Default: 1]")
     parser.add_argument("--use-99percent", default=False, action="store_true",
                         help="Use 99%% data for access-interval-hist")
     parser.add_argument("--fig-dir", default="figures", type=str,
@@ -121,9 +166,47 @@ def main():
                         help="Print in CSV format")
     parser.add_argument("--npy-result-file", default=None, type=str,
                         help="Result file name")
+    parser.add_argument("--export-file", default="stats.parquet", type=str,
+                        help="Table written by the export action, Feather "
+                             "for a .feather/.arrow suffix and Parquet "
+                             "otherwise [Default: stats.parquet]")
+    parser.add_argument("--export-stats", type=str, nargs="*", default=None,
+                        help="SimObject groups exported by the export action, "
+                             "e.g. system.ruby.network$ [Default: all stats]")
+    parser.add_argument("--watch", default=False, action="store_true",
+                        help="Keep polling the stats.txt files of the action "
+                             "and rerun it whenever runs finish, until all of "
+                             "them are finished")
+    parser.add_argument("--watch-interval", default=300, type=int,
+                        help="Polling interval of --watch in seconds "
+                             "[Default: 300]")
+    parser.add_argument("--manifest", default=None, type=str,
+                        help="Figure manifest (JSON) to render in a single "
+                             "run instead of --action, see figures.json")
+    parser.add_argument("--figures", type=str, nargs="*", default=None,
+                        help="Ids of the manifest figures to render "
+                             "[Default: all of them]")
 
     args = parser.parse_args()
 
+    configure_stats_cache(args.cache_dir, args.cache_size, refresh=args.new)
+
+    if args.manifest is not None:
+        manifest_action(args, parser)
+    elif args.watch:
+        watch_action(args)
+    else:
+        if args.jobs > 1:
+            prefetch_stats(action_stats_files(args), args.jobs)
+        run_action(args)
+        report_missing_stats()
+
+
+def run_action(args):
+    # prepush and motivation plot regardless of --plot
+    if args.plot or args.show or args.action in ("prepush", "motivation"):
+        import_plotting(args.show)
+
     if args.action == "sharer-histogram":
         results = process_sharer_histogram(args)
         if args.plot:
@@ -310,12 +393,256 @@ def main():
             plot_load_interval(args, all_results)
             #plot_runtime_link_widths(args, results)
 
+    elif args.action == "export":
+        if args.m5out_dir is None or not os.path.exists(args.m5out_dir):
+            print(f"Error: m5out directory {args.m5out_dir} not exists!")
+            exit(1)
+        export_action(args)
+
     elif args.action is None:
         print(f"Action option '--action' not provided")
     else:
         print(f"Error: unknown action {args.action}")
 
 
+def watch_action(args):
+    """Rerun the action each time one of its stats.txt files finishes or
+    changes. Unchanged runs stay parsed in _stats_store, so a round only
+    ingests the new runs, and the unfinished ones are reported as missing."""
+    signatures = None
+    while True:
+        files = action_stats_files(args)
+        current = {filename: stats_signature(filename) for filename in files}
+
+        if current != signatures:
+            for filename, signature in current.items():
+                if signatures is not None and \
+                        signature != signatures.get(filename):
+                    _stats_store.pop(filename, None)
+                    _stats_index.pop(filename, None)
+            if args.jobs > 1:
+                prefetch_stats(files, args.jobs)
+
+            num_finished = sum(signature is not None
+                               for signature in current.values())
+            print(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] {num_finished}/"
+                  f"{len(current)} runs finished, processing {args.action}")
+            run_action(args)
+            report_missing_stats()
+            if plt is not None:
+                plt.close("all")
+
+            signatures = current
+            if num_finished == len(current):
+                break
+
+        time.sleep(args.watch_interval)
+
+
+def manifest_argv(options):
+    """Command line arguments of a manifest figure's options."""
+    argv = []
+    for option, value in options.items():
+        if value is True:
+            argv.append(f"--{option}")
+        elif value is False or value is None:
+            continue
+        elif isinstance(value, list):
+            argv.append(f"--{option}")
+            argv.extend(str(v) for v in value)
+        else:
+            argv.append(f"--{option}={value}")
+    return argv
+
+
+def render_figure(figure, args, reproduce_dir):
+    """Run the action of a manifest figure and copy its outputs, returning
+    what the action printed."""
+    os.makedirs(args.fig_dir, exist_ok=True)
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        try:
+            run_action(args)
+        except SystemExit:
+            # the actions exit(1) on a missing m5out directory
+            raise RuntimeError(output.getvalue().strip())
+    if plt is not None:
+        plt.close("all")
+
+    for src, dst in figure.get("copy", {}).items():
+        os.makedirs(reproduce_dir, exist_ok=True)
+        shutil.copy(os.path.join(args.fig_dir, src),
+                    os.path.join(reproduce_dir, dst))
+    return output.getvalue()
+
+
+def manifest_action(args, parser):
+    """Render the figures of a manifest in one process: the runs of all the
+    figures are loaded once into _stats_store, then the figures are rendered
+    by up to args.jobs forked workers sharing the parsed records."""
+    with open(args.manifest, "r") as f:
+        manifest = json.load(f)
+    reproduce_dir = manifest.get("reproduce-dir", "figures/reproduce")
+
+    figures = []
+    for figure in manifest["figures"]:
+        if args.figures is not None and figure["id"] not in args.figures:
+            continue
+        options = dict(manifest.get("defaults", {}))
+        for preset in figure.get("presets", []):
+            options.update(manifest["presets"][preset])
+        options.update(figure["args"])
+        figures.append((figure, parser.parse_args(manifest_argv(options))))
+
+    files = {}
+    for _, figure_args in figures:
+        for filename, groups in action_stats_files(figure_args).items():
+            if groups is None or files.get(filename, ()) is None:
+                files[filename] = None
+            else:
+                files[filename] = tuple(dict.fromkeys(
+                        files.get(filename, ()) + groups))
+    if args.jobs > 1:
+        prefetch_stats(files, args.jobs)
+    for filename, groups in files.items():
+        load_stats(filename, groups)
+    print(f"Loaded {len(files)} runs for {len(figures)} figures")
+    report_missing_stats()
+
+    failed = []
+    if args.jobs > 1 and len(figures) > 1:
+        # forked workers inherit _stats_store without pickling it
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers=min(args.jobs, len(figures)),
+                mp_context=multiprocessing.get_context("fork")) as executor:
+            futures = [executor.submit(render_figure, figure, figure_args,
+                                       reproduce_dir)
+                       for figure, figure_args in figures]
+            for (figure, _), future in zip(figures, futures):
+                try:
+                    print(future.result(), end="")
+                except Exception as e:
+                    print(f"Error: figure {figure['id']}: {e!r}")
+                    failed.append(figure["id"])
+    else:
+        for figure, figure_args in figures:
+            try:
+                print(render_figure(figure, figure_args, reproduce_dir),
+                      end="")
+            except Exception as e:
+                print(f"Error: figure {figure['id']}: {e!r}")
+                failed.append(figure["id"])
+
+    if failed:
+        print(f"Failed figures: {' '.join(failed)}")
+        exit(1)
+
+
+def export_runs(m5out_dir):
+    """Finished runs of an m5out tree as (stats.txt, scheme, benchmark, ncpu,
+    link width, l2 size) in sorted order, the link width and l2 size being
+    None when the run uses the default configuration. The tree layout is
+    [<l2 size>kB/][link-<width>bits/]<scheme>/<benchmark>-<ncpu>cpus/."""
+    runs = []
+    for root, dirs, files in os.walk(m5out_dir):
+        dirs.sort()
+        if "stats.txt" not in files:
+            continue
+        parts = os.path.relpath(root, m5out_dir).split(os.sep)
+        if len(parts) < 2 or not parts[-1].endswith("cpus"):
+            continue
+        benchmark, _, ncpu = parts[-1][:-len("cpus")].rpartition("-")
+        link_width = l2_size = None
+        for part in parts[:-2]:
+            if part.startswith("link-") and part.endswith("bits"):
+                link_width = int(part[len("link-"):-len("bits")])
+            elif part.endswith("kB"):
+                l2_size = int(part[:-len("kB")])
+        if not ncpu.isdigit():
+            continue
+        runs.append((os.path.join(root, "stats.txt"), parts[-2], benchmark,
+                     int(ncpu), link_width, l2_size))
+    return runs
+
+
+def export_columns(record):
+    """(stat, subindex, value) columns of a parsed record: the scalar stats
+    have no subindex, the one-line vectors have a row per bucket value."""
+    stats = list(record["names"])
+    subindex = [None] * len(stats)
+    values = [record["values"]]
+    for name, vector in record["vectors"].items():
+        stats.extend([name] * vector.shape[1])
+        subindex.extend(range(vector.shape[1]))
+        values.append(vector[0])
+    return stats, subindex, np.concatenate(values)
+
+
+def export_action(args):
+    """Write the stats of every finished run of the m5out tree to a long
+    format Parquet or Feather table, a row per (scheme, benchmark, ncpu,
+    link_width, l2_size, stat, subindex) and its value. Runs are parsed and
+    written one at a time, only a single record is held in memory."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        print("Error: the export action requires pyarrow, "
+              "install it with 'pip3 install pyarrow'")
+        exit(1)
+
+    schema = pa.schema([
+        ("scheme", pa.string()),
+        ("benchmark", pa.string()),
+        ("ncpu", pa.int32()),
+        ("link_width", pa.int32()),
+        ("l2_size", pa.int32()),
+        ("stat", pa.string()),
+        ("subindex", pa.int32()),
+        ("value", pa.float64()),
+    ])
+
+    filename = args.export_file
+    if filename.endswith((".feather", ".arrow")):
+        writer = pa.ipc.new_file(filename, schema)
+    else:
+        writer = pq.ParquetWriter(filename, schema, compression="zstd")
+
+    # every run is read once, its records would only fill the on-disk cache
+    # and evict the entries of the other actions
+    configure_stats_cache(None, 0)
+
+    num_runs = 0
+    num_rows = 0
+    with writer:
+        for statsfile, scheme, benchmark, ncpu, link_width, l2_size in \
+                export_runs(args.m5out_dir):
+            record = load_stats(statsfile, args.export_stats)
+            # the records are not reused, keep only the one being written
+            _stats_store.pop(statsfile, None)
+            _stats_index.pop(statsfile, None)
+            if stats_missing(record):
+                continue
+
+            stats, subindex, values = export_columns(record)
+            num = len(stats)
+            batch = pa.record_batch([
+                pa.array([scheme] * num, pa.string()),
+                pa.array([benchmark] * num, pa.string()),
+                pa.array([ncpu] * num, pa.int32()),
+                pa.array([link_width] * num, pa.int32()),
+                pa.array([l2_size] * num, pa.int32()),
+                pa.array(stats, pa.string()),
+                pa.array(subindex, pa.int32()),
+                pa.array(values, pa.float64()),
+            ], schema=schema)
+            writer.write_batch(batch)
+            num_runs += 1
+            num_rows += num
+
+    print(f"Exported {num_rows} stats of {num_runs} runs to {filename}")
+
+
 def add_line(ax, xpos1, ypos1, xpos2, ypos2):
     line = plt.Line2D(
             [xpos1, xpos2], [ypos1, ypos2],
@@ -360,173 +687,760 @@ def add_xaxis_line(ax, xpos, ypos):
     ax.add_line(line)
 
 
-def process_sharer_histogram(args):
-    result_filename = f"{args.benchmark}_sharer_histogram.npy"
-
-    if not args.new and os.path.exists(result_filename):
-        results = np.load(result_filename, allow_pickle=True)
-        results = results[()]
+# Each stats.txt is parsed once into a columnar record and kept in
+# _stats_store, so the process_* actions query the same parsed run instead
+# of rescanning the text file for every stat they need.
+_stats_store = {}
+
+# stats.txt files found missing or unfinished, their stats are all NaN
+_missing_stats = set()
+
+# Byte ranges of the stats of every SimObject in a stats.txt, built by
+# index_stats_file, so a run can be read only for the objects an action needs
+# instead of parsing hundreds of MB of per-router and per-link stats.
+_stats_index = {}
+
+# Parsed records are also kept across invocations in an on-disk cache of .npz
+# files, so re-plotting only parses the runs that changed since last time.
+# Bump PARSER_VERSION whenever the record produced by parse_stats_file changes.
+# "bytes" is a running total of the cache size, so the directory is only
+# scanned when it may exceed its bound (None until the first scan).
+PARSER_VERSION = 3
+_stats_cache = {"dir": None, "max_bytes": 0, "refresh": False, "bytes": None}
+
+# SimObject groups read by the process_* actions, matched against the object
+# path of the stats like the stat keys (a trailing '$' anchors the end). The
+# global stats (sim_seconds, sim_ticks, sim_insts, ...) are always loaded.
+GLOBAL_STATS = ()
+NETWORK_STATS = ("system.ruby.network$",)
+TRAFFIC_STATS = ("system.ruby.network$", "system.cpu_clk_domain$")
+LINK_LOAD_STATS = ("networklinks",)
+MISSES_STATS = ("l0_cntrl", "l1_cntrl")
+L1CACHE_STATS = ("system.ruby.L1Cache$",)
+LLC_STATS = ("LLC$",)
+
+
+def stat_object(name):
+    """SimObject path of a stat name, empty for the global stats."""
+    return name.partition("::")[0].rpartition(".")[0]
+
+
+def _parse_stats_line(line, record):
+    stat, _, desc = line.partition(" # ")
+    if "|" in stat:
+        # one-line vector or distribution: name | v pdf cdf | ...
+        fields = stat.split("|")
+        name = fields[0].strip()
+        vector = np.full((3, len(fields) - 1), np.nan)
+        for i, field in enumerate(fields[1:]):
+            tokens = field.split()
+            for j, token in enumerate(tokens[:3]):
+                vector[j][i] = float(token.rstrip("%"))
+        record["vectors"].setdefault(name, vector)
+        record["descs"].setdefault(name, desc.strip())
+        return
+
+    tokens = stat.split()
+    if len(tokens) < 2:
+        return
+    try:
+        value = float(tokens[1])
+    except ValueError:
+        return
+    record["names"].append(tokens[0])
+    record["values"].append(value)
+    if tokens[0].endswith("::total"):
+        record["descs"].setdefault(tokens[0], desc.strip())
+
+
+def parse_stats_file(filename, index=None, groups=None):
+    """Parse the first statistics dump of a gem5 stats.txt.
+
+    The record keeps scalar stat names in file order with their values in a
+    float64 column, and one-line vectors/histograms as (3, n) arrays of
+    bucket values, pdf and cdf (in percent). Descriptions are only kept for
+    vector totals, which carry the coherence message type names.
+
+    With groups, only the byte ranges of the SimObjects of the index matching
+    them are read, and the record lists them in "groups" (None for the whole
+    dump).
+    """
+    record = {"names": [], "values": [], "vectors": {}, "descs": {},
+              "groups": None}
+
+    with open(filename, "rb") as statsfile:
+        if groups is None:
+            for line in statsfile:
+                if b"End Simulation Statistics" in line:
+                    break
+                _parse_stats_line(line.decode(), record)
+        else:
+            record["groups"] = sorted(groups)
+            ranges = sorted(byte_range
+                            for obj in select_stat_objects(index, groups)
+                            for byte_range in index["ranges"].get(obj, []))
+            for start, end in ranges:
+                statsfile.seek(start)
+                for line in statsfile.read(end - start).decode().splitlines():
+                    _parse_stats_line(line, record)
+
+    record["values"] = np.array(record["values"], dtype=np.float64)
+
+    return record
+
+
+def stat_owner(obj):
+    """Top-level controller, router or link owning a SimObject: its path up
+    to the first numbered component, the object itself without one."""
+    parts = obj.split(".")
+    for i, part in enumerate(parts):
+        if part[-1:].isdigit():
+            return ".".join(parts[:i + 1])
+    return obj
+
+
+def index_stats_file(filename):
+    """Index of the first dump of a stats.txt. Only the stat names are split,
+    which is much cheaper than parsing the values and vectors of the whole
+    dump.
+
+    The byte ranges [start, end) are kept per owner (see stat_owner), so the
+    ports and buffers of a router or controller share one entry. The sorted
+    SimObject names are kept as one newline separated string, with the owner
+    of each of them, for select_stat_objects.
+    """
+    index = {}
+    offset = 0
+
+    with open(filename, "rb") as statsfile:
+        for line in statsfile:
+            if b"End Simulation Statistics" in line:
+                break
+
+            tokens = line.split(None, 1)
+            if len(tokens) == 2 and not tokens[0].startswith(b"-"):
+                ranges = index.setdefault(stat_object(tokens[0].decode()), [])
+                if ranges and ranges[-1][1] == offset:
+                    ranges[-1][1] = offset + len(line)
+                else:
+                    ranges.append([offset, offset + len(line)])
+            offset += len(line)
+
+    ranges = {}
+    for obj in sorted(index, key=lambda obj: index[obj][0][0]):
+        owner_ranges = ranges.setdefault(stat_owner(obj), [])
+        for start, end in index[obj]:
+            if owner_ranges and owner_ranges[-1][1] == start:
+                owner_ranges[-1][1] = end
+            else:
+                owner_ranges.append([start, end])
+
+    names = sorted(obj for obj in index if obj != "")
+    owners = list(ranges)
+    owner_ids = {owner: i for i, owner in enumerate(owners)}
+    return {"names": "\n".join(names), "owners": owners,
+            "name_owners": [owner_ids[stat_owner(obj)] for obj in names],
+            "ranges": ranges}
+
+
+def select_stat_objects(index, groups):
+    """Owners in the index of the SimObjects matching any of the groups, plus
+    the global stats. Each group is searched once through the joined names
+    instead of being matched against every SimObject."""
+    names = index["names"]
+    starts = [0] + list(itertools.accumulate(
+        len(name) + 1 for name in names.split("\n")))
+    objects = {""}
+    for group in groups:
+        if group.endswith("$"):
+            pattern = re.compile(re.escape(group[:-1]) + "$", re.MULTILINE)
+        else:
+            pattern = re.compile(re.escape(group))
+        for match in pattern.finditer(names):
+            i = bisect.bisect_right(starts, match.start()) - 1
+            objects.add(index["owners"][index["name_owners"][i]])
+    return objects
+
+
+def configure_stats_cache(directory, max_mbytes, refresh=False):
+    """Enable the on-disk record cache in directory (None disables it)."""
+    _stats_cache["dir"] = directory if directory else None
+    _stats_cache["max_bytes"] = max_mbytes * 1024 * 1024
+    _stats_cache["refresh"] = refresh
+    _stats_cache["bytes"] = None
+
+
+def stats_cache_file(filename, suffix=".npz"):
+    """Cache entry of a stats.txt, keyed by its path, size, mtime and the
+    parser version, so a rewritten file never hits a stale record."""
+    info = os.stat(filename)
+    key = f"{os.path.abspath(filename)}:{info.st_size}:{info.st_mtime_ns}:" \
+          f"{PARSER_VERSION}"
+    digest = hashlib.sha1(key.encode()).hexdigest()
+    return f"{_stats_cache['dir']}/{digest}{suffix}"
+
+
+def write_cache_entry(cachefile, write):
+    os.makedirs(os.path.dirname(cachefile), exist_ok=True)
+    # write aside and rename, concurrent readers never see a partial entry
+    tmpfile = f"{cachefile}.{os.getpid()}.tmp"
+    with open(tmpfile, "wb") as f:
+        write(f)
+    os.replace(tmpfile, cachefile)
+
+    if _stats_cache["bytes"] is None:
+        evict_stats_cache(keep=cachefile)
     else:
-        results = {}
+        # other processes write to the cache too, the total is corrected by
+        # the scan of the eviction
+        _stats_cache["bytes"] += os.path.getsize(cachefile)
+        if _stats_cache["bytes"] > _stats_cache["max_bytes"]:
+            evict_stats_cache(keep=cachefile)
+
+
+def save_stats_record(cachefile, record):
+    arrays = {
+        "names": np.array(record["names"], dtype=str),
+        "values": record["values"],
+        "vector_names": np.array(list(record["vectors"]), dtype=str),
+        "desc_names": np.array(list(record["descs"]), dtype=str),
+        "desc_values": np.array(list(record["descs"].values()), dtype=str),
+        "partial": np.array(record["groups"] is not None),
+        "groups": np.array(record["groups"] or [], dtype=str),
+    }
+    for i, vector in enumerate(record["vectors"].values()):
+        arrays[f"vector{i}"] = vector
+
+    write_cache_entry(cachefile, lambda f: np.savez(f, **arrays))
+
+
+def load_stats_record(cachefile):
+    with np.load(cachefile) as data:
+        vector_names = data["vector_names"].tolist()
+        record = {
+            "names": data["names"].tolist(),
+            "values": data["values"],
+            "vectors": {name: data[f"vector{i}"]
+                        for i, name in enumerate(vector_names)},
+            "descs": dict(zip(data["desc_names"].tolist(),
+                              data["desc_values"].tolist())),
+            "groups": data["groups"].tolist() if data["partial"] else None,
+        }
+
+    # the mtime of an entry is its last use for the LRU eviction
+    os.utime(cachefile)
+
+    return record
+
+
+def evict_stats_cache(keep=None):
+    """Remove the least recently used entries beyond the cache size bound."""
+    directory = _stats_cache["dir"]
+    entries = []
+    total_bytes = 0
+    for entry in os.scandir(directory):
+        if not entry.name.endswith((".npz", ".json")):
+            continue
+        try:
+            info = entry.stat()
+        except FileNotFoundError:
+            continue  # evicted by another process meanwhile
+        entries.append((info.st_mtime, info.st_size, entry.path))
+        total_bytes += info.st_size
+
+    # evict down to 90% of the bound, a full cache is not scanned again on
+    # the next write
+    target_bytes = _stats_cache["max_bytes"]
+    if total_bytes > target_bytes:
+        target_bytes *= 0.9
+    entries.sort()
+    for _, size, path in entries:
+        if total_bytes <= target_bytes:
+            break
+        if path == keep:
+            continue
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total_bytes -= size
+    _stats_cache["bytes"] = total_bytes
+
+
+def stats_path(args, scheme, benchmark, ncpu=None, link_width=None,
+               cache_size=None):
+    """Path of the stats.txt of one run in the m5out result tree."""
+    if ncpu is None:
+        ncpu = args.ncpu
+    directory = args.m5out_dir
+    if cache_size is not None:
+        directory = f"{directory}/{cache_size}kB"
+        if link_width is None:
+            link_width = 128
+    if link_width is not None:
+        directory = f"{directory}/link-{link_width}bits"
+    return f"{directory}/{scheme}/{benchmark}-{ncpu}cpus/stats.txt"
+
+
+def stats_signature(filename):
+    """(size, mtime) of a finished stats.txt, None while it is missing or its
+    last dump has not been completely written yet."""
+    try:
+        info = os.stat(filename)
+        # a finished run ends with the end marker of its last stats dump
+        with open(filename, "rb") as statsfile:
+            statsfile.seek(max(info.st_size - 4096, 0))
+            if b"End Simulation Statistics" in statsfile.read():
+                return info.st_size, info.st_mtime_ns
+    except OSError:
+        pass
+    return None
+
+
+def report_missing_stats():
+    for filename in sorted(_missing_stats):
+        print(f"Missing: {filename} is not finished, its results are NaN")
+    _missing_stats.clear()
+
+
+def load_stats_index(filename):
+    """Return the SimObject index of a stats.txt (see index_stats_file),
+    scanning it on first use unless it is found next to the records in the
+    on-disk cache."""
+    index = _stats_index.get(filename)
+    if index is not None:
+        return index
+
+    indexfile = None
+    if _stats_cache["dir"] is not None:
+        indexfile = stats_cache_file(filename, ".index.json")
+        if not _stats_cache["refresh"] and os.path.exists(indexfile):
+            try:
+                with open(indexfile, "r") as f:
+                    index = json.load(f)
+                os.utime(indexfile)
+            except (OSError, ValueError):
+                index = None
+
+    if index is None:
+        index = index_stats_file(filename)
+        if indexfile is not None:
+            write_cache_entry(indexfile,
+                              lambda f: f.write(json.dumps(index).encode()))
+
+    _stats_index[filename] = index
+    return index
+
+
+def _record_covers(record, groups):
+    if record is None:
+        return False
+    if record["groups"] is None:
+        return True
+    return groups is not None and set(groups).issubset(record["groups"])
+
+
+def load_stats(filename, groups=None):
+    """Return the parsed record of a stats.txt.
+
+    Without groups the whole first dump is parsed. With groups, only the
+    SimObjects matching them are read by seeking through the index of the
+    file, and the record grows when a later action asks for more groups.
+    Records are reused from _stats_store and from the on-disk cache, the
+    index is only loaded when neither of them covers the groups.
+    """
+    record = _stats_store.get(filename)
+    if _record_covers(record, groups):
+        return record
+    if record is None and stats_signature(filename) is None:
+        _missing_stats.add(filename)
+        return {"names": [], "values": np.zeros(0), "vectors": {}, "descs": {},
+                "groups": None, "missing": True}
+
+    cachefile = None
+    if _stats_cache["dir"] is not None:
+        cachefile = stats_cache_file(filename)
+        if record is None and not _stats_cache["refresh"] and \
+                os.path.exists(cachefile):
+            try:
+                record = load_stats_record(cachefile)
+            except (OSError, KeyError, ValueError):
+                # a corrupted entry is parsed again and overwritten
+                record = None
+            if _record_covers(record, groups):
+                _stats_store[filename] = record
+                return record
+
+    index = None
+    if groups is not None:
+        if record is not None:
+            groups = set(groups).union(record["groups"])
+        index = load_stats_index(filename)
+    record = parse_stats_file(filename, index, groups)
+    if cachefile is not None:
+        save_stats_record(cachefile, record)
+
+    _stats_store[filename] = record
+    return record
+
+
+def _load_stats_worker(filename, groups):
+    record = load_stats(filename, groups)
+    return filename, _stats_index.get(filename), record
+
+
+def prefetch_stats(files, jobs):
+    """Parse the stats.txt files (a dict of filename to SimObject groups, see
+    load_stats) over a pool of jobs processes and merge the records into
+    _stats_store, the process_* actions then only read it."""
+    files = {filename: groups for filename, groups in files.items()
+             if filename not in _stats_store and
+             stats_signature(filename) is not None}
+    if len(files) == 0:
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(
+            max_workers=min(jobs, len(files)),
+            initializer=configure_stats_cache,
+            initargs=(_stats_cache["dir"],
+                      _stats_cache["max_bytes"] // (1024 * 1024),
+                      _stats_cache["refresh"])) as executor:
+        futures = [executor.submit(_load_stats_worker, filename, groups)
+                   for filename, groups in files.items()]
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                filename, index, record = future.result()
+            except Exception:
+                # left to the serial path, which reports the error
+                continue
+            if index is not None:
+                _stats_index[filename] = index
+            _stats_store[filename] = record
+
+    # every worker only bounds the cache by its own writes
+    if _stats_cache["dir"] and os.path.isdir(_stats_cache["dir"]):
+        evict_stats_cache()
 
-        # preprocess results
-        for num_cpu in args.num_cpus:
 
-            max_end_nonzero_idx = 0
+def action_stats_files(args):
+    """The stats.txt files read by the processing of args.action, mapped to
+    the SimObject groups it queries in them."""
+    action = args.action
+    files = {}
+
+    def add(filename, groups):
+        if groups is None or files.get(filename, ()) is None:
+            files[filename] = None
+        else:
+            files[filename] = tuple(dict.fromkeys(
+                    files.get(filename, ()) + groups))
 
+    if action in ("sharer-histogram", "access-interval-hist"):
+        for num_cpu in args.num_cpus:
             for window_cycle in args.window_cycles:
-                config = f"{num_cpu}cpus-{window_cycle}window"
+                add(f"{args.benchmark}-{num_cpu}cpus-{window_cycle}window"
+                    f"/stats.txt", LLC_STATS)
+    elif action == "concurrent-req-hist":
+        for benchmark in args.benchmark_list:
+            add(f"{args.m5out_dir}/{benchmark}-16cpus/stats.txt", None)
+    elif action == "link-load":
+        for scheme in args.scheme_list:
+            add(stats_path(args, scheme, args.benchmark), LINK_LOAD_STATS)
+    elif action == "runtime-link-widths":
+        for scheme in args.scheme_list:
+            for benchmark in args.benchmark_list:
+                for link_width in args.link_widths:
+                    add(stats_path(args, scheme, benchmark,
+                                   link_width=link_width), GLOBAL_STATS)
+    elif action == "runtime-cache-size":
+        for scheme in args.scheme_list:
+            for benchmark in args.benchmark_list:
+                for cache_size in args.cache_sizes:
+                    add(stats_path(args, scheme, benchmark,
+                                   cache_size=cache_size), GLOBAL_STATS)
+    elif action in ("filter-dist", "prepush"):
+        schemes = [args.prepush_scheme] if action == "filter-dist" else \
+                [scheme for scheme in args.scheme_list if "prepush" in scheme]
+        for scheme in schemes:
+            for benchmark in args.benchmark_list:
+                add(stats_path(args, scheme, benchmark),
+                    NETWORK_STATS + L1CACHE_STATS)
+    elif action in ("runtime", "sensitivity", "traffic", "misses",
+                    "motivation", "all"):
+        groups = NETWORK_STATS + MISSES_STATS
+        if action in ("traffic", "motivation", "all"):
+            groups += TRAFFIC_STATS
+        if action == "all":
+            groups += L1CACHE_STATS
+        ncpus = [args.ncpu]
+        if action in ("runtime", "all") and len(args.num_cpus) > 1:
+            ncpus += args.num_cpus
+        for ncpu in ncpus:
+            for scheme in args.scheme_list:
+                for benchmark in args.benchmark_list:
+                    add(stats_path(args, scheme, benchmark, ncpu), groups)
+
+    return files
+
+
+def stats_missing(record):
+    return record.get("missing", False)
+
+
+def stats_empty(record):
+    return not stats_missing(record) and len(record["names"]) == 0
+
+
+def _stat_matches(name, keys):
+    # a key ending with '$' has to match the end of the stat name
+    for key in keys:
+        if key.endswith("$"):
+            if not name.endswith(key[:-1]):
+                return False
+        elif key not in name:
+            return False
+    return True
 
-                filename = f"{args.benchmark}-{config}/stats.txt"
-                statsfile = open(filename, 'r')
 
-                histogram = []
+def stat_items(record, *keys):
+    """All (name, value) scalar stats whose names contain all the keys."""
+    return [(name, record["values"][i])
+            for i, name in enumerate(record["names"])
+            if _stat_matches(name, keys)]
 
-                for l, line in enumerate(statsfile):
-                    if "LLC.sharer_histogram" in line and "::" not in line:
-                        line = line.split()
 
-                        for i in range(6, len(line), 4):
-                            histogram.append(int(line[i]))
-                            #if line[i + 2] == "100.00%":
-                            #    break
+def stat_value(record, *keys, default=0):
+    """Value of the first scalar stat whose name contains all the keys,
+    NaN for a missing run."""
+    if stats_missing(record):
+        return math.nan
+    for i, name in enumerate(record["names"]):
+        if _stat_matches(name, keys):
+            return float(record["values"][i])
+    return default
 
-                        break
 
-                reversed_histogram = np.array(histogram[::-1])
-                length = len(histogram) - np.argmax(reversed_histogram > 0)
-                results[config] = np.array(histogram[:length])
+def stat_sum(record, *keys):
+    """Sum of every scalar stat whose name contains all the keys, NaN for a
+    missing run."""
+    if stats_missing(record):
+        return math.nan
+    return float(sum(value for _, value in stat_items(record, *keys)))
 
-                if args.verbose:
-                    print(f"{config}: {histogram[:length]}")
 
-                statsfile.close()
+def stat_count(value):
+    """int of a counter stat value, keeping the NaN of missing runs."""
+    return value if math.isnan(value) else int(value)
 
-        np.save(result_filename, results)
+
+def stat_vector(record, *keys):
+    """Bucket values, pdf and cdf of the first matching one-line stat."""
+    for name, vector in record["vectors"].items():
+        if _stat_matches(name, keys):
+            return vector
+    return np.zeros((3, 0), dtype=np.float64)
+
+
+def stat_desc(record, *keys):
+    for name, desc in record["descs"].items():
+        if _stat_matches(name, keys):
+            return desc
+    return ""
+
+
+def process_sharer_histogram(args):
+    results = {}
+
+    # preprocess results
+    for num_cpu in args.num_cpus:
+
+        max_end_nonzero_idx = 0
+
+        for window_cycle in args.window_cycles:
+            config = f"{num_cpu}cpus-{window_cycle}window"
+
+            filename = f"{args.benchmark}-{config}/stats.txt"
+            run = load_stats(filename, LLC_STATS)
+
+            values, _, _ = stat_vector(run, "LLC.sharer_histogram")
+            histogram = [int(value) for value in values[1:]]
+
+            reversed_histogram = np.array(histogram[::-1])
+            length = len(histogram) - np.argmax(reversed_histogram > 0)
+            results[config] = np.array(histogram[:length])
+
+            if args.verbose:
+                print(f"{config}: {histogram[:length]}")
 
     return results
 
 
+def access_interval_histogram(run, key):
+    """Buckets of an access interval histogram up to its 100% cdf, with the
+    percentage of every bucket and of the buckets within the 99% cdf."""
+    results = []
+    percent_dist = []
+    percent_99dist = []
+
+    for value, percent, cumulative in zip(*stat_vector(run, key)):
+        results.append(int(value))
+        percent_dist.append(percent)
+        if cumulative <= 99.0:
+            percent_99dist.append(percent)
+        if cumulative == 100.0:
+            break
+
+    return results, percent_dist, percent_99dist
+
+
 def process_access_interval_histogram(args):
-    result_filename = f"{args.benchmark}_sharer_access_interval.npy"
+    results = {}
 
-    if not args.new and os.path.exists(result_filename):
-        results = np.load(result_filename, allow_pickle=True)
-        results = results[()]
+    # preprocess results
+    for num_cpu in args.num_cpus:
+        for window_cycle in args.window_cycles:
+            config = f"{num_cpu}cpus-{window_cycle}window"
 
-        for num_cpu in args.num_cpus:
-            for window_cycle in args.window_cycles:
-                config = f"{num_cpu}cpus-{window_cycle}window"
+            filename = f"{args.benchmark}-{config}/stats.txt"
+            run = load_stats(filename, LLC_STATS)
+
+            avg_results, avg_percent_dist, avg_99percent_dist = \
+                    access_interval_histogram(
+                            run, "LLC.sharer_avg_access_interval")
+            min_results, min_percent_dist, min_99percent_dist = \
+                    access_interval_histogram(
+                            run, "LLC.sharer_min_access_interval")
+            max_results, max_percent_dist, max_99percent_dist = \
+                    access_interval_histogram(
+                            run, "LLC.sharer_max_access_interval")
+            end_results, end_percent_dist, end_99percent_dist = \
+                    access_interval_histogram(
+                            run, "LLC.sharer_end_access_interval")
+
+            results[config] = {}
+            results[config]["avg"] = np.array(avg_results)
+            results[config]["avg-percent-dist"] = np.array(avg_percent_dist)
+            results[config]["avg-99percent-dist"] = np.array(avg_99percent_dist)
+            results[config]["min"] = np.array(min_results)
+            results[config]["min-percent-dist"] = np.array(min_percent_dist)
+            results[config]["min-99percent-dist"] = np.array(min_99percent_dist)
+            results[config]["max"] = np.array(max_results)
+            results[config]["max-percent-dist"] = np.array(max_percent_dist)
+            results[config]["max-99percent-dist"] = np.array(max_99percent_dist)
+            results[config]["end"] = np.array(end_results)
+            results[config]["end-percent-dist"] = np.array(end_percent_dist)
+            results[config]["end-99percent-dist"] = np.array(end_99percent_dist)
+
+    return results
+
+
+# The sharer interval samples of sim.log are summarized in log-bucketed
+# histograms: bucket i > 0 counts the intervals in [gamma^(i-1), gamma^i) and
+# bucket 0 the zero intervals. Quantiles are thus within gamma - 1 relative
+# error while the memory stays constant, however many GB the log holds.
+INTERVAL_SKETCH_GAMMA = 1.02
+INTERVAL_SKETCH_BUCKETS = 2400
+
+
+def new_interval_sketch():
+    return {"counts": np.zeros(INTERVAL_SKETCH_BUCKETS, dtype=np.int64),
+            "count": 0, "sum": 0, "min": None, "max": None}
+
+
+def add_interval_samples(sketch, samples):
+    if len(samples) == 0:
+        return
+
+    buckets = np.zeros(len(samples), dtype=np.int64)
+    positive = samples >= 1
+    buckets[positive] = 1 + np.floor(np.log(samples[positive]) /
+            np.log(INTERVAL_SKETCH_GAMMA)).astype(np.int64)
+    np.minimum(buckets, INTERVAL_SKETCH_BUCKETS - 1, out=buckets)
+
+    sketch["counts"] += np.bincount(buckets, minlength=INTERVAL_SKETCH_BUCKETS)
+    sketch["count"] += len(samples)
+    sketch["sum"] += int(samples.sum())
+    low = int(samples.min())
+    high = int(samples.max())
+    sketch["min"] = low if sketch["min"] is None else min(sketch["min"], low)
+    sketch["max"] = high if sketch["max"] is None else max(sketch["max"], high)
+
+
+def interval_bucket_values(sketch):
+    """Representative interval of every bucket, the middle of its range."""
+    values = np.zeros(INTERVAL_SKETCH_BUCKETS, dtype=np.float64)
+    lower = INTERVAL_SKETCH_GAMMA ** np.arange(INTERVAL_SKETCH_BUCKETS - 1)
+    values[1:] = lower * (1 + INTERVAL_SKETCH_GAMMA) / 2
+    if sketch["count"] == 0:
+        # no samples, hence no min and max to clip to
+        return values
+    return np.clip(values, sketch["min"], sketch["max"])
+
+
+def interval_sketch_quantiles(sketch, quantiles):
+    cumulative = np.cumsum(sketch["counts"])
+    targets = np.maximum(np.asarray(quantiles) * sketch["count"], 1)
+    buckets = np.searchsorted(cumulative, targets)
+    return interval_bucket_values(sketch)[buckets]
+
+
+def interval_sketch_violin_stats(sketch, points=100):
+    """Violin statistics of a sketch for matplotlib's Axes.violin, with a
+    Gaussian KDE (Scott's rule) over the bucket counts. None for an empty
+    sketch, which has no violin to draw."""
+    if sketch["count"] == 0:
+        return None
+
+    counts = sketch["counts"]
+    nonzero = counts > 0
+    centers = interval_bucket_values(sketch)[nonzero]
+    weights = counts[nonzero].astype(np.float64)
+
+    coords = np.linspace(sketch["min"], sketch["max"], points)
+    mean = sketch["sum"] / sketch["count"]
+    std = math.sqrt(np.sum(weights * (centers - mean) ** 2) / np.sum(weights))
+    neff = np.sum(weights) ** 2 / np.sum(weights ** 2)
+    bandwidth = std * neff ** (-1.0 / 5)
+    if bandwidth == 0:
+        vals = np.ones(points)
     else:
-        results = {}
+        kernels = np.exp(-0.5 * ((coords[None, :] - centers[:, None]) /
+                                 bandwidth) ** 2)
+        vals = np.sum(weights[:, None] * kernels, axis=0) / \
+                (np.sum(weights) * bandwidth * math.sqrt(2 * math.pi))
+
+    return {"coords": coords, "vals": vals, "mean": mean,
+            "median": interval_sketch_quantiles(sketch, [0.5])[0],
+            "min": sketch["min"], "max": sketch["max"]}
+
+
+def read_interval_trace(logfile):
+    """Yield (stat, num, samples) for every sharer interval line of a sim.log,
+    stat being "request" or "access" and samples an int64 array."""
+    for line in logfile:
+        if "system.ruby.L1.sharer_request_interval" in line:
+            stat = "request"
+        elif "system.ruby.LLC.sharer_access_interval" in line:
+            stat = "access"
+        else:
+            continue
 
-        # preprocess results
-        for num_cpu in args.num_cpus:
-            for window_cycle in args.window_cycles:
-                config = f"{num_cpu}cpus-{window_cycle}window"
+        line = line.split(None, 1)
+        if len(line) == 1:
+            continue
 
-                filename = f"{args.benchmark}-{config}/stats.txt"
-
-                statsfile = open(filename, 'r')
-
-                avg_results = []
-                avg_percent_dist = []
-                avg_99percent_dist = []
-                min_results = []
-                min_percent_dist = []
-                min_99percent_dist = []
-                max_results = []
-                max_percent_dist = []
-                max_99percent_dist = []
-                end_results = []
-                end_percent_dist = []
-                end_99percent_dist = []
-
-                avg_processed = False
-                min_processed = False
-                max_processed = False
-                end_processed = False
-
-                for l, line in enumerate(statsfile):
-                    if "LLC.sharer_avg_access_interval" in line and "::" not in line:
-                        line = line.split()
-
-                        for i in range(2, len(line) - 7, 4):
-                            avg_results.append(int(line[i]))
-                            percent = float(line[i + 1][:-1])
-                            avg_percent_dist.append(percent)
-                            if float(line[i + 2][:-1]) <= 99.0:
-                                avg_99percent_dist.append(percent)
-                            if line[i + 2] == "100.00%":
-                                break
-
-                        avg_processed = True
-
-                    elif "LLC.sharer_min_access_interval" in line and "::" not in line:
-                        line = line.split()
-
-                        for i in range(2, len(line) - 7, 4):
-                            min_results.append(int(line[i]))
-                            percent = float(line[i + 1][:-1])
-                            min_percent_dist.append(percent)
-                            if float(line[i + 2][:-1]) <= 99.0:
-                                min_99percent_dist.append(percent)
-                            if line[i + 2] == "100.00%":
-                                break
-
-                        min_processed = True
-
-                    elif "LLC.sharer_max_access_interval" in line and "::" not in line:
-                        line = line.split()
-
-                        for i in range(2, len(line) - 7, 4):
-                            max_results.append(int(line[i]))
-                            percent = float(line[i + 1][:-1])
-                            max_percent_dist.append(percent)
-                            if float(line[i + 2][:-1]) <= 99.0:
-                                max_99percent_dist.append(percent)
-                            if line[i + 2] == "100.00%":
-                                break
-
-                        max_processed = True
-
-                    elif "LLC.sharer_end_access_interval" in line and "::" not in line:
-                        line = line.split()
-
-                        for i in range(2, len(line) - 7, 4):
-                            end_results.append(int(line[i]))
-                            percent = float(line[i + 1][:-1])
-                            end_percent_dist.append(percent)
-                            if float(line[i + 2][:-1]) <= 99.0:
-                                end_99percent_dist.append(percent)
-                            if line[i + 2] == "100.00%":
-                                break
-
-                        max_processed = True
-
-                    elif avg_processed and min_processed and \
-                            max_processed and end_processed:
-                        break
-
-                results[config] = {}
-                results[config]["avg"] = np.array(avg_results)
-                results[config]["avg-percent-dist"] = np.array(avg_percent_dist)
-                results[config]["avg-99percent-dist"] = np.array(avg_99percent_dist)
-                results[config]["min"] = np.array(min_results)
-                results[config]["min-percent-dist"] = np.array(min_percent_dist)
-                results[config]["min-99percent-dist"] = np.array(min_99percent_dist)
-                results[config]["max"] = np.array(max_results)
-                results[config]["max-percent-dist"] = np.array(max_percent_dist)
-                results[config]["max-99percent-dist"] = np.array(max_99percent_dist)
-                results[config]["end"] = np.array(end_results)
-                results[config]["end-percent-dist"] = np.array(end_percent_dist)
-                results[config]["end-99percent-dist"] = np.array(end_99percent_dist)
-
-                statsfile.close()
-
-            np.save(result_filename, results)
+        try:
+            num = int(line[0].split(':')[2])
+            samples = np.array(line[1].split(), dtype=np.int64)
+        except (IndexError, ValueError):
+            # e.g. the last line of a killed run, cut while being written
+            print(f"Warning: skipping malformed interval line in "
+                  f"{logfile.name}: {' '.join(line).strip()[:80]!r}")
+            continue
+        if len(samples) == 0:
+            continue
 
-    return results
+        yield stat, num, samples
 
 
 def process_interval_distribution(args):
@@ -539,63 +1453,23 @@ def process_interval_distribution(args):
             print(f"Error: Input log file {args.logfile} not exists!")
             exit(1)
 
-        logfile = open(args.logfile, 'r')
-
-        results = {"Request Interval (Cycle)": [], "Consecutive Request Pair": [],
-                   "First-to-Last Request Interval (Cycle)": [],
-                   "Access Interval (Cycle)": [], "Consecutive Access Pair": [],
-                   "First-to-Last Access Interval (Cycle)": []}
-
-        for l, line in enumerate(logfile):
-            if "system.ruby.L1.sharer_request_interval" in line:
-                line = line.split()
-                if len(line) == 1:
-                    continue
-
-                num = int(line[0].split(':')[2])
+        # per consecutive sharer pair "{num-1}-{num}" and first-to-last
+        results = {"request-pairs": {}, "request-end": new_interval_sketch(),
+                   "access-pairs": {}, "access-end": new_interval_sketch()}
 
+        with open(args.logfile, 'r') as logfile:
+            for stat, num, samples in read_interval_trace(logfile):
                 if num == 0:
-                    for interval in line[1:]:
-                        results["First-to-Last Request Interval (Cycle)"].append(int(interval))
+                    add_interval_samples(results[f"{stat}-end"], samples)
                 else:
                     pair = f"{num-1}-{num}"
-                    for i, interval in enumerate(line[1:]):
-                        results["Request Interval (Cycle)"].append(int(interval))
-                        results["Consecutive Request Pair"].append(pair)
-                    # print(i)
-
-            elif "system.ruby.LLC.sharer_access_interval" in line:
-                line = line.split()
-                if len(line) == 1:
-                    continue
+                    sketch = results[f"{stat}-pairs"].setdefault(
+                            pair, new_interval_sketch())
+                    add_interval_samples(sketch, samples)
 
-                num = int(line[0].split(':')[2])
-
-                if num == 0:
-                    for interval in line[1:]:
-                        results["First-to-Last Access Interval (Cycle)"].append(int(interval))
-                else:
-                    pair = f"{num-1}-{num}"
-                    i = 0
-                    # for interval in line[1:]:
-                    #     results["Access Interval (Cycle)"].append(int(interval))
-                    #     results["Consecutive Access Pair"].append(pair)
-                    for i, interval in enumerate(line[1:]):
-                        results["Access Interval (Cycle)"].append(int(interval))
-                        results["Consecutive Access Pair"].append(pair)
-                    print(i)
-                if (num == 15):
+                if stat == "access" and num == 15:
                     break
 
-        #diff = []
-        #for i in range(len(results["First-to-Last Request Interval (Cycle)"])):
-        #    diff.append(results["First-to-Last Access Interval (Cycle)"][i] -
-        #            results["First-to-Last Request Interval (Cycle)"][i])
-        #print(f"max diff: {max(diff)}")
-        #print(f"min diff: {min(diff)}")
-
-        logfile.close()
-
         if args.npy_result_file:
             np.save(args.npy_result_file, results)
 
@@ -608,40 +1482,25 @@ def process_concurrent_req_histogram(args):
 
     for benchmark in args.benchmark_list:
         filename = f"{args.m5out_dir}/{benchmark}-16cpus/stats.txt"
+        run = load_stats(filename)
 
-        count = 0
         total_samples = 0
         total_reqs = 0
 
-        with open(filename, "r") as statsfile:
-            samples = None
-            for line in statsfile:
-                if "concurrent_request_histogram::samples" in line:
-                    line = line.split()
-                    samples = int(line[1])
-                    total_samples += samples
+        # only the first 16 histograms of the dump are accounted
+        samples = stat_items(run, "concurrent_request_histogram::samples")
+        means = stat_items(run, "concurrent_request_histogram::mean")
+        for (_, num_samples), (_, mean_req) in list(zip(samples, means))[:16]:
+            total_samples += int(num_samples)
+            total_reqs += math.ceil(int(num_samples) * mean_req)
 
-                elif "concurrent_request_histogram::mean" in line:
-                    line = line.split()
-                    mean_req = float(line[1])
-                    total_reqs += math.ceil(samples * mean_req)
-                    count += 1
+        results["total_samples"].append(total_samples)
+        results["total_reqs"].append(total_reqs)
+        mean_reqs = total_reqs / total_samples
+        results["mean_reqs"].append(mean_reqs)
 
-                    if count == 16:
-                        break
-
-                else:
-                    continue
-
-            results["total_samples"].append(total_samples)
-            results["total_reqs"].append(total_reqs)
-            mean_reqs = total_reqs / total_samples
-            results["mean_reqs"].append(mean_reqs)
-
-            print(f"{benchmark}: {total_samples} total samples, {total_reqs} "
-                    f"total requests, {mean_reqs} mean requests")
-
-            statsfile.close()
+        print(f"{benchmark}: {total_samples} total samples, {total_reqs} "
+                f"total requests, {mean_reqs} mean requests")
 
     print(results["mean_reqs"])
 
@@ -674,40 +1533,20 @@ def process_misses_for_ncpu(args, ncpu):
 
         baseline_miss_rate = 0
         for s, scheme in enumerate(args.scheme_list):
-            directory = f"{args.m5out_dir}/{scheme}/{benchmark}-{ncpu}cpus"
-            filename = f"{directory}/stats.txt"
-
-            demand_accesses = 0
-            demand_hits = 0
-            demand_misses = 0
-            demand_misses_l0 = 0
-            total_insts = 0
-
-            file_empty = True
-            with open(filename, "r") as statsfile:
-                for line in statsfile:
-                    file_empty = False
-                    if "l0_cntrl" in line and "cache.demand_misses" in line:
-                        line = line.split()
-                        demand_misses_l0 += int(line[1])
-                    elif "l1_cntrl" in line and "cache.demand_accesses" in line:
-                        line = line.split()
-                        demand_accesses += int(line[1])
-                    elif "l1_cntrl" in line and "cache.demand_hits" in line:
-                        line = line.split()
-                        demand_hits += int(line[1])
-                    elif "l1_cntrl" in line and "cache.demand_misses" in line:
-                        line = line.split()
-                        demand_misses += int(line[1])
-                    elif "sim_insts" in line:
-                        line = line.split()
-                        total_insts += int(line[1])
-                    elif "End Simulation Statistics" in line:
-                        break
-
-                statsfile.close()
-
-            assert demand_accesses == demand_hits + demand_misses
+            filename = stats_path(args, scheme, benchmark, ncpu)
+
+            run = load_stats(filename, MISSES_STATS)
+
+            demand_misses_l0 = stat_count(stat_sum(run, "l0_cntrl", "cache.demand_misses"))
+            demand_accesses = stat_count(stat_sum(run, "l1_cntrl", "cache.demand_accesses"))
+            demand_hits = stat_count(stat_sum(run, "l1_cntrl", "cache.demand_hits"))
+            demand_misses = stat_count(stat_sum(run, "l1_cntrl", "cache.demand_misses"))
+            total_insts = stat_count(stat_sum(run, "sim_insts"))
+
+            file_empty = stats_empty(run)
+
+            assert stats_missing(run) or \
+                    demand_accesses == demand_hits + demand_misses
 
             if file_empty:
                 assert demand_accesses == 0
@@ -757,54 +1596,41 @@ def process_runtime_for_ncpu(args, ncpu):
         baseline_runtime = None
         bingo_runtime = None
         for s, scheme in enumerate(args.scheme_list):
-            directory = f"{args.m5out_dir}/{scheme}/{benchmark}-{ncpu}cpus"
-            filename = f"{directory}/stats.txt"
-
-            sim_seconds = 0
-            int_link_utilization = 0
-            with open(filename, "r") as statsfile:
-                for line in statsfile:
-                    if "sim_seconds" in line:
-                        line = line.split()
-                        sim_seconds = float(line[1])
-                    if "int_link_utilization" in line:
-                        line = line.split()
-                        int_link_utilization = int(line[1])
-                        break
-                    else:
-                        continue
-
-                if s == 0:
-                    baseline_runtime = sim_seconds
-                    bingo_runtime = sim_seconds
-                    if sim_seconds == 0:
-                        print(f"Warn: {filename} may be empty witout stats")
-                        baseline_runtime = 1
-                elif s == 1:
-                    bingo_runtime = sim_seconds
-                    if sim_seconds == 0:
-                        print(f"Warn: {filename} may be empty witout stats")
-                        bingo_runtime = 1
+            filename = stats_path(args, scheme, benchmark, ncpu)
 
-                results[f"{ncpu}cpus-runtime"][benchmark][scheme] = sim_seconds
-                results[f"{ncpu}cpus-traffic"][benchmark][scheme] = int_link_utilization
-                results[f"{ncpu}cpus-normalized-runtime"][s][b] = \
-                        sim_seconds / baseline_runtime
-                if sim_seconds == 0:
-                    results[f"{ncpu}cpus-speedup"][s][b] = 0
-                    results[f"{ncpu}cpus-speedup-overBingo"][s][b] = 0
-                else:
-                    results[f"{ncpu}cpus-speedup"][s][b] = baseline_runtime / sim_seconds
-                    results[f"{ncpu}cpus-speedup-overBingo"][s][b] = bingo_runtime / sim_seconds
+            run = load_stats(filename, NETWORK_STATS)
+            sim_seconds = stat_value(run, "sim_seconds")
+            int_link_utilization = stat_count(stat_value(run, "int_link_utilization"))
 
-                statsfile.close()
+            if s == 0:
+                baseline_runtime = sim_seconds
+                bingo_runtime = sim_seconds
+                if sim_seconds == 0:
+                    print(f"Warn: {filename} may be empty witout stats")
+                    baseline_runtime = 1
+            elif s == 1:
+                bingo_runtime = sim_seconds
+                if sim_seconds == 0:
+                    print(f"Warn: {filename} may be empty witout stats")
+                    bingo_runtime = 1
+
+            results[f"{ncpu}cpus-runtime"][benchmark][scheme] = sim_seconds
+            results[f"{ncpu}cpus-traffic"][benchmark][scheme] = int_link_utilization
+            results[f"{ncpu}cpus-normalized-runtime"][s][b] = \
+                    sim_seconds / baseline_runtime
+            if sim_seconds == 0:
+                results[f"{ncpu}cpus-speedup"][s][b] = 0
+                results[f"{ncpu}cpus-speedup-overBingo"][s][b] = 0
+            else:
+                results[f"{ncpu}cpus-speedup"][s][b] = baseline_runtime / sim_seconds
+                results[f"{ncpu}cpus-speedup-overBingo"][s][b] = bingo_runtime / sim_seconds
 
     if num_benchmarks > 1:
         for s, scheme in enumerate(args.scheme_list):
             results[f"{ncpu}cpus-speedup"][s][-1] = \
-                    stats.mstats.gmean(results[f"{ncpu}cpus-speedup"][s][0:-1])
+                    gmean(results[f"{ncpu}cpus-speedup"][s][0:-1])
             results[f"{ncpu}cpus-speedup-overBingo"][s][-1] = \
-                    stats.mstats.gmean(results[f"{ncpu}cpus-speedup-overBingo"][s][0:-1])
+                    gmean(results[f"{ncpu}cpus-speedup-overBingo"][s][0:-1])
 
     if args.print_csv:
         print(f"{ncpu}-cpus runtime:")
@@ -884,44 +1710,31 @@ def process_runtime(args):
 
         baseline_runtime = None
         for s, scheme in enumerate(args.scheme_list):
-            directory = f"{args.m5out_dir}/{scheme}/{benchmark}-{args.ncpu}cpus"
-            filename = f"{directory}/stats.txt"
-
-            sim_seconds = 0
-            int_link_utilization = 0
-            with open(filename, "r") as statsfile:
-                for line in statsfile:
-                    if "sim_seconds" in line:
-                        line = line.split()
-                        sim_seconds = float(line[1])
-                    if "int_link_utilization" in line:
-                        line = line.split()
-                        int_link_utilization = int(line[1])
-                        break
-                    else:
-                        continue
-
-                if s == 0:
-                    baseline_runtime = sim_seconds
-                    if sim_seconds == 0:
-                        print(f"Warn: {filename} may be empty witout stats")
-                        baseline_runtime = 1
+            filename = stats_path(args, scheme, benchmark)
 
-                results["runtime"][benchmark][scheme] = sim_seconds
-                results["traffic"][benchmark][scheme] = int_link_utilization
-                results["normalized-runtime"][s][b] = \
-                        sim_seconds / baseline_runtime
-                if sim_seconds == 0:
-                    results["speedup"][s][b] = 0
-                else:
-                    results["speedup"][s][b] = baseline_runtime / sim_seconds
+            run = load_stats(filename, NETWORK_STATS)
+            sim_seconds = stat_value(run, "sim_seconds")
+            int_link_utilization = stat_count(stat_value(run, "int_link_utilization"))
 
-                statsfile.close()
+            if s == 0:
+                baseline_runtime = sim_seconds
+                if sim_seconds == 0:
+                    print(f"Warn: {filename} may be empty witout stats")
+                    baseline_runtime = 1
+
+            results["runtime"][benchmark][scheme] = sim_seconds
+            results["traffic"][benchmark][scheme] = int_link_utilization
+            results["normalized-runtime"][s][b] = \
+                    sim_seconds / baseline_runtime
+            if sim_seconds == 0:
+                results["speedup"][s][b] = 0
+            else:
+                results["speedup"][s][b] = baseline_runtime / sim_seconds
 
     if num_benchmarks > 1:
         for s, scheme in enumerate(args.scheme_list):
             results["speedup"][s][-1] = \
-                    stats.mstats.gmean(results["speedup"][s][0:-1])
+                    gmean(results["speedup"][s][0:-1])
 
     if args.print_csv:
         print("runtime:")
@@ -985,44 +1798,31 @@ def process_sensitivity_runtime(args):
 
         baseline_runtime = None
         for s, scheme in enumerate(args.scheme_list):
-            directory = f"{args.m5out_dir}/{scheme}/{benchmark}-{args.ncpu}cpus"
-            filename = f"{directory}/stats.txt"
-
-            sim_seconds = 0
-            int_link_utilization = 0
-            with open(filename, "r") as statsfile:
-                for line in statsfile:
-                    if "sim_seconds" in line:
-                        line = line.split()
-                        sim_seconds = float(line[1])
-                    if "int_link_utilization" in line:
-                        line = line.split()
-                        int_link_utilization = int(line[1])
-                        break
-                    else:
-                        continue
-
-                if s == 0:
-                    baseline_runtime = sim_seconds
-                    if sim_seconds == 0:
-                        print(f"Warn: {filename} may be empty witout stats")
-                        baseline_runtime = 1
+            filename = stats_path(args, scheme, benchmark)
 
-                results["runtime"][benchmark][scheme] = sim_seconds
-                results["traffic"][benchmark][scheme] = int_link_utilization
-                results["normalized-runtime"][s][b] = \
-                        sim_seconds / baseline_runtime
-                if sim_seconds == 0:
-                    results["speedup"][s][b] = 0
-                else:
-                    results["speedup"][s][b] = baseline_runtime / sim_seconds
+            run = load_stats(filename, NETWORK_STATS)
+            sim_seconds = stat_value(run, "sim_seconds")
+            int_link_utilization = stat_count(stat_value(run, "int_link_utilization"))
 
-                statsfile.close()
+            if s == 0:
+                baseline_runtime = sim_seconds
+                if sim_seconds == 0:
+                    print(f"Warn: {filename} may be empty witout stats")
+                    baseline_runtime = 1
+
+            results["runtime"][benchmark][scheme] = sim_seconds
+            results["traffic"][benchmark][scheme] = int_link_utilization
+            results["normalized-runtime"][s][b] = \
+                    sim_seconds / baseline_runtime
+            if sim_seconds == 0:
+                results["speedup"][s][b] = 0
+            else:
+                results["speedup"][s][b] = baseline_runtime / sim_seconds
 
     if num_benchmarks > 1:
         for s, scheme in enumerate(args.scheme_list):
             results["speedup"][s][-1] = \
-                    stats.mstats.gmean(results["speedup"][s][0:-1])
+                    gmean(results["speedup"][s][0:-1])
 
     if args.print_csv:
         print("runtime:")
@@ -1067,840 +1867,251 @@ def process_sensitivity_runtime(args):
     return results
 
 
-def process_traffic(args):
-
-    results = {"traffic": {}}
-
+# The utilization breakdown vectors of the traffic directions, indexed by the
+# message types listed in the description of their totals
+TRAFFIC_DIRECTIONS = ("ext_in_link_utilization_breakdown",
+                      "ext_out_link_utilization_breakdown",
+                      "int_link_utilization_breakdown")
+INJECT, EJECT, NETWORK = range(len(TRAFFIC_DIRECTIONS))
+
+# Message type groups of the traffic breakdowns. Requests are Req_<type> and
+# responses Resp_<type>, a type missing from a protocol counts as zero
+NETWORK_TRAFFIC_GROUPS = (("Resp_DATA",), ("Resp_PREPUSH_ACK",),
+                          ("Req_GETS",), ("Resp_DATA_EXCLUSIVE",),
+                          ("Req_PUTX",), ("Resp_UNBLOCK",),
+                          ("Resp_EXCLUSIVE_UNBLOCK",), ("Resp_MEMORY_DATA",))
+# injected by the L2s and ejected at the LLCs: read requests, prepush
+# (n)acks, writebacks and others
+REQUEST_TRAFFIC_GROUPS = (("Req_GETS",),
+                          ("Resp_PREPUSH_ACK", "Resp_PREPUSH_NACK"),
+                          ("Req_PUTX",),
+                          ("Req_GETX", "Req_UPGRADE", "Req_GET_INSTR",
+                           "Resp_ACK", "Resp_UNBLOCK",
+                           "Resp_EXCLUSIVE_UNBLOCK"))
+# injected by the LLCs and ejected at the L2s: shared data, exclusive data
+# and others
+DATA_TRAFFIC_GROUPS = (("Resp_DATA",), ("Resp_DATA_EXCLUSIVE",),
+                       ("Req_INV", "Resp_WB_ACK"))
+
+# scalar stats of process_traffic
+TRAFFIC_SCALARS = {
+    "sim_ticks": ("sim_ticks", 1),
+    "cpu_ticks_per_cycle": ("system.cpu_clk_domain.clock", 1),
+    "inject_ctrl_flits": ("ext_in_link_ctrl_utilization", 0),
+    "inject_data_flits": ("ext_in_link_data_utilization", 0),
+    "eject_ctrl_flits": ("ext_out_link_ctrl_utilization", 0),
+    "eject_data_flits": ("ext_out_link_data_utilization", 0),
+    "inject_flits": ("ext_in_link_utilization_breakdown::total", 0),
+    "eject_flits": ("ext_out_link_utilization_breakdown::total", 0),
+    "network_flits": ("int_link_utilization_breakdown::total", 0),
+}
+
+
+def traffic_message_types(desc):
+    """Message types listed in the description of a utilization breakdown
+    total, as Req_<type> and Resp_<type>."""
+    types = []
+    prefix = None
+    for token in desc.replace(",", " ").split():
+        if token == "Requests":
+            prefix = "Req_"
+        elif token == "Responses":
+            prefix = "Resp_"
+        elif prefix is not None and token not in ("[", "]"):
+            types.append(prefix + token)
+    return types
+
+
+def load_traffic(args):
+    """Load the traffic of every (scheme, benchmark) run.
+
+    Returns the (scheme, benchmark, direction, message type) tensor of the
+    utilization breakdowns, the message types of its last axis, the
+    (scheme, benchmark) arrays of TRAFFIC_SCALARS, and the runs. The
+    breakdowns and scalars of a missing run are NaN."""
     num_benchmarks = len(args.benchmark_list)
     num_schemes = len(args.scheme_list)
 
-    results["traffic-breakdown"] = np.zeros(
-            (9, num_benchmarks * num_schemes), dtype=np.int64)
-    results["normalized-traffic-breakdown"] = np.zeros(
-            (9, num_benchmarks * num_schemes), dtype=np.float64)
-
-    results["concise-traffic-breakdown"] = np.zeros(
-            (6, num_benchmarks * num_schemes), dtype=np.int64)
-    results["concise-normalized-traffic-breakdown"] = np.zeros(
-            (6, num_benchmarks * num_schemes), dtype=np.float64)
-    results["concise-baseline-traffic-breakdown"] = np.zeros(
-            (5, num_benchmarks), dtype=np.int64)
-    results["concise-baseline-normalized-traffic-breakdown"] = np.zeros(
-            (5, num_benchmarks), dtype=np.float64)
-
-    results["inject-traffic"] = np.zeros(
-            (num_schemes, num_benchmarks), dtype=np.float64)
-    results["inject-ctrl-traffic"] = np.zeros(
-            (num_schemes, num_benchmarks), dtype=np.float64)
-    results["inject-data-traffic"] = np.zeros(
-            (num_schemes, num_benchmarks), dtype=np.float64)
-    results["eject-traffic"] = np.zeros(
-            (num_schemes, num_benchmarks), dtype=np.float64)
-    results["eject-ctrl-traffic"] = np.zeros(
-            (num_schemes, num_benchmarks), dtype=np.float64)
-    results["eject-data-traffic"] = np.zeros(
-            (num_schemes, num_benchmarks), dtype=np.float64)
-    results["network-traffic"] = np.zeros(
-            (num_schemes, num_benchmarks), dtype=np.float64)
+    runs = [[load_stats(stats_path(args, scheme, benchmark), TRAFFIC_STATS)
+             for benchmark in args.benchmark_list]
+            for scheme in args.scheme_list]
 
-    # l2 cache inject: gets, putx, preupsh_ack, others
-    results["normalized-l2-inject-traffic-breakdown"] = np.zeros(
-            (4, num_benchmarks * num_schemes), dtype=np.float64)
-    # l2 cache eject: data, exclusive data, others
-    results["normalized-l2-eject-traffic-breakdown"] = np.zeros(
-            (3, num_benchmarks * num_schemes), dtype=np.float64)
-    # llc cache inject: data, exclusive data, others
-    results["normalized-llc-inject-traffic-breakdown"] = np.zeros(
-            (3, num_benchmarks * num_schemes), dtype=np.float64)
-    # llc cache eject: gets, putx, prepush_ack, others
-    results["normalized-llc-eject-traffic-breakdown"] = np.zeros(
-            (4, num_benchmarks * num_schemes), dtype=np.float64)
-    results["neg-normalized-llc-eject-traffic-breakdown"] = np.zeros(
-            (4, num_benchmarks * num_schemes), dtype=np.float64)
-    results["neg-normalized-l2-eject-traffic-breakdown"] = np.zeros(
-            (3, num_benchmarks * num_schemes), dtype=np.float64)
-    results["integrate-normalized-llc-in-eject-traffic-breakdown"] = np.zeros(
-            (6, num_benchmarks * num_schemes), dtype=np.float64)
-
-    results["normalized-inject-traffic"] = np.zeros(
-            (num_schemes, num_benchmarks), dtype=np.float64)
-    results["normalized-inject-ctrl-traffic"] = np.zeros(
-            (num_schemes, num_benchmarks), dtype=np.float64)
-    results["normalized-inject-data-traffic"] = np.zeros(
-            (num_schemes, num_benchmarks), dtype=np.float64)
-    results["normalized-eject-traffic"] = np.zeros(
-            (num_schemes, num_benchmarks), dtype=np.float64)
-    results["normalized-eject-ctrl-traffic"] = np.zeros(
-            (num_schemes, num_benchmarks), dtype=np.float64)
-    results["normalized-eject-data-traffic"] = np.zeros(
-            (num_schemes, num_benchmarks), dtype=np.float64)
-    results["normalized-network-traffic"] = np.zeros(
-            (num_schemes, num_benchmarks), dtype=np.float64)
+    message_types = {}
+    run_types = {}
+    for s in range(num_schemes):
+        for b in range(num_benchmarks):
+            types = traffic_message_types(stat_desc(
+                    runs[s][b], "ext_in_link_utilization_breakdown::total"))
+            run_types[s, b] = [message_types.setdefault(t, len(message_types))
+                               for t in types]
+
+    tensor = np.zeros((num_schemes, num_benchmarks, len(TRAFFIC_DIRECTIONS),
+                       len(message_types)), dtype=np.float64)
+    scalars = {name: np.zeros((num_schemes, num_benchmarks),
+                              dtype=np.float64)
+               for name in TRAFFIC_SCALARS}
+
+    for s in range(num_schemes):
+        for b in range(num_benchmarks):
+            run = runs[s][b]
+            if stats_missing(run):
+                tensor[s, b] = math.nan
+            columns = run_types[s, b]
+            for d, direction in enumerate(TRAFFIC_DIRECTIONS):
+                values, _, _ = stat_vector(run, direction)
+                n = min(len(values), len(columns))
+                tensor[s, b, d, columns[:n]] = values[:n]
+            for name, (key, default) in TRAFFIC_SCALARS.items():
+                scalars[name][s, b] = stat_value(run, key, default=default)
 
-    results["inject-load"] = np.zeros(
-            (num_schemes, num_benchmarks), dtype=np.float64)
-    results["inject-ctrl-load"] = np.zeros(
-            (num_schemes, num_benchmarks), dtype=np.float64)
-    results["inject-data-load"] = np.zeros(
-            (num_schemes, num_benchmarks), dtype=np.float64)
-    results["eject-load"] = np.zeros(
-            (num_schemes, num_benchmarks), dtype=np.float64)
-    results["eject-ctrl-load"] = np.zeros(
-            (num_schemes, num_benchmarks), dtype=np.float64)
-    results["eject-data-load"] = np.zeros(
-            (num_schemes, num_benchmarks), dtype=np.float64)
-    results["network-load"] = np.zeros(
-            (num_schemes, num_benchmarks), dtype=np.float64)
+    return tensor, list(message_types), scalars, runs
 
-    base = 2
-    stride = 4
+
+def traffic_groups(tensor, message_types, direction, groups):
+    """(group, scheme, benchmark) sums of the message type groups of a
+    traffic direction."""
+    columns = {t: i for i, t in enumerate(message_types)}
+    reduced = np.zeros((len(groups),) + tensor.shape[:2], dtype=np.float64)
+    for g, group in enumerate(groups):
+        index = [columns[t] for t in group if t in columns]
+        reduced[g] = tensor[:, :, direction, index].sum(axis=-1)
+    return reduced
+
+
+def breakdown_columns(reduced):
+    """(group, benchmark * scheme) layout of the breakdown figures, the schemes
+    of a benchmark being adjacent columns."""
+    return reduced.transpose(0, 2, 1).reshape(reduced.shape[0], -1)
+
+
+def process_traffic(args):
+
+    results = {"traffic": {}}
+
+    tensor, message_types, scalars, runs = load_traffic(args)
+
+    network = traffic_groups(tensor, message_types, NETWORK,
+                             NETWORK_TRAFFIC_GROUPS)
+    others = scalars["network_flits"] - network.sum(axis=0)
+    network = np.concatenate((network, others[np.newaxis]))
+    data, prepush_ack, gets, data_exclusive, putx, unblock, \
+            exclusive_unblock, mem_data, others = network
+    concise = np.stack((data, prepush_ack, gets, data_exclusive, putx,
+                        unblock + exclusive_unblock + mem_data + others))
+
+    l2_inject = traffic_groups(tensor, message_types, INJECT,
+                               REQUEST_TRAFFIC_GROUPS)
+    l2_eject = traffic_groups(tensor, message_types, EJECT,
+                              DATA_TRAFFIC_GROUPS)
+    llc_inject = traffic_groups(tensor, message_types, INJECT,
+                                DATA_TRAFFIC_GROUPS)
+    llc_eject = traffic_groups(tensor, message_types, EJECT,
+                               REQUEST_TRAFFIC_GROUPS)
+
+    # normalized to the first scheme, taken as 1 where it has no traffic
+    no_traffic = scalars["network_flits"][0] == 0
+
+    def baseline(values):
+        return np.where(no_traffic, 1, values[0])
+
+    baseline_total_traffic = baseline(scalars["network_flits"])
+    baseline_llc_traffic = baseline(llc_inject.sum(axis=0)) + \
+            baseline(llc_eject.sum(axis=0))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        results["traffic-breakdown"] = breakdown_columns(network)
+        results["normalized-traffic-breakdown"] = breakdown_columns(
+                network / baseline_total_traffic)
+        results["concise-traffic-breakdown"] = breakdown_columns(concise)
+        results["concise-normalized-traffic-breakdown"] = breakdown_columns(
+                concise / baseline_total_traffic)
+
+        results["concise-baseline-traffic-breakdown"] = np.zeros(
+                (5, len(args.benchmark_list)), dtype=np.float64)
+        results["concise-baseline-normalized-traffic-breakdown"] = np.zeros(
+                (5, len(args.benchmark_list)), dtype=np.float64)
+        if "baseline" in args.scheme_list:
+            s = len(args.scheme_list) - 1 - \
+                    args.scheme_list[::-1].index("baseline")
+            concise_baseline = concise[[0, 2, 3, 4, 5], s]
+            results["concise-baseline-traffic-breakdown"][:] = \
+                    concise_baseline
+            results["concise-baseline-normalized-traffic-breakdown"][:] = \
+                    concise_baseline / baseline_total_traffic
+
+        # l2 cache inject: gets, prepush_ack, putx, others
+        results["normalized-l2-inject-traffic-breakdown"] = breakdown_columns(
+                l2_inject / baseline(l2_inject.sum(axis=0)))
+        # l2 cache eject: data, exclusive data, others
+        results["normalized-l2-eject-traffic-breakdown"] = breakdown_columns(
+                l2_eject / baseline(l2_eject.sum(axis=0)))
+        results["neg-normalized-l2-eject-traffic-breakdown"] = \
+                - results["normalized-l2-eject-traffic-breakdown"]
+        # llc cache inject: data, exclusive data, others
+        results["normalized-llc-inject-traffic-breakdown"] = breakdown_columns(
+                llc_inject / baseline(llc_inject.sum(axis=0)))
+        # llc cache eject: gets, prepush_ack, putx, others
+        results["normalized-llc-eject-traffic-breakdown"] = breakdown_columns(
+                llc_eject / baseline(llc_eject.sum(axis=0)))
+        results["neg-normalized-llc-eject-traffic-breakdown"] = \
+                - results["normalized-llc-eject-traffic-breakdown"]
+        # llc cache inject and eject: data, exclusive data, gets,
+        # prepush_ack, putx, others
+        llc_in_eject = np.concatenate((
+                llc_inject[:2], llc_eject[:3],
+                (llc_inject[2] + llc_eject[3])[np.newaxis]))
+        results["integrate-normalized-llc-in-eject-traffic-breakdown"] = \
+                breakdown_columns(llc_in_eject / baseline_llc_traffic)
+
+        # network traffic loads
+        cycles = scalars["sim_ticks"] / scalars["cpu_ticks_per_cycle"]
+        for name, flits in (("inject", "inject_flits"),
+                            ("inject-ctrl", "inject_ctrl_flits"),
+                            ("inject-data", "inject_data_flits"),
+                            ("eject", "eject_flits"),
+                            ("eject-ctrl", "eject_ctrl_flits"),
+                            ("eject-data", "eject_data_flits"),
+                            ("network", "network_flits")):
+            results[f"{name}-traffic"] = scalars[flits] / 1e6
+            results[f"normalized-{name}-traffic"] = \
+                    scalars[flits] / baseline(scalars[flits])
+            results[f"{name}-load"] = \
+                    scalars[flits] * scalars["cpu_ticks_per_cycle"] / \
+                    scalars["sim_ticks"]
 
     for b, benchmark in enumerate(args.benchmark_list):
         results["traffic"][benchmark] = {}
 
-        baseline_total_traffic = None
         for s, scheme in enumerate(args.scheme_list):
-            directory = f"{args.m5out_dir}/{scheme}/{benchmark}-{args.ncpu}cpus"
-            filename = f"{directory}/stats.txt"
-
-            excel_line = f"{benchmark},"
-
-            message_index = {}
-            first_item = 0
-            response_start = 100
-
-            with open(filename, "r") as statsfile:
-                for line in statsfile:
-                    if "ext_in_link_utilization_breakdown::total" in line:
-                        line = line.split()
-                        linelength = len(line)
-                        for m_i in range(linelength):
-                            if line[m_i] == "GETX":
-                                first_item = m_i
-                                message_index["GETX"] = m_i-first_item
-                            elif line[m_i] == "UPGRADE":
-                                message_index["UPGRADE"] = m_i-first_item
-                            elif line[m_i] == "GETS":
-                                message_index["GETS"] = m_i-first_item
-                            elif line[m_i] == "GET_INSTR":
-                                message_index["GET_INSTR"] = m_i-first_item
-                            elif line[m_i] == "INV":
-                                if m_i < response_start:
-                                    message_index["Req_INV"] = m_i-first_item
-                                else:
-                                    message_index["Resp_INV"] = m_i-first_item-3
-                            elif line[m_i] == "PUTX":
-                                message_index["PUTX"] = m_i-first_item
-                            elif line[m_i] == "WB_ACK":
-                                if m_i < response_start:
-                                    message_index["Req_WB_ACK"] = m_i-first_item
-                                else:
-                                    message_index["Resp_WB_ACK"] = m_i-first_item-3
-                            elif line[m_i] == "Responses":
-                                response_start = m_i
-                            elif line[m_i] == "MEMORY_ACK":
-                                message_index["MEMORY_ACK"] = m_i-first_item-3
-                            elif line[m_i] == "DATA":
-                                message_index["DATA"] = m_i-first_item-3
-                            elif line[m_i] == "DATA_EXCLUSIVE":
-                                message_index["DATA_EXCLUSIVE"] = m_i-first_item-3
-                            elif line[m_i] == "MEMORY_DATA":
-                                message_index["MEMORY_DATA"] = m_i-first_item-3
-                            elif line[m_i] == "ACK":
-                                message_index["ACK"] = m_i-first_item-3
-                            elif line[m_i] == "UNBLOCK":
-                                message_index["UNBLOCK"] = m_i-first_item-3
-                            elif line[m_i] == "EXCLUSIVE_UNBLOCK":
-                                message_index["EXCLUSIVE_UNBLOCK"] = m_i-first_item-3
-                            elif line[m_i] == "PREPUSH_ACK":
-                                message_index["PREPUSH_ACK"] = m_i-first_item-3
-                            elif line[m_i] == "PREPUSH_NACK":
-                                message_index["PREPUSH_NACK"] = m_i-first_item-3
-                        break
-                statsfile.close()
-
-            with open(filename, "r") as statsfile:
-                sim_ticks = 1
-                cpu_ticks_per_cycle = 1
-
-                inject_flits = 0
-                inject_ctrl_flits = 0
-                inject_data_flits = 0
-                eject_flits = 0
-                eject_ctrl_flits = 0
-                eject_data_flits = 0
-
-                gets = 0
-                putx = 0
-                data = 0
-                data_exclusive = 0
-                unblock = 0
-                exclusive_unblock = 0
-                mem_data = 0
-                prepush_ack = 0
-                int_link_utilization = 0
-                # enable_prepush = 0
-                # disable_prepush = 0
-
-                l2_inject_getx = 0
-                l2_inject_upgrade = 0
-                l2_inject_gets = 0
-                l2_inject_get_instr = 0
-                l2_inject_putx = 0
-                l2_inject_ack = 0
-                l2_inject_unblock = 0
-                l2_inject_xunblock = 0
-                l2_inject_prepush_ack = 0
-                l2_inject_prepush_nack = 0
-                l2_inject_enableprepush = 0
-                l2_inject_disableprepush = 0
-
-                l2_eject_inv = 0
-                l2_eject_wb_ack = 0
-                l2_eject_data = 0
-                l2_eject_xdata = 0
-
-                llc_inject_inv = 0
-                llc_inject_data = 0
-                llc_inject_xdata = 0
-                llc_inject_wb_ack = 0
-
-                llc_eject_getx = 0
-                llc_eject_upgrade = 0
-                llc_eject_gets = 0
-                llc_eject_get_instr = 0
-                llc_eject_putx = 0
-                llc_eject_ack = 0
-                llc_eject_unblock = 0
-                llc_eject_xunblock = 0
-                llc_eject_prepush_ack = 0
-                llc_eject_prepush_nack = 0
-                llc_eject_enableprepush = 0
-                llc_eject_disableprepush = 0
-
-                file_empty = True
-                for line in statsfile:
-                    file_empty = False
-                    if "sim_ticks" in line:
-                        line = line.split()
-                        sim_ticks = int(line[1])
-                    elif "system.cpu_clk_domain.clock" in line:
-                        line = line.split()
-                        cpu_ticks_per_cycle = int(line[1])
-                    elif "ext_in_link_ctrl_utilization" in line:
-                        line = line.split()
-                        inject_ctrl_flits = int(line[1])
-                    elif "ext_in_link_data_utilization" in line:
-                        line = line.split()
-                        inject_data_flits = int(line[1])
-                    elif "ext_out_link_ctrl_utilization" in line:
-                        line = line.split()
-                        eject_ctrl_flits = int(line[1])
-                    elif "ext_out_link_data_utilization" in line:
-                        line = line.split()
-                        eject_data_flits = int(line[1])
-                    elif "ext_in_link_utilization_breakdown" in line and \
-                            "total" not in line:
-                        line = line.split()
-                        # if((scheme == "bingo") | (scheme == "prepush-ack-multicast-feedback-restart-ratio") | (scheme == "prepush-multicast-feedback-restart-ratio") | (scheme == "prepush-ack-stride")):
-                        #     l2_inject_getx = int(line[base + 0 * stride])
-                        #     l2_inject_upgrade = int(line[base + 1 * stride])
-                        #     l2_inject_gets = int(line[base + 2 * stride])
-                        #     l2_inject_get_instr = int(line[base + 3 * stride])
-                        #     l2_inject_putx = int(line[base + 5 * stride])
-                        #     l2_inject_ack = int(line[base + 15 * stride])
-                        #     l2_inject_unblock = int(line[base + 17 * stride])
-                        #     l2_inject_xunblock = int(line[base + 18 * stride])
-                        #     l2_inject_prepush_ack = int(line[base + 20 * stride])
-                        #     l2_inject_prepush_nack = int(line[base + 21 * stride])
-
-                        #     llc_inject_inv = int(line[base + 4 * stride])
-                        #     llc_inject_data = int(line[base + 12 * stride])
-                        #     llc_inject_xdata = int(line[base + 13 * stride])
-                        #     llc_inject_wb_ack = int(line[base + 16 * stride])
-                        # else:
-                        #     l2_inject_getx = int(line[base + 0 * stride])
-                        #     l2_inject_upgrade = int(line[base + 1 * stride])
-                        #     l2_inject_gets = int(line[base + 2 * stride])
-                        #     l2_inject_get_instr = int(line[base + 3 * stride])
-                        #     l2_inject_putx = int(line[base + 5 * stride])
-                        #     l2_inject_ack = int(line[base + 14 * stride])
-                        #     l2_inject_unblock = int(line[base + 16 * stride])
-                        #     l2_inject_xunblock = int(line[base + 17 * stride])
-                        #     l2_inject_prepush_ack = int(line[base + 19 * stride])
-                        #     l2_inject_prepush_nack = int(line[base + 20 * stride])
-
-                        #     llc_inject_inv = int(line[base + 4 * stride])
-                        #     llc_inject_data = int(line[base + 11 * stride])
-                        #     llc_inject_xdata = int(line[base + 12 * stride])
-                        #     llc_inject_wb_ack = int(line[base + 15 * stride])
-                        print(scheme)
-                        # if((benchmark == "blackscholes-large") | (benchmark == "bodytrack-large") | (benchmark == "fluidanimate-large") | (benchmark == "canneal-large") | (benchmark == "freqmine-large") | (benchmark == "swaptions-large") | (scheme == "bingo") | (scheme == "bingo-16kBPHT") | (scheme == "bingo-stride")):
-                        #     if((scheme == "bingo") | (scheme == "bingo-16kBPHT") | (scheme == "bingo-stride") | (scheme == "prepush-ack-multicast-feedback-restart-ratio") | (scheme == "prepush-multicast-feedback-restart-ratio") | (scheme == "prepush-ack-multicast-feedback-ratio-private") | (scheme == "prepush-multicast-feedback-ratio-private")): #plus two
-                        #         print(line)
-                        #         l2_inject_getx = int(line[base + 0 * stride])
-                        #         l2_inject_upgrade = int(line[base + 1 * stride])
-                        #         l2_inject_gets = int(line[base + 2 * stride])
-                        #         l2_inject_get_instr = int(line[base + 3 * stride])
-                        #         l2_inject_putx = int(line[base + 5 * stride])
-                        #         l2_inject_ack = int(line[base + 15 * stride])
-                        #         l2_inject_unblock = int(line[base + 17 * stride])
-                        #         l2_inject_xunblock = int(line[base + 18 * stride])
-                        #         l2_inject_prepush_ack = int(line[base + 20 * stride])
-                        #         l2_inject_prepush_nack = int(line[base + 21 * stride])
-
-                        #         llc_inject_inv = int(line[base + 4 * stride])
-                        #         llc_inject_data = int(line[base + 12 * stride])
-                        #         llc_inject_xdata = int(line[base + 13 * stride])
-                        #         llc_inject_wb_ack = int(line[base + 16 * stride])
-                        #     else: #plus one
-                        #         l2_inject_getx = int(line[base + 0 * stride])
-                        #         l2_inject_upgrade = int(line[base + 1 * stride])
-                        #         l2_inject_gets = int(line[base + 2 * stride])
-                        #         l2_inject_get_instr = int(line[base + 3 * stride])
-                        #         l2_inject_putx = int(line[base + 5 * stride])
-                        #         l2_inject_ack = int(line[base + 14 * stride])
-                        #         l2_inject_unblock = int(line[base + 16 * stride])
-                        #         l2_inject_xunblock = int(line[base + 17 * stride])
-                        #         l2_inject_prepush_ack = int(line[base + 19 * stride])
-                        #         l2_inject_prepush_nack = int(line[base + 20 * stride])
-
-                        #         llc_inject_inv = int(line[base + 4 * stride])
-                        #         llc_inject_data = int(line[base + 11 * stride])
-                        #         llc_inject_xdata = int(line[base + 12 * stride])
-                        #         llc_inject_wb_ack = int(line[base + 15 * stride])
-                        # elif((scheme == "prepush-ack-multicast-feedback-ratio-private") | (scheme == "prepush-multicast-feedback-ratio-private")):
-                        #     l2_inject_getx = int(line[base + 0 * stride])
-                        #     l2_inject_upgrade = int(line[base + 1 * stride])
-                        #     l2_inject_gets = int(line[base + 2 * stride])
-                        #     l2_inject_get_instr = int(line[base + 3 * stride])
-                        #     l2_inject_putx = int(line[base + 5 * stride])
-                        #     l2_inject_ack = int(line[base + 15 * stride])
-                        #     l2_inject_unblock = int(line[base + 17 * stride])
-                        #     l2_inject_xunblock = int(line[base + 18 * stride])
-                        #     l2_inject_prepush_ack = int(line[base + 20 * stride])
-                        #     l2_inject_prepush_nack = int(line[base + 21 * stride])
-                        #     # l2_inject_enableprepush = int(line[base + 9 * stride])
-                        #     # l2_inject_disableprepush = int(line[base + 10 * stride])
-
-                        #     llc_inject_inv = int(line[base + 4 * stride])
-                        #     llc_inject_data = int(line[base + 12 * stride])
-                        #     llc_inject_xdata = int(line[base + 13 * stride])
-                        #     llc_inject_wb_ack = int(line[base + 16 * stride])
-                        # else:
-                        #     l2_inject_getx = int(line[base + 0 * stride])
-                        #     l2_inject_upgrade = int(line[base + 1 * stride])
-                        #     l2_inject_gets = int(line[base + 2 * stride])
-                        #     l2_inject_get_instr = int(line[base + 3 * stride])
-                        #     l2_inject_putx = int(line[base + 5 * stride])
-                        #     l2_inject_ack = int(line[base + 13 * stride])
-                        #     l2_inject_unblock = int(line[base + 15 * stride])
-                        #     l2_inject_xunblock = int(line[base + 16 * stride])
-                        #     l2_inject_prepush_ack = int(line[base + 18 * stride])
-                        #     l2_inject_prepush_nack = int(line[base + 19 * stride])
-
-                        #     llc_inject_inv = int(line[base + 4 * stride])
-                        #     llc_inject_data = int(line[base + 10 * stride])
-                        #     llc_inject_xdata = int(line[base + 11 * stride])
-                        #     llc_inject_wb_ack = int(line[base + 14 * stride])
-                        l2_inject_getx = int(line[base + message_index["GETX"] * stride])
-                        l2_inject_upgrade = int(line[base + message_index["UPGRADE"] * stride])
-                        l2_inject_gets = int(line[base + message_index["GETS"] * stride])
-                        l2_inject_get_instr = int(line[base + message_index["GET_INSTR"] * stride])
-                        l2_inject_putx = int(line[base + message_index["PUTX"] * stride])
-                        l2_inject_ack = int(line[base + message_index["ACK"] * stride])
-                        l2_inject_unblock = int(line[base + message_index["UNBLOCK"] * stride])
-                        l2_inject_xunblock = int(line[base + message_index["EXCLUSIVE_UNBLOCK"] * stride])
-                        l2_inject_prepush_ack = int(line[base + message_index["PREPUSH_ACK"] * stride])
-                        l2_inject_prepush_nack = int(line[base + message_index["PREPUSH_NACK"] * stride])
-
-                        llc_inject_inv = int(line[base + message_index["Req_INV"] * stride])
-                        llc_inject_data = int(line[base + message_index["DATA"] * stride])
-                        llc_inject_xdata = int(line[base + message_index["DATA_EXCLUSIVE"] * stride])
-                        llc_inject_wb_ack = int(line[base + message_index["Resp_WB_ACK"] * stride])
-                    elif "ext_in_link_utilization_breakdown::total" in line:
-                        line = line.split()
-                        inject_flits = int(line[1])
-                    elif "ext_out_link_utilization_breakdown" in line and \
-                            "total" not in line:
-                        line = line.split()
-                        # if((scheme == "bingo") | (scheme == "prepush-ack-multicast-feedback-restart-ratio") | (scheme == "prepush-multicast-feedback-restart-ratio") | (scheme == "prepush-ack-stride")):
-                        #     l2_eject_inv = int(line[base + 4 * stride])
-                        #     l2_eject_data = int(line[base + 12 * stride])
-                        #     l2_eject_xdata = int(line[base + 13 * stride])
-                        #     l2_eject_wb_ack = int(line[base + 16 * stride])
-
-                        #     llc_eject_getx = int(line[base + 0 * stride])
-                        #     llc_eject_upgrade = int(line[base + 1 * stride])
-                        #     llc_eject_gets = int(line[base + 2 * stride])
-                        #     llc_eject_get_instr = int(line[base + 3 * stride])
-                        #     llc_eject_putx = int(line[base + 5 * stride])
-                        #     llc_eject_ack = int(line[base + 15 * stride])
-                        #     llc_eject_unblock = int(line[base + 17 * stride])
-                        #     llc_eject_xunblock = int(line[base + 18 * stride])
-                        #     llc_eject_prepush_ack = int(line[base + 20 * stride])
-                        #     llc_eject_prepush_nack = int(line[base + 21 * stride])
-                        # else:
-                        #     l2_eject_inv = int(line[base + 4 * stride])
-                        #     l2_eject_data = int(line[base + 11 * stride])
-                        #     l2_eject_xdata = int(line[base + 12 * stride])
-                        #     l2_eject_wb_ack = int(line[base + 15 * stride])
-
-                        #     llc_eject_getx = int(line[base + 0 * stride])
-                        #     llc_eject_upgrade = int(line[base + 1 * stride])
-                        #     llc_eject_gets = int(line[base + 2 * stride])
-                        #     llc_eject_get_instr = int(line[base + 3 * stride])
-                        #     llc_eject_putx = int(line[base + 5 * stride])
-                        #     llc_eject_ack = int(line[base + 14 * stride])
-                        #     llc_eject_unblock = int(line[base + 16 * stride])
-                        #     llc_eject_xunblock = int(line[base + 17 * stride])
-                        #     llc_eject_prepush_ack = int(line[base + 19 * stride])
-                        #     llc_eject_prepush_nack = int(line[base + 20 * stride])
-                        # if((benchmark == "blackscholes-large")  | (benchmark == "bodytrack-large") | (benchmark == "fluidanimate-large") | (benchmark == "canneal-large") | (benchmark == "freqmine-large") | (benchmark == "swaptions-large") | (scheme == "bingo") | (scheme == "bingo-16kBPHT") | (scheme == "bingo-stride")):
-                        #     if((scheme == "bingo") | (scheme == "bingo-16kBPHT") | (scheme == "bingo-stride") | (scheme == "prepush-ack-multicast-feedback-restart-ratio") | (scheme == "prepush-multicast-feedback-restart-ratio") | (scheme == "prepush-ack-multicast-feedback-ratio-private") | (scheme == "prepush-multicast-feedback-ratio-private")): #plus two
-                        #         l2_eject_inv = int(line[base + 4 * stride])
-                        #         l2_eject_data = int(line[base + 12 * stride])
-                        #         l2_eject_xdata = int(line[base + 13 * stride])
-                        #         l2_eject_wb_ack = int(line[base + 16 * stride])
-
-                        #         llc_eject_getx = int(line[base + 0 * stride])
-                        #         llc_eject_upgrade = int(line[base + 1 * stride])
-                        #         llc_eject_gets = int(line[base + 2 * stride])
-                        #         llc_eject_get_instr = int(line[base + 3 * stride])
-                        #         llc_eject_putx = int(line[base + 5 * stride])
-                        #         llc_eject_ack = int(line[base + 15 * stride])
-                        #         llc_eject_unblock = int(line[base + 17 * stride])
-                        #         llc_eject_xunblock = int(line[base + 18 * stride])
-                        #         llc_eject_prepush_ack = int(line[base + 20 * stride])
-                        #         llc_eject_prepush_nack = int(line[base + 21 * stride])
-                        #     else: #plus one
-                        #         l2_eject_inv = int(line[base + 4 * stride])
-                        #         l2_eject_data = int(line[base + 11 * stride])
-                        #         l2_eject_xdata = int(line[base + 12 * stride])
-                        #         l2_eject_wb_ack = int(line[base + 15 * stride])
-
-                        #         llc_eject_getx = int(line[base + 0 * stride])
-                        #         llc_eject_upgrade = int(line[base + 1 * stride])
-                        #         llc_eject_gets = int(line[base + 2 * stride])
-                        #         llc_eject_get_instr = int(line[base + 3 * stride])
-                        #         llc_eject_putx = int(line[base + 5 * stride])
-                        #         llc_eject_ack = int(line[base + 14 * stride])
-                        #         llc_eject_unblock = int(line[base + 16 * stride])
-                        #         llc_eject_xunblock = int(line[base + 17 * stride])
-                        #         llc_eject_prepush_ack = int(line[base + 19 * stride])
-                        #         llc_eject_prepush_nack = int(line[base + 20 * stride])
-                        # elif((scheme == "prepush-ack-multicast-feedback-ratio-private") | (scheme == "prepush-multicast-feedback-ratio-private")):
-                        #     l2_eject_inv = int(line[base + 4 * stride])
-                        #     l2_eject_data = int(line[base + 12 * stride])
-                        #     l2_eject_xdata = int(line[base + 13 * stride])
-                        #     l2_eject_wb_ack = int(line[base + 16 * stride])
-
-                        #     llc_eject_getx = int(line[base + 0 * stride])
-                        #     llc_eject_upgrade = int(line[base + 1 * stride])
-                        #     llc_eject_gets = int(line[base + 2 * stride])
-                        #     llc_eject_get_instr = int(line[base + 3 * stride])
-                        #     llc_eject_putx = int(line[base + 5 * stride])
-                        #     llc_eject_ack = int(line[base + 15 * stride])
-                        #     llc_eject_unblock = int(line[base + 17 * stride])
-                        #     llc_eject_xunblock = int(line[base + 18 * stride])
-                        #     llc_eject_prepush_ack = int(line[base + 20 * stride])
-                        #     llc_eject_prepush_nack = int(line[base + 21 * stride])
-                        #     # llc_eject_enableprepush = int(line[base + 9 * stride])
-                        #     # llc_eject_disableprepush = int(line[base + 10 * stride])
-                        # else:
-                        #     l2_eject_inv = int(line[base + 4 * stride])
-                        #     l2_eject_data = int(line[base + 10 * stride])
-                        #     l2_eject_xdata = int(line[base + 11 * stride])
-                        #     l2_eject_wb_ack = int(line[base + 14 * stride])
-
-                        #     llc_eject_getx = int(line[base + 0 * stride])
-                        #     llc_eject_upgrade = int(line[base + 1 * stride])
-                        #     llc_eject_gets = int(line[base + 2 * stride])
-                        #     llc_eject_get_instr = int(line[base + 3 * stride])
-                        #     llc_eject_putx = int(line[base + 5 * stride])
-                        #     llc_eject_ack = int(line[base + 13 * stride])
-                        #     llc_eject_unblock = int(line[base + 15 * stride])
-                        #     llc_eject_xunblock = int(line[base + 16 * stride])
-                        #     llc_eject_prepush_ack = int(line[base + 18 * stride])
-                        #     llc_eject_prepush_nack = int(line[base + 19 * stride])
-                        l2_eject_inv = int(line[base + message_index["Req_INV"] * stride])
-                        l2_eject_data = int(line[base + message_index["DATA"] * stride])
-                        l2_eject_xdata = int(line[base + message_index["DATA_EXCLUSIVE"] * stride])
-                        l2_eject_wb_ack = int(line[base + message_index["Resp_WB_ACK"] * stride])
-
-                        llc_eject_getx = int(line[base + message_index["GETX"] * stride])
-                        llc_eject_upgrade = int(line[base + message_index["UPGRADE"] * stride])
-                        llc_eject_gets = int(line[base + message_index["GETS"] * stride])
-                        llc_eject_get_instr = int(line[base + message_index["GET_INSTR"] * stride])
-                        llc_eject_putx = int(line[base + message_index["PUTX"] * stride])
-                        llc_eject_ack = int(line[base + message_index["ACK"] * stride])
-                        llc_eject_unblock = int(line[base + message_index["UNBLOCK"] * stride])
-                        llc_eject_xunblock = int(line[base + message_index["EXCLUSIVE_UNBLOCK"] * stride])
-                        llc_eject_prepush_ack = int(line[base + message_index["PREPUSH_ACK"] * stride])
-                        llc_eject_prepush_nack = int(line[base + message_index["PREPUSH_NACK"] * stride])
-                    elif "ext_out_link_utilization_breakdown::total" in line:
-                        line = line.split()
-                        eject_flits = int(line[1])
-                    elif "int_link_utilization_breakdown" in line and \
-                            "total" not in line:
-                        line = line.split()
-                        # if((scheme == "bingo") | (scheme == "prepush-ack-multicast-feedback-restart-ratio") | (scheme == "prepush-multicast-feedback-restart-ratio") | (scheme == "prepush-ack-stride")):
-                        #     gets = int(line[base + 2 * stride])
-                        #     putx = int(line[base + 5 * stride])
-                        #     data = int(line[base + 12 * stride])
-                        #     data_exclusive = int(line[base + 13 * stride])
-                        #     mem_data = int(line[base + 14 * stride])
-                        #     unblock = int(line[base + 17 * stride])
-                        #     exclusive_unblock = int(line[base + 18 * stride])
-                        #     prepush_ack = int(line[base + 20 * stride])
-                        # else:
-                        #     gets = int(line[base + 2 * stride])
-                        #     putx = int(line[base + 5 * stride])
-                        #     data = int(line[base + 11 * stride])
-                        #     data_exclusive = int(line[base + 12 * stride])
-                        #     mem_data = int(line[base + 13 * stride])
-                        #     unblock = int(line[base + 16 * stride])
-                        #     exclusive_unblock = int(line[base + 17 * stride])
-                        #     prepush_ack = int(line[base + 19 * stride])
-                        # if((benchmark == "blackscholes-large")  | (benchmark == "bodytrack-large") | (benchmark == "fluidanimate-large") | (benchmark == "canneal-large") | (benchmark == "freqmine-large") | (benchmark == "swaptions-large") | (scheme == "bingo") | (scheme == "bingo-16kBPHT") | (scheme == "bingo-stride")):
-                        #     if((scheme == "bingo") | (scheme == "bingo-16kBPHT") | (scheme == "bingo-stride") | (scheme == "prepush-ack-multicast-feedback-restart-ratio") | (scheme == "prepush-multicast-feedback-restart-ratio") | (scheme == "prepush-ack-multicast-feedback-ratio-private") | (scheme == "prepush-multicast-feedback-ratio-private")): #plus two
-                        #         gets = int(line[base + 2 * stride])
-                        #         putx = int(line[base + 5 * stride])
-                        #         data = int(line[base + 12 * stride])
-                        #         data_exclusive = int(line[base + 13 * stride])
-                        #         mem_data = int(line[base + 14 * stride])
-                        #         unblock = int(line[base + 17 * stride])
-                        #         exclusive_unblock = int(line[base + 18 * stride])
-                        #         prepush_ack = int(line[base + 20 * stride])
-                        #     else: #plus one
-                        #         gets = int(line[base + 2 * stride])
-                        #         putx = int(line[base + 5 * stride])
-                        #         data = int(line[base + 11 * stride])
-                        #         data_exclusive = int(line[base + 12 * stride])
-                        #         mem_data = int(line[base + 13 * stride])
-                        #         unblock = int(line[base + 16 * stride])
-                        #         exclusive_unblock = int(line[base + 17 * stride])
-                        #         prepush_ack = int(line[base + 19 * stride])
-                        # elif((scheme == "prepush-ack-multicast-feedback-ratio-private") | (scheme == "prepush-multicast-feedback-ratio-private")):
-                        #     gets = int(line[base + 2 * stride])
-                        #     putx = int(line[base + 5 * stride])
-                        #     data = int(line[base + 12 * stride])
-                        #     data_exclusive = int(line[base + 13 * stride])
-                        #     mem_data = int(line[base + 14 * stride])
-                        #     unblock = int(line[base + 17 * stride])
-                        #     exclusive_unblock = int(line[base + 18 * stride])
-                        #     prepush_ack = int(line[base + 20 * stride])
-                        #     # enable_prepush = int(line[base + 9 * stride])
-                        #     # disable_prepush = int(line[base + 10 * stride])
-                        # else:
-                        #     gets = int(line[base + 2 * stride])
-                        #     putx = int(line[base + 5 * stride])
-                        #     data = int(line[base + 10 * stride])
-                        #     data_exclusive = int(line[base + 11 * stride])
-                        #     mem_data = int(line[base + 12 * stride])
-                        #     unblock = int(line[base + 15 * stride])
-                        #     exclusive_unblock = int(line[base + 16 * stride])
-                        #     prepush_ack = int(line[base + 18 * stride])
-                        gets = int(line[base + message_index["GETS"] * stride])
-                        putx = int(line[base + message_index["PUTX"] * stride])
-                        data = int(line[base + message_index["DATA"] * stride])
-                        data_exclusive = int(line[base + message_index["DATA_EXCLUSIVE"] * stride])
-                        mem_data = int(line[base + message_index["MEMORY_DATA"] * stride])
-                        unblock = int(line[base + message_index["UNBLOCK"] * stride])
-                        exclusive_unblock = int(line[base + message_index["EXCLUSIVE_UNBLOCK"] * stride])
-                        prepush_ack = int(line[base + message_index["PREPUSH_ACK"] * stride])
-                    elif "int_link_utilization_breakdown::total" in line:
-                        line = line.split()
-                        int_link_utilization = int(line[1])
-                        # print("int_link_utilization = " + str(int_link_utilization))
-                    elif "End Simulation Statistics" in line:
-                        break
-
-                if file_empty:
-                    print(f"Warn: {filename} is empty.")
-
-                others = int_link_utilization - gets - putx - data \
-                        - data_exclusive - unblock - exclusive_unblock \
-                        -mem_data - prepush_ack
-                        # -mem_data - prepush_ack - enable_prepush - disable_prepush
-                results["traffic"][benchmark][scheme] = int_link_utilization
-
-                l2_inject_read_request = l2_inject_gets
-                l2_inject_prepushack = l2_inject_prepush_ack + \
-                        l2_inject_prepush_nack
-                if (l2_inject_prepushack != 0):
-                    print( benchmark + "  " + scheme)
-                
-                l2_inject_wb_data = l2_inject_putx
-                l2_inject_others = l2_inject_getx + l2_inject_upgrade + \
-                        l2_inject_get_instr + l2_inject_ack + \
-                        l2_inject_unblock + l2_inject_xunblock
-
-                l2_eject_shared_data = l2_eject_data
-                l2_eject_exclusive_data = l2_eject_xdata
-                l2_eject_others = l2_eject_inv + l2_eject_wb_ack
-
-                llc_inject_shared_data = llc_inject_data
-                llc_inject_exclusive_data = llc_inject_xdata
-                llc_inject_others = llc_inject_inv + llc_inject_wb_ack
-
-                llc_eject_read_request = llc_eject_gets
-                llc_eject_prepushack = llc_eject_prepush_ack + \
-                        llc_eject_prepush_nack
-                llc_eject_wb_data = llc_eject_putx
-                llc_eject_others = llc_eject_getx + llc_eject_upgrade + \
-                        llc_eject_get_instr + llc_eject_ack + \
-                        llc_eject_unblock + llc_eject_xunblock
-
-                if s == 0: # baseline
-                    baseline_total_traffic = int_link_utilization
-
-                    baseline_inject_flits = inject_flits
-                    baseline_inject_ctrl_flits = inject_ctrl_flits
-                    baseline_inject_data_flits = inject_data_flits
-
-                    baseline_eject_flits = eject_flits
-                    baseline_eject_ctrl_flits = eject_ctrl_flits
-                    baseline_eject_data_flits = eject_data_flits
-
-                    baseline_total_l2_inject_traffic = l2_inject_read_request + \
-                            l2_inject_prepushack + l2_inject_wb_data + \
-                            l2_inject_others
-                    baseline_total_l2_eject_traffic = l2_eject_shared_data + \
-                            l2_eject_exclusive_data + l2_eject_others
-                    baseline_total_llc_inject_traffic = llc_inject_data + \
-                            llc_inject_exclusive_data + llc_inject_others
-                    baseline_total_llc_eject_traffic = llc_eject_read_request + \
-                            llc_eject_prepushack + llc_eject_wb_data + \
-                            llc_eject_others
-
-                    if baseline_total_traffic == 0:
-                        baseline_total_traffic = 1
-                        baseline_inject_flits = 1
-                        baseline_inject_ctrl_flits = 1
-                        baseline_inject_data_flits = 1
-                        baseline_eject_flits = 1
-                        baseline_eject_ctrl_flits = 1
-                        baseline_eject_data_flits = 1
-
-                        baseline_total_l2_inject_traffic = 1
-                        baseline_total_eject_traffic = 1
-                        baseline_total_llc_inject_traffic = 1
-                        baseline_total_llc_eject_traffic = 1
-
-
-                excel_line += f"{scheme},{data},{prepush_ack},{gets},{data_exclusive},{putx},{unblock},{exclusive_unblock},{mem_data},{others}"
-                # excel_line += f"{scheme},{data},{prepush_ack},{gets},{data_exclusive},{putx},{unblock},{exclusive_unblock},{mem_data},{enable_prepush},{disable_prepush},{others}"
-                if args.print_csv:
-                    print(excel_line)
-
-                results["traffic-breakdown"][0][b*num_schemes+s] = data
-                results["traffic-breakdown"][1][b*num_schemes+s] = prepush_ack
-                results["traffic-breakdown"][2][b*num_schemes+s] = gets
-                results["traffic-breakdown"][3][b*num_schemes+s] = data_exclusive
-                results["traffic-breakdown"][4][b*num_schemes+s] = putx
-                results["traffic-breakdown"][5][b*num_schemes+s] = unblock
-                results["traffic-breakdown"][6][b*num_schemes+s] = exclusive_unblock
-                results["traffic-breakdown"][7][b*num_schemes+s] = mem_data
-                # results["traffic-breakdown"][8][b*num_schemes+s] = enable_prepush
-                # results["traffic-breakdown"][9][b*num_schemes+s] = disable_prepush
-                results["traffic-breakdown"][8][b*num_schemes+s] = others
-
-                results["concise-traffic-breakdown"][0][b*num_schemes+s] = data
-                results["concise-traffic-breakdown"][1][b*num_schemes+s] = prepush_ack
-                results["concise-traffic-breakdown"][2][b*num_schemes+s] = gets
-                results["concise-traffic-breakdown"][3][b*num_schemes+s] = data_exclusive
-                results["concise-traffic-breakdown"][4][b*num_schemes+s] = putx
-                # results["concise-traffic-breakdown"][5][b*num_schemes+s] = enable_prepush
-                # results["concise-traffic-breakdown"][6][b*num_schemes+s] = disable_prepush
-                concise_others = unblock + exclusive_unblock + mem_data + others
-                results["concise-traffic-breakdown"][5][b*num_schemes+s] = concise_others
-
-                results["concise-normalized-traffic-breakdown"][0][b*num_schemes+s] = \
-                        data / baseline_total_traffic
-                results["concise-normalized-traffic-breakdown"][1][b*num_schemes+s] = \
-                        prepush_ack / baseline_total_traffic
-                results["concise-normalized-traffic-breakdown"][2][b*num_schemes+s] = \
-                        gets / baseline_total_traffic
-                results["concise-normalized-traffic-breakdown"][3][b*num_schemes+s] = \
-                        data_exclusive / baseline_total_traffic
-                results["concise-normalized-traffic-breakdown"][4][b*num_schemes+s] = \
-                        putx / baseline_total_traffic
-                # results["concise-normalized-traffic-breakdown"][5][b*num_schemes+s] = \
-                #         enable_prepush / baseline_total_traffic
-                # results["concise-normalized-traffic-breakdown"][6][b*num_schemes+s] = \
-                #         disable_prepush / baseline_total_traffic
-                results["concise-normalized-traffic-breakdown"][5][b*num_schemes+s] = \
-                        concise_others / baseline_total_traffic
-
-                results["normalized-l2-inject-traffic-breakdown"][0][b*num_schemes+s] = \
-                        l2_inject_read_request / baseline_total_l2_inject_traffic
-                results["normalized-l2-inject-traffic-breakdown"][1][b*num_schemes+s] = \
-                        l2_inject_prepushack / baseline_total_l2_inject_traffic
-                results["normalized-l2-inject-traffic-breakdown"][2][b*num_schemes+s] = \
-                        l2_inject_wb_data / baseline_total_l2_inject_traffic
-                # results["normalized-l2-inject-traffic-breakdown"][3][b*num_schemes+s] = \
-                #         l2_inject_enableprepush / baseline_total_l2_inject_traffic
-                # results["normalized-l2-inject-traffic-breakdown"][4][b*num_schemes+s] = \
-                #         l2_inject_disableprepush / baseline_total_l2_inject_traffic
-                results["normalized-l2-inject-traffic-breakdown"][3][b*num_schemes+s] = \
-                        l2_inject_others / baseline_total_l2_inject_traffic
-
-                results["normalized-l2-eject-traffic-breakdown"][0][b*num_schemes+s] = \
-                        l2_eject_shared_data / baseline_total_l2_eject_traffic
-                results["normalized-l2-eject-traffic-breakdown"][1][b*num_schemes+s] = \
-                        l2_eject_exclusive_data / baseline_total_l2_eject_traffic
-                results["normalized-l2-eject-traffic-breakdown"][2][b*num_schemes+s] = \
-                        l2_eject_others / baseline_total_l2_eject_traffic
-
-                results["neg-normalized-l2-eject-traffic-breakdown"][0][b*num_schemes+s] = \
-                        - (l2_eject_shared_data / baseline_total_l2_eject_traffic)
-                results["neg-normalized-l2-eject-traffic-breakdown"][1][b*num_schemes+s] = \
-                        - (l2_eject_exclusive_data / baseline_total_l2_eject_traffic)
-                results["neg-normalized-l2-eject-traffic-breakdown"][2][b*num_schemes+s] = \
-                        - (l2_eject_others / baseline_total_l2_eject_traffic)
-
-                results["normalized-llc-inject-traffic-breakdown"][0][b*num_schemes+s] = \
-                        llc_inject_shared_data / baseline_total_llc_inject_traffic
-                results["normalized-llc-inject-traffic-breakdown"][1][b*num_schemes+s] = \
-                        llc_inject_exclusive_data / baseline_total_llc_inject_traffic
-                results["normalized-llc-inject-traffic-breakdown"][2][b*num_schemes+s] = \
-                        llc_inject_others / baseline_total_llc_inject_traffic
-
-                results["normalized-llc-eject-traffic-breakdown"][0][b*num_schemes+s] = \
-                        llc_eject_read_request / baseline_total_llc_eject_traffic
-                results["normalized-llc-eject-traffic-breakdown"][1][b*num_schemes+s] = \
-                        llc_eject_prepushack / baseline_total_llc_eject_traffic
-                results["normalized-llc-eject-traffic-breakdown"][2][b*num_schemes+s] = \
-                        llc_eject_wb_data / baseline_total_llc_eject_traffic
-                # results["normalized-llc-eject-traffic-breakdown"][3][b*num_schemes+s] = \
-                #         llc_eject_enableprepush / baseline_total_llc_eject_traffic
-                # results["normalized-llc-eject-traffic-breakdown"][4][b*num_schemes+s] = \
-                #         llc_eject_disableprepush / baseline_total_llc_eject_traffic
-                results["normalized-llc-eject-traffic-breakdown"][3][b*num_schemes+s] = \
-                        llc_eject_others / baseline_total_llc_eject_traffic
-
-                results["neg-normalized-llc-eject-traffic-breakdown"][0][b*num_schemes+s] = \
-                        - (llc_eject_read_request / baseline_total_llc_eject_traffic)
-                results["neg-normalized-llc-eject-traffic-breakdown"][1][b*num_schemes+s] = \
-                        - (llc_eject_prepushack / baseline_total_llc_eject_traffic)
-                results["neg-normalized-llc-eject-traffic-breakdown"][2][b*num_schemes+s] = \
-                        - (llc_eject_wb_data / baseline_total_llc_eject_traffic)
-                # results["neg-normalized-llc-eject-traffic-breakdown"][3][b*num_schemes+s] = \
-                #         - (llc_eject_enableprepush / baseline_total_llc_eject_traffic)
-                # results["neg-normalized-llc-eject-traffic-breakdown"][4][b*num_schemes+s] = \
-                #         - (llc_eject_disableprepush / baseline_total_llc_eject_traffic)
-                results["neg-normalized-llc-eject-traffic-breakdown"][3][b*num_schemes+s] = \
-                        - (llc_eject_others / baseline_total_llc_eject_traffic)
-                
-                results["integrate-normalized-llc-in-eject-traffic-breakdown"][0][b*num_schemes+s] = \
-                        llc_inject_shared_data / (baseline_total_llc_eject_traffic + baseline_total_llc_inject_traffic)
-                results["integrate-normalized-llc-in-eject-traffic-breakdown"][1][b*num_schemes+s] = \
-                        llc_inject_exclusive_data / (baseline_total_llc_eject_traffic + baseline_total_llc_inject_traffic)
-                results["integrate-normalized-llc-in-eject-traffic-breakdown"][2][b*num_schemes+s] = \
-                        llc_eject_read_request / (baseline_total_llc_eject_traffic + baseline_total_llc_inject_traffic)
-                results["integrate-normalized-llc-in-eject-traffic-breakdown"][3][b*num_schemes+s] = \
-                        llc_eject_prepushack / (baseline_total_llc_eject_traffic + baseline_total_llc_inject_traffic)
-                results["integrate-normalized-llc-in-eject-traffic-breakdown"][4][b*num_schemes+s] = \
-                        llc_eject_wb_data / (baseline_total_llc_eject_traffic + baseline_total_llc_inject_traffic)
-                results["integrate-normalized-llc-in-eject-traffic-breakdown"][5][b*num_schemes+s] = \
-                        (llc_inject_others + llc_eject_others) / (baseline_total_llc_eject_traffic + baseline_total_llc_inject_traffic)
-
-                if scheme == "baseline":
-                    results["concise-baseline-traffic-breakdown"][0][b] = data
-                    results["concise-baseline-traffic-breakdown"][1][b] = gets
-                    results["concise-baseline-traffic-breakdown"][2][b] = data_exclusive
-                    results["concise-baseline-traffic-breakdown"][3][b] = putx
-                    concise_others = unblock + exclusive_unblock + mem_data + others
-                    results["concise-baseline-traffic-breakdown"][4][b] = concise_others
-
-                    results["concise-baseline-normalized-traffic-breakdown"][0][b] = \
-                            data / baseline_total_traffic
-                    results["concise-baseline-normalized-traffic-breakdown"][1][b] = \
-                            gets / baseline_total_traffic
-                    results["concise-baseline-normalized-traffic-breakdown"][2][b] = \
-                            data_exclusive / baseline_total_traffic
-                    results["concise-baseline-normalized-traffic-breakdown"][3][b] = \
-                            putx / baseline_total_traffic
-                    results["concise-baseline-normalized-traffic-breakdown"][4][b] = \
-                            concise_others / baseline_total_traffic
-
-                results["normalized-traffic-breakdown"][0][b*num_schemes+s] = \
-                        data / baseline_total_traffic
-                results["normalized-traffic-breakdown"][1][b*num_schemes+s] = \
-                        prepush_ack / baseline_total_traffic
-                results["normalized-traffic-breakdown"][2][b*num_schemes+s] = \
-                        gets / baseline_total_traffic
-                results["normalized-traffic-breakdown"][3][b*num_schemes+s] = \
-                        data_exclusive / baseline_total_traffic
-                results["normalized-traffic-breakdown"][4][b*num_schemes+s] = \
-                        putx / baseline_total_traffic
-                results["normalized-traffic-breakdown"][5][b*num_schemes+s] = \
-                        unblock / baseline_total_traffic
-                results["normalized-traffic-breakdown"][6][b*num_schemes+s] = \
-                        exclusive_unblock / baseline_total_traffic
-                results["normalized-traffic-breakdown"][7][b*num_schemes+s] = \
-                        mem_data / baseline_total_traffic
-                # results["normalized-traffic-breakdown"][8][b*num_schemes+s] = \
-                #         enable_prepush / baseline_total_traffic
-                # results["normalized-traffic-breakdown"][9][b*num_schemes+s] = \
-                #         disable_prepush / baseline_total_traffic
-                results["normalized-traffic-breakdown"][8][b*num_schemes+s] = \
-                        others / baseline_total_traffic
-
-                # network traffic loads
-                results["inject-traffic"][s][b] = inject_flits / 1e6
-                results["inject-ctrl-traffic"][s][b] = inject_ctrl_flits / 1e6
-                results["inject-data-traffic"][s][b] = inject_data_flits / 1e6
-                results["eject-traffic"][s][b] = eject_flits / 1e6
-                results["eject-ctrl-traffic"][s][b] = eject_ctrl_flits / 1e6
-                results["eject-data-traffic"][s][b] = eject_data_flits / 1e6
-                results["network-traffic"][s][b] = int_link_utilization / 1e6
-
-                results["normalized-inject-traffic"][s][b] = \
-                        inject_flits / baseline_inject_flits
-                results["normalized-inject-ctrl-traffic"][s][b] = \
-                        inject_ctrl_flits / baseline_inject_ctrl_flits
-                results["normalized-inject-data-traffic"][s][b] = \
-                        inject_data_flits / baseline_inject_data_flits
-                results["normalized-eject-traffic"][s][b] = \
-                        eject_flits / baseline_eject_flits
-                results["normalized-eject-ctrl-traffic"][s][b] = \
-                        eject_ctrl_flits / baseline_eject_ctrl_flits
-                results["normalized-eject-data-traffic"][s][b] = \
-                        eject_data_flits / baseline_eject_data_flits
-                results["normalized-network-traffic"][s][b] = \
-                        int_link_utilization / baseline_total_traffic
-
-                if args.print_csv:
-                    print(f"normalized-traffic,{benchmark},{scheme},{results['normalized-inject-traffic'][s][b]},{results['normalized-eject-traffic'][s][b]},{results['normalized-network-traffic'][s][b]}")
-
-                results["inject-load"][s][b] = \
-                        inject_flits * cpu_ticks_per_cycle / sim_ticks
-                results["inject-ctrl-load"][s][b] = \
-                        inject_ctrl_flits * cpu_ticks_per_cycle / sim_ticks
-                results["inject-data-load"][s][b] = \
-                        inject_data_flits * cpu_ticks_per_cycle / sim_ticks
-                results["eject-load"][s][b] = \
-                        eject_flits * cpu_ticks_per_cycle / sim_ticks
-                results["eject-ctrl-load"][s][b] = \
-                        eject_ctrl_flits * cpu_ticks_per_cycle / sim_ticks
-                results["eject-data-load"][s][b] = \
-                        eject_data_flits * cpu_ticks_per_cycle / sim_ticks
-                results["network-load"][s][b] = \
-                        int_link_utilization * cpu_ticks_per_cycle / sim_ticks
-
-                if benchmark == args.benchmark and args.print_csv:
-                    print(f"{scheme}:\n"
-                          f"   - inject load {results['inject-load'][s][b]}\n"
-                          f"   - nework load {results['network-load'][s][b]}\n"
-                          f"   -  eject load {results['eject-load'][s][b]}\n"
-                          f"   - inject ctrl load {results['inject-ctrl-load'][s][b]}\n"
-                          f"   - inject data load {results['inject-data-load'][s][b]}\n"
-                          f"   -  eject ctrl load {results['eject-ctrl-load'][s][b]}\n"
-                          f"   -  eject data load {results['eject-data-load'][s][b]}\n")
-
-                statsfile.close()
+            filename = stats_path(args, scheme, benchmark)
+            run = runs[s][b]
+
+            if len(stat_vector(run, TRAFFIC_DIRECTIONS[INJECT])[0]) > 0:
+                print(scheme)
+            if stats_empty(run):
+                print(f"Warn: {filename} is empty.")
+
+            results["traffic"][benchmark][scheme] = \
+                    stat_count(scalars["network_flits"][s, b])
+
+            if l2_inject[1, s, b] != 0:
+                print( benchmark + "  " + scheme)
+
+            if args.print_csv:
+                counts = ",".join(str(stat_count(value))
+                                  for value in network[:, s, b])
+                print(f"{benchmark},{scheme},{counts}")
+                print(f"normalized-traffic,{benchmark},{scheme},{results['normalized-inject-traffic'][s][b]},{results['normalized-eject-traffic'][s][b]},{results['normalized-network-traffic'][s][b]}")
+
+            if benchmark == args.benchmark and args.print_csv:
+                print(f"{scheme}:\n"
+                      f"   - inject load {results['inject-load'][s][b]}\n"
+                      f"   - nework load {results['network-load'][s][b]}\n"
+                      f"   -  eject load {results['eject-load'][s][b]}\n"
+                      f"   - inject ctrl load {results['inject-ctrl-load'][s][b]}\n"
+                      f"   - inject data load {results['inject-data-load'][s][b]}\n"
+                      f"   -  eject ctrl load {results['eject-ctrl-load'][s][b]}\n"
+                      f"   -  eject data load {results['eject-data-load'][s][b]}\n")
 
     return results
 
@@ -1910,8 +2121,7 @@ def process_link_load(args):
     results = {key: {}}
 
     for s, scheme in enumerate(args.scheme_list):
-        directory = f"{args.m5out_dir}/{scheme}/{args.benchmark}-{args.ncpu}cpus"
-        filename = f"{directory}/stats.txt"
+        filename = stats_path(args, scheme, args.benchmark)
 
         results[key][scheme] = {}
         results[key][scheme]["link-name-load"] = {}
@@ -1920,25 +2130,21 @@ def process_link_load(args):
         results[key][scheme]["link-names"] = []
         sorted_loads = []
 
-        with open(filename, "r") as statsfile:
-            for line in statsfile:
-                if "networklinks" in line:
-                    line = line.split()
-                    link_name = line[0].split('.')[2]
-                    load = float(line[1])
-
-                    results[key][scheme]["link-name-load"][link_name] = load
-                    results[key][scheme]["loads"].append(load)
-                    results[key][scheme]["link-names"].append(link_name)
-
-                    if load in sorted_loads:
-                        results[key][scheme]["load-link-names"][load].append(link_name)
-                    else:
-                        sorted_loads.append(load)
-                        results[key][scheme]["load-link-names"][load] = \
-                                [link_name]
-                elif "End Simulation Statistics" in line:
-                    break
+        run = load_stats(filename, LINK_LOAD_STATS)
+        for name, load in stat_items(run, "networklinks"):
+            link_name = name.split('.')[2]
+            load = float(load)
+
+            results[key][scheme]["link-name-load"][link_name] = load
+            results[key][scheme]["loads"].append(load)
+            results[key][scheme]["link-names"].append(link_name)
+
+            if load in sorted_loads:
+                results[key][scheme]["load-link-names"][load].append(link_name)
+            else:
+                sorted_loads.append(load)
+                results[key][scheme]["load-link-names"][load] = \
+                        [link_name]
 
         sorted_loads.sort()
         results[key][scheme]["sorted-loads"] = sorted_loads
@@ -1976,45 +2182,35 @@ def process_paper_runtime_link_widths(args):
 
         for s, scheme in enumerate(args.scheme_list):
             for l, link_width in enumerate(args.link_widths):
-                directory = f"{args.m5out_dir}/link-{link_width}bits/{scheme}/{benchmark}-{args.ncpu}cpus"
-                filename = f"{directory}/stats.txt"
-
-                sim_seconds = 0
-                with open(filename, "r") as statsfile:
-                    for line in statsfile:
-                        if "sim_seconds" in line:
-                            line = line.split()
-                            sim_seconds = float(line[1])
-                            break
-                        else:
-                            continue
-
-                    if l == 0 and s == 0:
-                        baseline_runtime = sim_seconds
-                        if sim_seconds == 0:
-                            print(f"Warn: {filename} may be empty witout stats")
-                            baseline_runtime = 1
-
-                    results["runtime-link-widths"][scheme][benchmark][link_width] = sim_seconds
-                    #results["normalized-runtime-link-widths"][scheme][l][b] = \
-                    #        sim_seconds / baseline_runtime
-                    results["normalized-runtime-link-widths"][scheme][l][b] = \
-                            sim_seconds / results["runtime-link-widths"]["bingo"][benchmark][link_width]
+                filename = stats_path(args, scheme, benchmark, link_width=link_width)
+
+                run = load_stats(filename, GLOBAL_STATS)
+                sim_seconds = stat_value(run, "sim_seconds")
+
+                if l == 0 and s == 0:
+                    baseline_runtime = sim_seconds
                     if sim_seconds == 0:
-                        results["speedup-link-widths"][scheme][l][b] = 0
-                    else:
-                        #results["speedup-link-widths"][scheme][l][b] = \
-                        #        baseline_runtime / sim_seconds
-                        results["speedup-link-widths"][scheme][l][b] = \
-                                results["runtime-link-widths"]["bingo"][benchmark][link_width] / sim_seconds
+                        print(f"Warn: {filename} may be empty witout stats")
+                        baseline_runtime = 1
 
-                    statsfile.close()
+                results["runtime-link-widths"][scheme][benchmark][link_width] = sim_seconds
+                #results["normalized-runtime-link-widths"][scheme][l][b] = \
+                #        sim_seconds / baseline_runtime
+                results["normalized-runtime-link-widths"][scheme][l][b] = \
+                        sim_seconds / results["runtime-link-widths"]["bingo"][benchmark][link_width]
+                if sim_seconds == 0:
+                    results["speedup-link-widths"][scheme][l][b] = 0
+                else:
+                    #results["speedup-link-widths"][scheme][l][b] = \
+                    #        baseline_runtime / sim_seconds
+                    results["speedup-link-widths"][scheme][l][b] = \
+                            results["runtime-link-widths"]["bingo"][benchmark][link_width] / sim_seconds
 
     for s, scheme in enumerate(args.scheme_list):
         if num_benchmarks > 1:
             for l, link_widths in enumerate(args.link_widths):
                 results["speedup-link-widths"][scheme][l][-1] = \
-                        stats.mstats.gmean(results["speedup-link-widths"][scheme][l][0:-1])
+                        gmean(results["speedup-link-widths"][scheme][l][0:-1])
 
     return results
 
@@ -2066,48 +2262,37 @@ def process_paper_runtime_cache_sizes(args):
             if (s == 1):
                 assert(scheme == "bingo")
             for c, cache_size in enumerate(args.cache_sizes):
-                directory = f"{args.m5out_dir}/{cache_size}kB/link-128bits/{scheme}/{benchmark}-{args.ncpu}cpus"
-                filename = f"{directory}/stats.txt"
-
-                sim_seconds = 0
-                with open(filename, "r") as statsfile:
-                    for line in statsfile:
-                        if "sim_seconds" in line:
-                            line = line.split()
-                            sim_seconds = float(line[1])
-                            break
-                        else:
-                            continue
-
-                    if c == 0 and s == 0:
-                        baseline_runtime = sim_seconds
-                        if sim_seconds == 0:
-                            print(f"Warn: {filename} may be empty witout stats")
-                            baseline_runtime = 1
-
-                    results["runtime-cache-sizes"][scheme][benchmark][cache_size] = sim_seconds
-                    #results["normalized-runtime-cache-sizes"][scheme][c][b] = \
-                    #        sim_seconds / baseline_runtime
-                    results["normalized-runtime-cache-sizes"][scheme][c][b] = \
-                            sim_seconds / results["runtime-cache-sizes"]["baseline"][benchmark][cache_size]
+                filename = stats_path(args, scheme, benchmark, cache_size=cache_size)
+
+                run = load_stats(filename, GLOBAL_STATS)
+                sim_seconds = stat_value(run, "sim_seconds")
+
+                if c == 0 and s == 0:
+                    baseline_runtime = sim_seconds
                     if sim_seconds == 0:
-                        results["speedup-cache-sizes"][scheme][c][b] = 0
-                        results["speedup-cache-sizes-forKB"][f"{cache_size}-KB"][s][b] = 0
-                        results["speedup-cache-sizes-forKB-over-Bingo"][f"{cache_size}-KB"][s][b] = 0
-                    else:
-                        #results["speedup-cache-sizes"][scheme][c][b] = \
-                        #        baseline_runtime / sim_seconds
-                        results["speedup-cache-sizes"][scheme][c][b] = \
-                                results["runtime-cache-sizes"]["baseline"][benchmark][cache_size] / sim_seconds
-                        results["speedup-cache-sizes-over-Bingo"][scheme][c][b] = \
-                                results["runtime-cache-sizes"]["bingo"][benchmark][cache_size] / sim_seconds
-                        results["speedup-cache-sizes-forKB"][f"{cache_size}-KB"][s][b] = \
-                                results["runtime-cache-sizes"]["baseline"][benchmark][cache_size] / sim_seconds
-                        results["speedup-cache-sizes-forKB-over-Bingo"][f"{cache_size}-KB"][s][b] = \
-                                results["runtime-cache-sizes"]["bingo"][benchmark][cache_size] / sim_seconds
-                        
-
-                    statsfile.close()
+                        print(f"Warn: {filename} may be empty witout stats")
+                        baseline_runtime = 1
+
+                results["runtime-cache-sizes"][scheme][benchmark][cache_size] = sim_seconds
+                #results["normalized-runtime-cache-sizes"][scheme][c][b] = \
+                #        sim_seconds / baseline_runtime
+                results["normalized-runtime-cache-sizes"][scheme][c][b] = \
+                        sim_seconds / results["runtime-cache-sizes"]["baseline"][benchmark][cache_size]
+                if sim_seconds == 0:
+                    results["speedup-cache-sizes"][scheme][c][b] = 0
+                    results["speedup-cache-sizes-forKB"][f"{cache_size}-KB"][s][b] = 0
+                    results["speedup-cache-sizes-forKB-over-Bingo"][f"{cache_size}-KB"][s][b] = 0
+                else:
+                    #results["speedup-cache-sizes"][scheme][c][b] = \
+                    #        baseline_runtime / sim_seconds
+                    results["speedup-cache-sizes"][scheme][c][b] = \
+                            results["runtime-cache-sizes"]["baseline"][benchmark][cache_size] / sim_seconds
+                    results["speedup-cache-sizes-over-Bingo"][scheme][c][b] = \
+                            results["runtime-cache-sizes"]["bingo"][benchmark][cache_size] / sim_seconds
+                    results["speedup-cache-sizes-forKB"][f"{cache_size}-KB"][s][b] = \
+                            results["runtime-cache-sizes"]["baseline"][benchmark][cache_size] / sim_seconds
+                    results["speedup-cache-sizes-forKB-over-Bingo"][f"{cache_size}-KB"][s][b] = \
+                            results["runtime-cache-sizes"]["bingo"][benchmark][cache_size] / sim_seconds
 
     print(results["speedup-cache-sizes-forKB"])
 
@@ -2115,13 +2300,13 @@ def process_paper_runtime_cache_sizes(args):
         if num_benchmarks > 1:
             for c, cache_sizes in enumerate(args.cache_sizes):
                 results["speedup-cache-sizes"][scheme][c][-1] = \
-                        stats.mstats.gmean(results["speedup-cache-sizes"][scheme][c][0:-1])
+                        gmean(results["speedup-cache-sizes"][scheme][c][0:-1])
                 results["speedup-cache-sizes-over-Bingo"][scheme][c][-1] = \
-                        stats.mstats.gmean(results["speedup-cache-sizes-over-Bingo"][scheme][c][0:-1])
+                        gmean(results["speedup-cache-sizes-over-Bingo"][scheme][c][0:-1])
                 results["speedup-cache-sizes-forKB"][f"{cache_sizes}-KB"][s][-1] = \
-                        stats.mstats.gmean(results["speedup-cache-sizes-forKB"][f"{cache_sizes}-KB"][s][0:-1]) # with gmean
+                        gmean(results["speedup-cache-sizes-forKB"][f"{cache_sizes}-KB"][s][0:-1]) # with gmean
                 results["speedup-cache-sizes-forKB-over-Bingo"][f"{cache_sizes}-KB"][s][-1] = \
-                        stats.mstats.gmean(results["speedup-cache-sizes-forKB-over-Bingo"][f"{cache_sizes}-KB"][s][0:-1])
+                        gmean(results["speedup-cache-sizes-forKB-over-Bingo"][f"{cache_sizes}-KB"][s][0:-1])
 
     print(results["speedup-cache-sizes-forKB"])
 
@@ -2152,40 +2337,30 @@ def process_runtime_link_widths(args):
 
             baseline_runtime = None
             for l, link_width in enumerate(args.link_widths):
-                directory = f"{args.m5out_dir}/link-{link_width}bits/{scheme}/{benchmark}-{args.ncpu}cpus"
-                filename = f"{directory}/stats.txt"
-
-                sim_seconds = 0
-                with open(filename, "r") as statsfile:
-                    for line in statsfile:
-                        if "sim_seconds" in line:
-                            line = line.split()
-                            sim_seconds = float(line[1])
-                            break
-                        else:
-                            continue
-
-                    if l == 0:
-                        baseline_runtime = sim_seconds
-                        if sim_seconds == 0:
-                            print(f"Warn: {filename} may be empty witout stats")
-                            baseline_runtime = 1
-
-                    results["runtime-link-widths"][scheme][benchmark][link_width] = sim_seconds
-                    results["normalized-runtime-link-widths"][scheme][l][b] = \
-                            sim_seconds / baseline_runtime
+                filename = stats_path(args, scheme, benchmark, link_width=link_width)
+
+                run = load_stats(filename, GLOBAL_STATS)
+                sim_seconds = stat_value(run, "sim_seconds")
+
+                if l == 0:
+                    baseline_runtime = sim_seconds
                     if sim_seconds == 0:
-                        results["speedup-link-widths"][scheme][l][b] = 0
-                    else:
-                        results["speedup-link-widths"][scheme][l][b] = \
-                                baseline_runtime / sim_seconds
+                        print(f"Warn: {filename} may be empty witout stats")
+                        baseline_runtime = 1
 
-                    statsfile.close()
+                results["runtime-link-widths"][scheme][benchmark][link_width] = sim_seconds
+                results["normalized-runtime-link-widths"][scheme][l][b] = \
+                        sim_seconds / baseline_runtime
+                if sim_seconds == 0:
+                    results["speedup-link-widths"][scheme][l][b] = 0
+                else:
+                    results["speedup-link-widths"][scheme][l][b] = \
+                            baseline_runtime / sim_seconds
 
         if num_benchmarks > 1:
             for l, link_widths in enumerate(args.link_widths):
                 results["speedup-link-widths"][scheme][l][-1] = \
-                        stats.mstats.gmean(results["speedup-link-widths"][scheme][l][0:-1])
+                        gmean(results["speedup-link-widths"][scheme][l][0:-1])
 
         if args.print_csv:
             print(f"{scheme}runtime-link-wdiths:")
@@ -2236,34 +2411,19 @@ def process_filter_distribution(args):
         results[key][benchmark]["LLC"] = 0
         results[key][benchmark]["Network"] = 0
 
-        filename = f"{args.m5out_dir}/{args.prepush_scheme}/{benchmark}-{args.ncpu}cpus/stats.txt"
+        filename = stats_path(args, args.prepush_scheme, benchmark)
 
         total = 0
-        with open(filename, "r") as statsfile:
-            for line in statsfile:
-                if "core_ni_prepush_filter_activity" in line:
-                    line = line.split()
-                    results[key][benchmark]["Core-NI"] = int(line[1])
-                    total += int(line[1])
-                elif "core_prepush_filter_activity" in line:
-                    line = line.split()
-                    results[key][benchmark]["Core-Cache"] = int(line[1])
-                    total += int(line[1])
-                elif "llc_ni_prepush_filter_activity" in line:
-                    line = line.split()
-                    results[key][benchmark]["LLC-NI"] = int(line[1])
-                    total += int(line[1])
-                elif "llc_prepush_filter_activity" in line:
-                    line = line.split()
-                    results[key][benchmark]["LLC"] = int(line[1])
-                    total += int(line[1])
-                elif "router_prepush_filter_activity" in line:
-                    line = line.split()
-                    results[key][benchmark]["Network"] = int(line[1])
-                    total += int(line[1])
-                    break
-                elif "End Simulation Statistics" in line:
-                    break
+        run = load_stats(filename, NETWORK_STATS)
+        for component, stat in (
+                ("Core-NI", "core_ni_prepush_filter_activity"),
+                ("Core-Cache", "core_prepush_filter_activity"),
+                ("LLC-NI", "llc_ni_prepush_filter_activity"),
+                ("LLC", "llc_prepush_filter_activity"),
+                ("Network", "router_prepush_filter_activity")):
+            activity = stat_count(stat_value(run, stat))
+            results[key][benchmark][component] = activity
+            total += activity
 
         results[key][benchmark]["total"] = total
 
@@ -2283,32 +2443,21 @@ def write_invalidation(args):
 
         baseline_writeinvalidation_interval = None
         for s, scheme in enumerate(args.scheme_list):
-            directory = f"{args.m5out_dir}/{scheme}/{benchmark}-{args.ncpu}cpus"
-            filename = f"{directory}/stats.txt"
-
-            writeinvalidation_interval = 0
-
-            with open(filename, "r") as statsfile:
-                for line in statsfile:
-                    if "system.ruby.L1Cache.average_tick_in_write_invalidation" in line:
-                        line = line.split()
-                        writeinvalidation_interval = float(line[1])
-                        # print(f"Find stats!!")
-                        break
-                    else:
-                        continue
-
-                if s == 0:
-                    baseline_writeinvalidation_interval = writeinvalidation_interval
-                    if writeinvalidation_interval == 0:
-                        print(f"Warn: {filename} may be empty witout stats")
-                        baseline_writeinvalidation_interval = 1
+            filename = stats_path(args, scheme, benchmark)
 
-                results[f"writeinvalidation-interval"][benchmark][scheme] = writeinvalidation_interval
-                results[f"normalized-writeinvalidation-interval"][s][b] = \
-                        writeinvalidation_interval / baseline_writeinvalidation_interval
+            run = load_stats(filename, L1CACHE_STATS)
+            writeinvalidation_interval = stat_value(
+                    run, "system.ruby.L1Cache.average_tick_in_write_invalidation")
+
+            if s == 0:
+                baseline_writeinvalidation_interval = writeinvalidation_interval
+                if writeinvalidation_interval == 0:
+                    print(f"Warn: {filename} may be empty witout stats")
+                    baseline_writeinvalidation_interval = 1
 
-                statsfile.close()
+            results[f"writeinvalidation-interval"][benchmark][scheme] = writeinvalidation_interval
+            results[f"normalized-writeinvalidation-interval"][s][b] = \
+                    writeinvalidation_interval / baseline_writeinvalidation_interval
 
     if args.print_csv:
         print(f"writeinvalidation interval:")
@@ -2347,32 +2496,21 @@ def process_load(args):
 
         baseline_load_interval = None
         for s, scheme in enumerate(args.scheme_list):
-            directory = f"{args.m5out_dir}/{scheme}/{benchmark}-{args.ncpu}cpus"
-            filename = f"{directory}/stats.txt"
-
-            load_interval = 0
-
-            with open(filename, "r") as statsfile:
-                for line in statsfile:
-                    if "system.ruby.L1Cache.average_tick_in_load" in line:
-                        line = line.split()
-                        load_interval = float(line[1])
-                        # print(f"Find stats!!")
-                        break
-                    else:
-                        continue
-
-                if s == 0:
-                    baseline_load_interval = load_interval
-                    if load_interval == 0:
-                        print(f"Warn: {filename} may be empty witout stats")
-                        baseline_load_interval = 1
+            filename = stats_path(args, scheme, benchmark)
+
+            run = load_stats(filename, L1CACHE_STATS)
+            load_interval = stat_value(
+                    run, "system.ruby.L1Cache.average_tick_in_load")
 
-                results[f"load-interval"][benchmark][scheme] = load_interval
-                results[f"normalized-load-interval"][s][b] = \
-                        load_interval / baseline_load_interval
+            if s == 0:
+                baseline_load_interval = load_interval
+                if load_interval == 0:
+                    print(f"Warn: {filename} may be empty witout stats")
+                    baseline_load_interval = 1
 
-                statsfile.close()
+            results[f"load-interval"][benchmark][scheme] = load_interval
+            results[f"normalized-load-interval"][s][b] = \
+                    load_interval / baseline_load_interval
 
     if args.print_csv:
         print(f"load interval:")
@@ -2422,41 +2560,23 @@ def process_prepush(args):
         redundancy_drop = 0
         deadlock_drop = 0
 
-        filename = f"{args.m5out_dir}/{args.prepush_scheme}/{benchmark}-{args.ncpu}cpus/stats.txt"
-
-        with open(filename, "r") as statsfile:
-            for line in statsfile:
-                if "total_early_prepushed_demand_cache_entries" in line:
-                    line = line.split()
-                    demand = int(line[1])
-                elif "total_prepushed_cache_entries" in line:
-                    line = line.split()
-                    prepushed_cache_entries = int(line[1])
-                elif "total_prepushes_dropped_for_coherence" in line:
-                    line = line.split()
-                    coherence_drop = int(line[1])
-                elif "total_prepushes_dropped_for_deadlock" in line:
-                    line = line.split()
-                    deadlock_drop = int(line[1])
-                elif "total_prepushes_dropped_for_redundancy " in line:
-                    line = line.split()
-                    redundancy_drop = int(line[1])
-                # TODO: break redundancy in to cache and perpush buffer
-                elif "total_prepushes_received" in line:
-                    line = line.split()
-                    total = int(line[1])
-                elif "total_touched_prepushed_cache_entries" in line:
-                    line = line.split()
-                    used = int(line[1])
-                    unused = prepushed_cache_entries - used
-                    break
-                elif "End Simulation Statistics" in line:
-                    break
-
-            if used == 0:
-                unused = prepushed_cache_entries
-
-            statsfile.close()
+        filename = stats_path(args, args.prepush_scheme, benchmark)
+
+        run = load_stats(filename, L1CACHE_STATS)
+        demand = stat_count(stat_value(
+                run, "total_early_prepushed_demand_cache_entries"))
+        prepushed_cache_entries = stat_count(stat_value(
+                run, "total_prepushed_cache_entries"))
+        coherence_drop = stat_count(stat_value(
+                run, "total_prepushes_dropped_for_coherence"))
+        deadlock_drop = stat_count(stat_value(
+                run, "total_prepushes_dropped_for_deadlock"))
+        redundancy_drop = stat_count(stat_value(
+                run, "total_prepushes_dropped_for_redundancy$"))
+        # TODO: break redundancy in to cache and perpush buffer
+        total = stat_count(stat_value(run, "total_prepushes_received"))
+        used = stat_count(stat_value(run, "total_touched_prepushed_cache_entries"))
+        unused = prepushed_cache_entries - used
         # if total != demand + used + unused + coherence_drop + redundancy_drop + deadlock_drop:
         #     print(f"{benchmark}: total {total}, demand {demand}, used {used}, "
         #           f"unused {unused}, coherence-drop {coherence_drop}, "
@@ -2505,41 +2625,20 @@ def process_misses(args):
 
         baseline_miss_rate = 0
         for s, scheme in enumerate(args.scheme_list):
-            directory = f"{args.m5out_dir}/{scheme}/{benchmark}-{args.ncpu}cpus"
-            filename = f"{directory}/stats.txt"
-
-            demand_accesses = 0
-            demand_hits = 0
-            demand_misses = 0
-            demand_misses_l0 = 0
-
-            total_insts = 0
-
-            file_empty = True
-            with open(filename, "r") as statsfile:
-                for line in statsfile:
-                    file_empty = False
-                    if "l0_cntrl" in line and "cache.demand_misses" in line:
-                        line = line.split()
-                        demand_misses_l0 += int(line[1])
-                    elif "l1_cntrl" in line and "cache.demand_accesses" in line:
-                        line = line.split()
-                        demand_accesses += int(line[1])
-                    elif "l1_cntrl" in line and "cache.demand_hits" in line:
-                        line = line.split()
-                        demand_hits += int(line[1])
-                    elif "l1_cntrl" in line and "cache.demand_misses" in line:
-                        line = line.split()
-                        demand_misses += int(line[1])
-                    elif "sim_insts" in line:
-                        line = line.split()
-                        total_insts += int(line[1])
-                    elif "End Simulation Statistics" in line:
-                        break
-
-                statsfile.close()
-
-            assert demand_accesses == demand_hits + demand_misses
+            filename = stats_path(args, scheme, benchmark)
+
+            run = load_stats(filename, MISSES_STATS)
+
+            demand_misses_l0 = stat_count(stat_sum(run, "l0_cntrl", "cache.demand_misses"))
+            demand_accesses = stat_count(stat_sum(run, "l1_cntrl", "cache.demand_accesses"))
+            demand_hits = stat_count(stat_sum(run, "l1_cntrl", "cache.demand_hits"))
+            demand_misses = stat_count(stat_sum(run, "l1_cntrl", "cache.demand_misses"))
+            total_insts = stat_count(stat_sum(run, "sim_insts"))
+
+            file_empty = stats_empty(run)
+
+            assert stats_missing(run) or \
+                    demand_accesses == demand_hits + demand_misses
 
             if file_empty:
                 assert demand_accesses == 0
@@ -2821,23 +2920,37 @@ def plot_access_interval_histogram(args, results):
         plt.show()
 
 
-def plot_interval_distribution(args, results):
-    general_access_results = {"Access Interval (Cycle)":
-            results["Access Interval (Cycle)"],
-            "Consecutive Access Pair": results["Consecutive Access Pair"]}
-    end_access_result = {"First-to-Last Access Interval (Cycle)":
-            results["First-to-Last Access Interval (Cycle)"]}
-    general_request_results = {"Request Interval (Cycle)":
-            results["Request Interval (Cycle)"],
-            "Consecutive Request Pair": results["Consecutive Request Pair"]}
-    end_request_result = {"First-to-Last Request Interval (Cycle)":
-            results["First-to-Last Request Interval (Cycle)"]}
-
-    access_df = pd.DataFrame(data=general_access_results)
-    access_enddf = pd.DataFrame(data=end_access_result)
-    request_df = pd.DataFrame(data=general_request_results)
-    request_enddf = pd.DataFrame(data=end_request_result)
+def draw_interval_violins(ax, sketches, color, width=0.8):
+    """Violins of interval sketches with a seaborn-like inner box. The
+    position of an empty sketch is left blank."""
+    positions = list(range(len(sketches)))
+    drawn = [(position, sketch) for position, sketch in zip(positions, sketches)
+             if sketch["count"] > 0]
+    if drawn:
+        parts = ax.violin(
+                [interval_sketch_violin_stats(sketch) for _, sketch in drawn],
+                positions=[position for position, _ in drawn], widths=width,
+                showmeans=False, showextrema=False, showmedians=False)
+        for body in parts["bodies"]:
+            body.set_facecolor(color)
+            body.set_edgecolor("#3f3f3f")
+            body.set_alpha(1)
+
+    for position, sketch in drawn:
+        q1, median, q3 = interval_sketch_quantiles(sketch, [0.25, 0.5, 0.75])
+        whisker_low = max(sketch["min"], q1 - 1.5 * (q3 - q1))
+        whisker_high = min(sketch["max"], q3 + 1.5 * (q3 - q1))
+        ax.vlines(position, whisker_low, whisker_high, color="#3f3f3f",
+                linewidth=1)
+        ax.vlines(position, q1, q3, color="#3f3f3f", linewidth=5)
+        ax.scatter(position, median, color="white", s=12, zorder=3)
+
+    ax.set_xlim(-0.5, len(sketches) - 0.5)
+
+    return positions
+
 
+def plot_interval_distribution(args, results):
     #colors = ["#5b9bd5"] # ppt light-blue
     #colors = ["#a9d18e"] # ppt light-green
     access_colors = ["#92d050"] # ppt green
@@ -2851,8 +2964,13 @@ def plot_interval_distribution(args, results):
     pdfpage, fig = pdf.plot_setup(figname, figsize=(12, 4.8), fontsize=14,
             font=("family", "Tw Cen MT"))
     ax = fig.gca()
-    g = sns.violinplot(x="Consecutive Access Pair", y="Access Interval (Cycle)",
-            data=access_df, ax=ax, palette=access_colors, width=1)
+    pairs = list(results["access-pairs"])
+    positions = draw_interval_violins(ax,
+            [results["access-pairs"][pair] for pair in pairs],
+            access_colors[0], width=1)
+    ax.set_xticks(positions)
+    ax.set_xticklabels(pairs)
+    ax.set_xlabel("Consecutive Access Pair")
     ax.yaxis.grid(True, linestyle='--', color='k')
     ax.set_ylabel(f"{Iter}Access Interval (Cycle)")
     fig.subplots_adjust(left=0.08, right=0.99)
@@ -2864,22 +2982,28 @@ def plot_interval_distribution(args, results):
     endpdfpage, endfig = pdf.plot_setup(figname, figsize=(3.2, 4.8),
             fontsize=14, font=("family", "Tw Cen MT"))
     endax = endfig.gca()
-    endg = sns.violinplot(y="First-to-Last Access Interval (Cycle)",
-            data=access_enddf, ax=endax, palette=access_colors)
+    draw_interval_violins(endax, [results["access-end"]], access_colors[0])
+    endax.set_xticks([])
     endax.yaxis.grid(True, linestyle='--', color='k')
-    ax.set_ylabel(f"{Iter}First-to-Last Access Interval (Cycle)")
+    endax.set_ylabel(f"{Iter}First-to-Last Access Interval (Cycle)")
     endfig.subplots_adjust(left=0.4)
     if not args.disable_pdf:
         pdf.plot_teardown(endpdfpage, endfig)
 
     # request interval violin plot
-    if results["First-to-Last Request Interval (Cycle)"]:
+    if results["request-end"]["count"] > 0:
         figname = f"{args.fig_dir}/{args.benchmark}-request-interval-violin.pdf"
         pdfpage, fig = pdf.plot_setup(figname, figsize=(12, 4.8), fontsize=14,
                 font=("family", "Tw Cen MT"))
         ax = fig.gca()
-        g = sns.violinplot(x="Consecutive Request Pair", y="Request Interval (Cycle)",
-                data=request_df, ax=ax, palette=request_colors)
+        pairs = list(results["request-pairs"])
+        positions = draw_interval_violins(ax,
+                [results["request-pairs"][pair] for pair in pairs],
+                request_colors[0])
+        ax.set_xticks(positions)
+        ax.set_xticklabels(pairs)
+        ax.set_xlabel("Consecutive Request Pair")
+        ax.set_ylabel("Request Interval (Cycle)")
         ax.yaxis.grid(True, linestyle='--', color='k')
         fig.subplots_adjust(left=0.08, right=0.99)
         if not args.disable_pdf:
@@ -2890,8 +3014,10 @@ def plot_interval_distribution(args, results):
         endpdfpage, endfig = pdf.plot_setup(figname, figsize=(3.2, 4.8),
                 fontsize=14, font=("family", "Tw Cen MT"))
         endax = endfig.gca()
-        endg = sns.violinplot(y="First-to-Last Request Interval (Cycle)",
-                data=request_enddf, ax=endax, palette=request_colors)
+        draw_interval_violins(endax, [results["request-end"]],
+                request_colors[0])
+        endax.set_xticks([])
+        endax.set_ylabel("First-to-Last Request Interval (Cycle)")
         endax.yaxis.grid(True, linestyle='--', color='k')
         endfig.subplots_adjust(left=0.4)
         if not args.disable_pdf:
@@ -3764,7 +3890,7 @@ def plot_traffic(args, results):
             xticks.append(i * (len(args.scheme_list) + 1) + j)
 
     data = [list(i) for i in zip(*results["traffic-breakdown"])]
-    data = np.array(data, dtype=np.int64)
+    data = np.array(data, dtype=np.float64)
 
     figname = f"{args.fig_dir}/traffic-breakdown.pdf"
     if num_benchmarks == 1:
@@ -3906,7 +4032,7 @@ def plot_traffic(args, results):
 
 
     data = [list(i) for i in zip(*results["concise-traffic-breakdown"])]
-    data = np.array(data, dtype=np.int64)
+    data = np.array(data, dtype=np.float64)
 
     figname = f"{args.fig_dir}/concise-traffic-breakdown.pdf"
     if num_benchmarks == 1:
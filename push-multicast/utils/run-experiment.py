@@ -7,6 +7,11 @@ import time
 from copy import deepcopy
 import multiprocessing as mp
 import json
+import queue
+import hashlib
+import socket
+import threading
+import signal
 
 
 def calculate_closest_factors(num):
@@ -22,6 +27,14 @@ def calculate_closest_factors(num):
 # calculate_closest_factors() - end
 
 
+# --noc-topology: gem5 topology (None for the mesh) and its routing algorithm
+NOC_TOPOLOGIES = {
+    "mesh": (None, None),
+    "express-mesh": ("ExpressMesh_XY", 5),
+    "flattened-butterfly": ("FlattenedButterfly", 6),
+    "clustered-mesh": ("ClusteredMesh", 7),
+}
+
 def get_command(args, cmd, options):
     command = []
 
@@ -38,6 +51,8 @@ def get_command(args, cmd, options):
     command.append(f"--debug-flags={args.debug_flags}")
     if args.sweep or args.launch_experiments or args.no_listener:
         command.append('--listener-mode=off')
+    if args.stats_server:
+        command.append(f"--stats-server={STATS_SOCKET}")
 
     # runscript and system config
     if args.launch_experiments == "prepush-ack-bingo":
@@ -58,7 +73,7 @@ def get_command(args, cmd, options):
     command.append("--l2cache")
     command.append("--ruby")
     command.append(f"--ruby-clock={args.ruby_clock}")
-    command.append("--num-dirs=4")
+    command.append(f"--num-dirs={args.num_dirs}")
     command.append(f"--num-l2caches={args.num_cpus}")
     command.append("--l0i_size=32kB")
     command.append("--l0i_assoc=8")
@@ -108,8 +123,21 @@ def get_command(args, cmd, options):
     command.append("--router-latency=2")
     command.append("--link-latency=1")
     command.append(f"--link-width-bits={args.link_width_bits}")
-    command.append("--topology=MeshDirCorners_XY")
-    rows, _ = calculate_closest_factors(args.num_cpus)
+    topology, routing = NOC_TOPOLOGIES[args.noc_topology]
+    if topology is None and args.concentration == 1 and \
+            args.dir_placement == "corners" and args.num_dirs == 4:
+        command.append("--topology=MeshDirCorners_XY")
+    else:
+        command.append(f"--topology={topology or 'ConcentratedMesh_XY'}")
+        command.append(f"--concentration={args.concentration}")
+        command.append(f"--dir-placement={args.dir_placement}")
+    if args.noc_topology == "express-mesh":
+        command.append(f"--express-interval={args.express_interval}")
+    elif args.noc_topology == "clustered-mesh":
+        command.append(f"--cluster-rows={args.cluster_rows}")
+        command.append(f"--cluster-cols={args.cluster_cols}")
+    assert args.num_cpus % args.concentration == 0
+    rows, _ = calculate_closest_factors(args.num_cpus // args.concentration)
     command.append(f"--mesh-rows={rows}")
     assert (64 * 8) % args.link_width_bits == 0 # 64: cacheline size in bytes
     buffers_per_data_vc = (64 * 8 // args.link_width_bits) + 1
@@ -117,7 +145,8 @@ def get_command(args, cmd, options):
     if args.enable_multicast:
         command.append("--enable-multicast")
         command.append("--asynchronous-multicast")
-    command.append(f"--routing-algorithm={args.routing}")
+    # the other topologies need their own routing algorithm
+    command.append(f"--routing-algorithm={routing or args.routing}")
     if args.hold_switch_for_multicast_only:
         command.append("--hold-switch-for-multicast-only")
 
@@ -156,7 +185,16 @@ def get_command(args, cmd, options):
         command.append("--coalescing")
 
     # Others
-    command.append(f"--fast-forward={sys.maxsize}")
+    if args.restore_roi_checkpoint is not None:
+        # restore straight into the detailed CPU at the ROI begin
+        command.append(f"--checkpoint-dir={args.restore_roi_checkpoint}")
+        command.append("--checkpoint-restore=1")
+        command.append(f"--restore-with-cpu={args.cpu_type}")
+    else:
+        command.append(f"--fast-forward={sys.maxsize}")
+        if args.take_roi_checkpoint:
+            command.append(f"--checkpoint-dir={args.outdir}")
+            command.append("--checkpoint-at-roi")
     if args.log:
         logfile_path = f"{args.outdir}/sim.log"
         logdir = os.path.dirname(logfile_path)
@@ -491,8 +529,145 @@ def get_benchmark_cmd_options(args):
 # get_benchmark_cmd_options() - end
 
 
-def run_gem5_instance(args):
-    """ Run a simulation instance. """
+def process_tree(pid):
+    """ Process ids of pid and all its descendants. """
+
+    children = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", "r") as f:
+                # the command name may hold spaces and parentheses
+                fields = f.read().rsplit(")", 1)[1].split()
+        except (OSError, IndexError):
+            continue  # the process exited meanwhile
+        children.setdefault(int(fields[1]), []).append(int(entry))
+
+    tree = [pid]
+    for p in tree:
+        tree.extend(children.get(p, []))
+    return tree
+# process_tree() - end
+
+
+def process_cpu_time(pids):
+    """ User and system CPU time in seconds used by processes. """
+
+    cpu_time = 0
+    for pid in pids:
+        try:
+            with open(f"/proc/{pid}/stat", "r") as f:
+                fields = f.read().rsplit(")", 1)[1].split()
+        except (OSError, IndexError):
+            continue
+        # utime and stime, fields 14 and 15 of stat
+        cpu_time += int(fields[11]) + int(fields[12])
+    return cpu_time / os.sysconf("SC_CLK_TCK")
+# process_cpu_time() - end
+
+
+def wait_exit(pid, timeout):
+    """ Wait up to timeout seconds for a child to exit without reaping it,
+    return whether it exited. """
+
+    deadline = time.time() + timeout
+    while os.waitid(os.P_PID, pid,
+                    os.WEXITED | os.WNOHANG | os.WNOWAIT) is None:
+        if time.time() >= deadline:
+            return False
+        time.sleep(min(1, max(deadline - time.time(), 0)))
+    return True
+# wait_exit() - end
+
+
+def watchdog_sample(args, pid):
+    """ Progress indicators of a running simulation for the watchdog. """
+
+    reply = query_stats_server(args.outdir)
+    return {
+        "time": time.time(),
+        "tick": None if reply is None else reply.get("tick"),
+        "insts": None if reply is None else reply.get("sim_insts"),
+        "cpu": process_cpu_time(process_tree(pid)),
+    }
+# watchdog_sample() - end
+
+
+def advancing(args, last, sample):
+    """ Check whether a simulation advanced between two watchdog samples. """
+
+    # the stats server answers from a periodic event, so a silent server
+    # means gem5 is stuck inside an event (or taking a checkpoint), however
+    # much CPU time it burns
+    if sample["tick"] is None:
+        return False
+    if last["tick"] is None:
+        return True
+    # ticks keep advancing in a livelock, the committed instructions do not
+    if last["insts"] is not None and sample["insts"] is not None:
+        progress = sample["insts"] - last["insts"]
+    else:
+        progress = sample["tick"] - last["tick"]
+    return progress > args.watchdog_min_rate * (sample["time"] - last["time"])
+# advancing() - end
+
+
+def kill_hung_instance(args, pid, reason):
+    """ Dump the stats and the stack of a hung simulation, then kill it. """
+
+    print(f"Watchdog: {args.outdir} {reason} for "
+          f"{args.watchdog_timeout}s, killing it")
+    # gem5 dumps its stats on SIGUSR1 and prints its backtrace on SIGABRT,
+    # the shell running it is left alone so that wait4() still reaps it
+    for sig in [signal.SIGUSR1, signal.SIGABRT, signal.SIGKILL]:
+        pids = process_tree(pid)
+        gem5 = pids[1:] if len(pids) > 1 else pids
+        for p in gem5:
+            try:
+                os.kill(p, sig)
+            except ProcessLookupError:
+                pass
+        if wait_exit(pid, args.watchdog_grace):
+            break
+
+    # the stats dumped on SIGUSR1 must not look like a complete run
+    if os.path.exists(f"{args.outdir}/stats.txt"):
+        os.replace(f"{args.outdir}/stats.txt",
+                   f"{args.outdir}/stats-{reason}.txt")
+# kill_hung_instance() - end
+
+
+def watch_gem5_instance(args, pid):
+    """ Supervise a running simulation until it exits, killing it if it
+    stops advancing for the watchdog timeout. Return why it was killed,
+    None if it exited by itself. """
+
+    period = min(args.watchdog_timeout / 4, 60)
+    last = watchdog_sample(args, pid)
+    # the stats server only answers once simulate() runs, the watchdog is
+    # armed by its first reply so that a long instantiate() is not a hang
+    armed = last["tick"] is not None
+    while not wait_exit(pid, period):
+        sample = watchdog_sample(args, pid)
+        armed = armed or sample["tick"] is not None
+        if not armed or advancing(args, last, sample):
+            last = sample
+        elif sample["time"] - last["time"] >= args.watchdog_timeout:
+            # spinning without advancing is a livelock, not using the CPU
+            # at all a hang
+            busy = (sample["cpu"] - last["cpu"]) / \
+                    (sample["time"] - last["time"])
+            reason = "livelock" if busy > 0.5 else "stalled"
+            kill_hung_instance(args, pid, reason)
+            return reason
+    return None
+# watch_gem5_instance() - end
+
+
+def run_gem5_instance(args, check=True):
+    """ Run a simulation instance, return its exit code, peak memory and
+    the reason the watchdog killed it, if any. """
 
     cmd, options = get_benchmark_cmd_options(args)
 
@@ -501,21 +676,500 @@ def run_gem5_instance(args):
 
     if args.dry_run:
         print(command)
+        return 0, 0, None
     else:
         start_time = time.time()
         print(f"Running '{command}' at {time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(start_time))}")
 
-        returncode = subprocess.run(command, env=os.environ,
-                shell=True).returncode
+        # wait4() reports the peak RSS of the shell and the gem5 process
+        # it waited for, ru_maxrss is in KiB on Linux
+        proc = subprocess.Popen(command, env=os.environ, shell=True)
+        hang = None
+        if args.watchdog_timeout:
+            hang = watch_gem5_instance(args, proc.pid)
+        _, status, rusage = os.wait4(proc.pid, 0)
+        returncode = proc.returncode = os.waitstatus_to_exitcode(status)
+        max_rss = rusage.ru_maxrss * 1024
 
         end_time = time.time()
         print(f"Finished '{command}' at {time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(end_time))}. Total time = {end_time - start_time}")
 
-        if returncode != 0:
-            raise RuntimeError(f"{command} -> {returncode}")
+        if check and (returncode != 0 or hang):
+            raise RuntimeError(f"{command} -> {hang or returncode}")
+        return returncode, max_rss, hang
 # run_gem5_instance() - end
 
 
+def stats_complete(outdir):
+    """ Check whether a simulation left a complete stats.txt in outdir. """
+
+    filename = f"{outdir}/stats.txt"
+    if not os.path.isfile(filename):
+        return False
+    # a finished run ends with the end marker of its last stats dump
+    with open(filename, "rb") as f:
+        f.seek(max(os.path.getsize(filename) - 4096, 0))
+        return b"End Simulation Statistics" in f.read()
+# stats_complete() - end
+
+
+# stats server socket of a running job, relative to its outdir
+STATS_SOCKET = "stats.sock"
+
+
+def query_stats_server(outdir, stats=(), timeout=5):
+    """ Ask the stats server of the job running in outdir for its progress
+    and the current values of stats, None if it doesn't answer. """
+
+    path = os.path.join(outdir, STATS_SOCKET)
+    if not os.path.exists(path):
+        return None
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.settimeout(timeout)
+            conn.connect(path)
+            conn.sendall((json.dumps({"stats": list(stats)}) + "\n").encode())
+            with conn.makefile("r") as reply:
+                return json.loads(reply.readline())
+    except (OSError, ValueError):
+        return None
+# query_stats_server() - end
+
+
+def roi_checkpoint_exists(outdir):
+    """ Check whether outdir holds a checkpoint taken at the ROI begin. """
+
+    return os.path.isdir(outdir) and \
+            any(name.startswith("cpt.") for name in os.listdir(outdir))
+# roi_checkpoint_exists() - end
+
+
+def stats_final_tick(outdir):
+    """ Simulated tick at the end of the run in outdir, None if unknown. """
+
+    final_tick = None
+    try:
+        with open(f"{outdir}/stats.txt", "rb") as f:
+            for line in f:
+                # the last dump holds the final tick
+                if line.startswith(b"final_tick "):
+                    final_tick = int(line.split()[1])
+    except (OSError, ValueError):
+        pass
+    return final_tick
+# stats_final_tick() - end
+
+
+def job_record(args):
+    """ Journal record identifying a simulation job. """
+
+    return {
+        "outdir": args.outdir,
+        "gem5": args.gem5,
+        "benchmark": args.benchmark,
+        "num_cpus": args.num_cpus,
+        "l2_size": args.l2_size,
+        "link_width_bits": args.link_width_bits,
+        "stage": "checkpoint" if args.take_roi_checkpoint else "run",
+        "state": None,
+        "returncode": None,
+        "attempts": 0,
+        "wall_time": 0.0,
+        "run_time": None,
+        "max_rss": None,
+        "final_tick": None,
+        "hang": None,
+    }
+# job_record() - end
+
+
+def run_gem5_job(args):
+    """ Run a simulation job with retries, return its journal record. """
+
+    record = job_record(args)
+
+    if args.dry_run:
+        run_gem5_instance(args)
+        record["state"] = "dry-run"
+        return record
+
+    if args.take_roi_checkpoint:
+        complete = roi_checkpoint_exists(args.outdir)
+    else:
+        complete = stats_complete(args.outdir)
+    if not args.rerun and complete:
+        record["state"] = "skipped"
+        return record
+
+    for attempt in range(1, args.retries + 2):
+        if attempt > 1:
+            backoff = args.retry_backoff * 2 ** (attempt - 2)
+            print(f"Retrying {args.outdir} in {backoff}s "
+                  f"(attempt {attempt}/{args.retries + 1})")
+            time.sleep(backoff)
+
+        start_time = time.time()
+        hang = None
+        try:
+            returncode, max_rss, hang = run_gem5_instance(args, check=False)
+            record["max_rss"] = max(record["max_rss"] or 0, max_rss)
+        except Exception as e:
+            # a broken job must not take down the whole pool
+            print(f"Error: {args.outdir}: {e}")
+            returncode = None
+        record["attempts"] = attempt
+        record["returncode"] = returncode
+        record["run_time"] = time.time() - start_time
+        record["wall_time"] += record["run_time"]
+
+        if hang:
+            # a configuration that hangs hangs again, do not retry it
+            record["state"] = "hung"
+            record["hang"] = hang
+            return record
+        if returncode == 0:
+            record["state"] = "done"
+            record["final_tick"] = stats_final_tick(args.outdir)
+            return record
+
+    record["state"] = "failed"
+    return record
+# run_gem5_job() - end
+
+
+def append_journal(journal, record):
+    """ Append a job record to the JSON-lines job journal. """
+
+    record = dict(record, time=time.strftime('%Y-%m-%d %H:%M:%S',
+                                             time.gmtime()))
+    with open(journal, 'a') as f:
+        f.write(json.dumps(record) + "\n")
+# append_journal() - end
+
+
+def job_key(record):
+    """ Configuration key of a job for its runtime and memory history. """
+
+    return (record["gem5"], record["benchmark"], record["num_cpus"],
+            record["l2_size"], record["link_width_bits"],
+            record.get("stage", "run"))
+# job_key() - end
+
+
+def load_job_history(journal):
+    """ Collect runtimes, peak memory and final ticks of past jobs from
+    the journal. """
+
+    runtimes = {}
+    footprints = {}
+    final_ticks = {}
+    if not os.path.exists(journal):
+        return runtimes, footprints, final_ticks
+
+    with open(journal, 'r') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # torn line from an interrupted launcher
+            if record.get("state") not in ["done", "failed", "hung"]:
+                continue
+            key = job_key(record)
+            if record.get("max_rss"):
+                footprints.setdefault(key, []).append(record["max_rss"])
+            if record["state"] == "done":
+                # only the last attempt ran to completion
+                run_time = record.get("run_time") or record["wall_time"]
+                runtimes.setdefault(key, []).append(run_time)
+                if record.get("final_tick"):
+                    final_ticks.setdefault(key, []).append(
+                            record["final_tick"])
+
+    return runtimes, footprints, final_ticks
+# load_job_history() - end
+
+
+def history_values(history, record):
+    """ History of a job configuration, or of its benchmark and core count. """
+
+    values = history.get(job_key(record))
+    if not values:
+        values = [v for key, key_values in history.items()
+                  if key[1:3] == (record["benchmark"], record["num_cpus"])
+                  for v in key_values]
+    return values
+# history_values() - end
+
+
+def expected_runtime(runtimes, record):
+    """ Expected wall time of a job, infinity if nothing is known yet. """
+
+    times = history_values(runtimes, record)
+    if not times:
+        return math.inf
+    return sum(times) / len(times)
+# expected_runtime() - end
+
+
+def expected_footprint(footprints, record, default):
+    """ Expected peak memory of a job in bytes, default if unknown. """
+
+    sizes = history_values(footprints, record)
+    if not sizes:
+        return default
+    return max(sizes)
+# expected_footprint() - end
+
+
+def order_jobs(args_list, runtimes):
+    """ Order jobs longest expected runtime first (LPT). """
+
+    # unknown jobs go first: they may be the longest, and they seed the
+    # history for the next campaign
+    return sorted(args_list, reverse=True,
+                  key=lambda a: expected_runtime(runtimes, job_record(a)))
+# order_jobs() - end
+
+
+def admit_jobs(args, pool, args_list, footprints):
+    """ Dispatch jobs while their projected memory fits in the budget. """
+
+    budget = args.memory_budget * 2**30
+    default = args.job_memory * 2**30
+    finished = queue.Queue()
+    pending = list(args_list)
+    running = 0
+    in_use = 0
+
+    while pending or running:
+        # admit jobs in LPT order, skipping the ones that do not fit now
+        i = 0
+        while i < len(pending) and running < args.sweep_thread_pool_size:
+            job = pending[i]
+            footprint = expected_footprint(footprints, job_record(job),
+                                           default)
+            # a job larger than the whole budget runs alone
+            if running > 0 and in_use + footprint > budget:
+                i += 1
+                continue
+            pending.pop(i)
+            running += 1
+            in_use += footprint
+            pool.apply_async(run_gem5_job, (job,),
+                    callback=lambda r, f=footprint: finished.put((r, f)),
+                    error_callback=lambda e, j=job, f=footprint: finished.put(
+                        (dict(job_record(j), state="failed"), f)))
+
+        record, footprint = finished.get()
+        running -= 1
+        in_use -= footprint
+        # learn the footprint for the jobs still pending
+        if record["max_rss"]:
+            footprints.setdefault(job_key(record), []).append(
+                    record["max_rss"])
+        yield record
+# admit_jobs() - end
+
+
+def format_duration(seconds):
+    """ Format a duration in seconds as hours and minutes. """
+
+    if seconds is None or math.isinf(seconds):
+        return "-"
+    minutes = int(max(seconds, 0)) // 60
+    return f"{minutes // 60}h{minutes % 60:02d}m"
+# format_duration() - end
+
+
+def job_progress(job, samples, runtimes, final_ticks):
+    """ Progress of a running job from its stats server, None if it is not
+    running. samples holds the previous reply of every job for its rates. """
+
+    reply = query_stats_server(job.outdir)
+    if reply is None or "tick" not in reply:
+        samples.pop(job.outdir, None)
+        return None
+
+    record = job_record(job)
+    elapsed = reply["host_seconds"]
+    tick = reply["tick"]
+    insts = reply.get("sim_insts") or 0
+    progress = {"outdir": job.outdir, "elapsed": elapsed, "tick": tick,
+                "tick_rate": None, "inst_rate": None, "done": None,
+                "eta": None}
+
+    # rates over the last refresh interval, a restored job does not start
+    # at tick 0
+    last = samples.get(job.outdir)
+    samples[job.outdir] = reply
+    if last is not None and elapsed > last["host_seconds"]:
+        interval = elapsed - last["host_seconds"]
+        progress["tick_rate"] = (tick - last["tick"]) / interval
+        if insts >= (last.get("sim_insts") or 0):
+            progress["inst_rate"] = \
+                    (insts - (last.get("sim_insts") or 0)) / interval
+
+    # project the completion from the final tick of past runs of the same
+    # configuration, or from their runtime
+    ticks = history_values(final_ticks, record)
+    runtime = expected_runtime(runtimes, record)
+    if ticks:
+        final_tick = sum(ticks) / len(ticks)
+        progress["done"] = tick / final_tick
+        if progress["tick_rate"]:
+            progress["eta"] = (final_tick - tick) / progress["tick_rate"]
+    elif not math.isinf(runtime):
+        progress["done"] = elapsed / runtime
+        progress["eta"] = runtime - elapsed
+    return progress
+# job_progress() - end
+
+
+def print_progress(args_list, samples, runtimes, final_ticks):
+    """ Print a table of the throughput and projected completion of the
+    running jobs. """
+
+    rows = []
+    for job in args_list:
+        progress = job_progress(job, samples, runtimes, final_ticks)
+        if progress is not None:
+            rows.append(progress)
+    if not rows:
+        return
+
+    # the slowest jobs first, they are the ones to look at
+    rows.sort(key=lambda p: p["tick_rate"] if p["tick_rate"] is not None
+                            else math.inf)
+    width = max(len(p["outdir"]) for p in rows)
+    lines = [f"Progress at {time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime())}"
+             f" ({len(rows)} running)",
+             f"{'job':<{width}} {'elapsed':>9} {'Mticks':>12} "
+             f"{'Mticks/s':>9} {'MIPS':>7} {'done':>6} {'ETA':>9}"]
+    for p in rows:
+        tick_rate = "-" if p["tick_rate"] is None \
+                else f"{p['tick_rate'] / 1e6:.2f}"
+        inst_rate = "-" if p["inst_rate"] is None \
+                else f"{p['inst_rate'] / 1e6:.2f}"
+        # past the expected end: deadlocked or pathologically slow
+        if p["done"] is None:
+            done = "-"
+        elif p["done"] > 1:
+            done = "over"
+        else:
+            done = f"{100 * p['done']:.0f}%"
+        eta = format_duration(p["eta"]) if p["done"] is None or \
+                p["done"] <= 1 else "-"
+        lines.append(f"{p['outdir']:<{width}} "
+                     f"{format_duration(p['elapsed']):>9} "
+                     f"{p['tick'] / 1e6:>12.0f} {tick_rate:>9} "
+                     f"{inst_rate:>7} {done:>6} {eta:>9}")
+    print("\n".join(lines), flush=True)
+# print_progress() - end
+
+
+def monitor_progress(args, args_list, runtimes, final_ticks, finished):
+    """ Print the progress of the running jobs every progress interval
+    until finished is set. """
+
+    samples = {}
+    while not finished.wait(args.progress_interval):
+        try:
+            print_progress(args_list, samples, runtimes, final_ticks)
+        except Exception as e:
+            # monitoring must never take down the campaign
+            print(f"Error: progress monitor: {e}")
+# monitor_progress() - end
+
+
+def roi_checkpoint_dir(args):
+    """ Checkpoint directory shared by all schemes of a benchmark run. """
+
+    # the ROI state only depends on the program, its inputs and the core
+    # count, the caches are bypassed while fast-forwarding
+    cmd, options = get_benchmark_cmd_options(args)
+    key = f"{cmd} {options} {args.num_cpus}"
+    digest = hashlib.sha1(key.encode()).hexdigest()[:12]
+    return f"{args.checkpoint_root}/{args.benchmark}-{args.num_cpus}cpus-" \
+           f"{digest}"
+# roi_checkpoint_dir() - end
+
+
+def run_jobs(args, args_list):
+    """ Run simulation jobs, restoring from ROI checkpoints if enabled. """
+
+    if not args.roi_checkpoints:
+        return dispatch_jobs(args, args_list)
+
+    # stage 1: one fast-forward to the ROI begin per distinct program
+    checkpoint_jobs = {}
+    for job in args_list:
+        outdir = roi_checkpoint_dir(job)
+        if outdir not in checkpoint_jobs:
+            checkpoint_job = deepcopy(job)
+            checkpoint_job.outdir = outdir
+            checkpoint_job.take_roi_checkpoint = True
+            checkpoint_jobs[outdir] = checkpoint_job
+    print(f"Taking {len(checkpoint_jobs)} ROI checkpoints for "
+          f"{len(args_list)} jobs")
+    failed = dispatch_jobs(args, list(checkpoint_jobs.values()))
+
+    # stage 2: every scheme restores from its checkpoint, jobs whose
+    # checkpoint could not be taken fall back to fast-forwarding
+    for job in args_list:
+        outdir = roi_checkpoint_dir(job)
+        if args.dry_run or roi_checkpoint_exists(outdir):
+            job.restore_roi_checkpoint = outdir
+    return failed + dispatch_jobs(args, args_list)
+# run_jobs() - end
+
+
+def dispatch_jobs(args, args_list):
+    """ Run simulation jobs on a process pool and journal their outcomes. """
+
+    states = {}
+    failed = []
+
+    runtimes, footprints, final_ticks = load_job_history(args.journal)
+    args_list = order_jobs(args_list, runtimes)
+
+    finished = threading.Event()
+    if args.progress_interval and not args.dry_run:
+        threading.Thread(target=monitor_progress, daemon=True,
+                         args=(args, args_list, runtimes, final_ticks,
+                               finished)).start()
+
+    pool = mp.Pool(args.sweep_thread_pool_size)
+    if args.memory_budget is None:
+        records = pool.imap_unordered(run_gem5_job, args_list)
+    else:
+        records = admit_jobs(args, pool, args_list, footprints)
+    for record in records:
+        states[record["state"]] = states.get(record["state"], 0) + 1
+        if record["state"] == "dry-run":
+            continue
+        append_journal(args.journal, record)
+        if record["state"] in ["failed", "hung"]:
+            failed.append(record)
+    pool.close()
+    pool.join()
+    finished.set()
+
+    print(", ".join(f"{count} {state}" for state, count in states.items()))
+    for record in failed:
+        if record["state"] == "hung":
+            print(f"Hung: {record['outdir']} ({record['hang']}), see "
+                  f"{record['outdir']}/sim.log and "
+                  f"{record['outdir']}/stats-{record['hang']}.txt")
+            continue
+        print(f"Failed: {record['outdir']} -> {record['returncode']} "
+              f"after {record['attempts']} attempt(s), see "
+              f"{record['outdir']}/sim.log")
+
+    return failed
+# dispatch_jobs() - end
+
+
 def sweep(args):
     """ Sweep number of cpus and window cycles. """
 
@@ -538,10 +1192,7 @@ def sweep(args):
     if len(args_list) < args.sweep_thread_pool_size:
         args.sweep_thread_pool_size = len(args_list)
 
-    pool = mp.Pool(args.sweep_thread_pool_size)
-    pool.map(run_gem5_instance, args_list)
-    pool.close()
-    pool.join()
+    run_jobs(args, args_list)
 
     print("Complete all simulation jobs!")
 # sweep() - end
@@ -1156,10 +1807,7 @@ def launch_experiments(args):
             f.write(json.dumps(vars(args_list[i])) + "\n")
     f.close()
 
-    pool = mp.Pool(args.sweep_thread_pool_size)
-    pool.map(run_gem5_instance, args_list)
-    pool.close()
-    pool.join()
+    run_jobs(args, args_list)
 
     print("Launched all simulation jobs!")
 
@@ -1305,14 +1953,43 @@ def main():
                              "outstanding GetS requestors")
     parser.add_argument("--link-width-bits", type=int, default=128,
                         help="Network link width in bits")
+    parser.add_argument("--concentration", default=1, type=int,
+                        help="Number of cores per mesh router, e.g., 4 for "
+                             "256 or 1024 cores [Default: 1]")
+    parser.add_argument("--num-dirs", default=4, type=int,
+                        help="Number of directories/memory controllers, a "
+                             "power of 2 [Default: 4]")
+    parser.add_argument("--dir-placement", default="corners", type=str,
+                        choices=["corners", "edges", "diagonal",
+                                 "interleaved"],
+                        help="Placement of the directories in the mesh "
+                             "[Default: corners]")
+    parser.add_argument("--noc-topology", default="mesh", type=str,
+                        choices=list(NOC_TOPOLOGIES),
+                        help="Network topology, the topologies other than "
+                             "the mesh use their own routing algorithm "
+                             "instead of --routing [Default: mesh]")
+    parser.add_argument("--express-interval", default=4, type=int,
+                        help="Routers covered by an express link of the "
+                             "express-mesh topology [Default: 4]")
+    parser.add_argument("--cluster-rows", default=4, type=int,
+                        help="Router rows of a cluster of the clustered-mesh "
+                             "topology [Default: 4]")
+    parser.add_argument("--cluster-cols", default=4, type=int,
+                        help="Router columns of a cluster of the "
+                             "clustered-mesh topology [Default: 4]")
     parser.add_argument("--routing", default=4, type=int,
                         help="""routing algorithm in network.
                             0: weight-based table,
                             1: XY (for Mesh),
                             2: Custom,
                             3: YX (for Mesh),
-                            4: XY-YX (for Mesh)
-                            5: Adaptive (for Mesh)""")
+                            4: XY-YX (for Mesh),
+                            5: Express XY (for express-mesh),
+                            6: Flattened butterfly,
+                            7: Clustered (for clustered-mesh),
+                            8: Quadrant XY-YX (for Mesh, load-balanced
+                               multicast trees)""")
     parser.add_argument("--hold-switch-for-multicast-only",
                         action="store_true", default=False,
                         help="Hold switch for multicast packets only but not "
@@ -1338,9 +2015,75 @@ def main():
                         type=str,
                         help="Set the output directory [Default: "
                              "experiments (m5out/experiments)]")
+    parser.add_argument("--stats-server", default=False,
+                        action="store_true",
+                        help="Serve the progress and the current stats of "
+                             "every job on a Unix socket in its outdir "
+                             "[Default: False]")
+    parser.add_argument("--progress-interval", default=0, type=int,
+                        help="Print the simulated ticks and instructions "
+                             "per second and the projected completion of "
+                             "the running jobs every this many seconds, "
+                             "implies --stats-server [Default: 0, off]")
+    parser.add_argument("--watchdog-timeout", default=0, type=int,
+                        help="Kill a job whose committed instructions did "
+                             "not advance, or whose stats server did not "
+                             "answer, for this many seconds, after dumping "
+                             "its stats and backtrace, and record it as "
+                             "hung; armed by the first stats server reply, "
+                             "implies --stats-server; allow for the time "
+                             "taken by checkpoints [Default: 0, off]")
+    parser.add_argument("--watchdog-min-rate", default=1000, type=float,
+                        help="Committed instructions (simulated ticks if "
+                             "the job does not report them) per second "
+                             "below which a job counts as not advancing "
+                             "[Default: 1000]")
+    parser.add_argument("--watchdog-grace", default=30, type=int,
+                        help="Seconds given to a hung job to dump its "
+                             "stats and backtrace before the next signal "
+                             "[Default: 30]")
+    parser.add_argument("--journal", default="./jobs.jsonl", type=str,
+                        help="JSON-lines journal recording the state, exit "
+                             "code and wall time of every launched job "
+                             "[Default: ./jobs.jsonl]")
+    parser.add_argument("--rerun", default=False, action="store_true",
+                        help="Rerun jobs even if their outdir already has a "
+                             "complete stats.txt [Default: False]")
+    parser.add_argument("--roi-checkpoints", default=False,
+                        action="store_true",
+                        help="Fast-forward each benchmark once, checkpoint "
+                             "it at the ROI begin and restore every scheme "
+                             "from the checkpoint [Default: False]")
+    parser.add_argument("--checkpoint-root", default="m5out/checkpoints",
+                        type=str,
+                        help="Directory for the ROI checkpoints "
+                             "[Default: m5out/checkpoints]")
+    parser.add_argument("--take-roi-checkpoint", default=False,
+                        action="store_true",
+                        help="Take a checkpoint in outdir at the ROI begin "
+                             "and exit [Default: False]")
+    parser.add_argument("--restore-roi-checkpoint", default=None, type=str,
+                        help="Restore from the ROI checkpoint in this "
+                             "directory instead of fast-forwarding "
+                             "[Default: None]")
+    parser.add_argument("--memory-budget", default=None, type=float,
+                        help="Memory in GB that concurrent jobs may use; "
+                             "jobs are only started while their projected "
+                             "peak memory fits [Default: None, unlimited]")
+    parser.add_argument("--job-memory", default=8, type=float,
+                        help="Assumed peak memory in GB of a job without "
+                             "history in the journal [Default: 8]")
+    parser.add_argument("--retries", default=2, type=int,
+                        help="Number of times a failed job is retried "
+                             "[Default: 2]")
+    parser.add_argument("--retry-backoff", default=60, type=int,
+                        help="Seconds to wait before the first retry, "
+                             "doubled for each further retry [Default: 60]")
     # TODO: add prepush option and decouple it from debug-start and debug-end
 
     args = parser.parse_args()
+    if args.progress_interval or args.watchdog_timeout:
+        args.stats_server = True
 
     if args.launch_experiments is None:
         if not os.path.exists(args.gem5):
@@ -0,0 +1,112 @@
+import os
+import unittest
+import importlib.util
+from types import SimpleNamespace
+from unittest import mock
+
+# run-experiment.py is a script, load it by its path
+spec = importlib.util.spec_from_file_location(
+    "run_experiment",
+    os.path.join(os.path.dirname(__file__), "..", "run-experiment.py"))
+run_experiment = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(run_experiment)
+
+
+def watchdog_args(**kwargs):
+    """ Command line arguments of a job supervised by the watchdog. """
+
+    args = {"outdir": "m5out", "watchdog_timeout": 400,
+            "watchdog_min_rate": 1000, "watchdog_grace": 30}
+    args.update(kwargs)
+    return SimpleNamespace(**args)
+# watchdog_args() - end
+
+
+def sample(time, tick=None, insts=None, cpu=0.0):
+    """ Watchdog sample, tick is None while the stats server is silent. """
+
+    return {"time": time, "tick": tick, "insts": insts, "cpu": cpu}
+# sample() - end
+
+
+class TestAdvancing(unittest.TestCase):
+
+    def test_silent_server_does_not_advance(self):
+        args = watchdog_args()
+        last = sample(0, tick=10**9, insts=10**6, cpu=10)
+        self.assertFalse(run_experiment.advancing(
+            args, last, sample(100, cpu=110)))
+
+    def test_first_reply_advances(self):
+        args = watchdog_args()
+        self.assertTrue(run_experiment.advancing(
+            args, sample(0), sample(100, tick=10**9, insts=0)))
+
+    def test_ticks_without_instructions_do_not_advance(self):
+        args = watchdog_args()
+        last = sample(0, tick=10**9, insts=10**6)
+        self.assertFalse(run_experiment.advancing(
+            args, last, sample(100, tick=10**12, insts=10**6)))
+
+    def test_instructions_advance(self):
+        args = watchdog_args()
+        last = sample(0, tick=10**9, insts=10**6)
+        self.assertTrue(run_experiment.advancing(
+            args, last, sample(100, tick=10**10, insts=10**7)))
+
+    def test_ticks_advance_without_instruction_count(self):
+        args = watchdog_args()
+        self.assertTrue(run_experiment.advancing(
+            args, sample(0, tick=10**9), sample(100, tick=10**10)))
+# class TestAdvancing - end
+
+
+class TestWatchGem5Instance(unittest.TestCase):
+
+    def watch(self, samples):
+        """ Supervise a job producing samples, return the reason it was
+        killed for, None if it exited by itself. """
+
+        args = watchdog_args()
+        samples = iter(samples)
+        with mock.patch.object(run_experiment, "watchdog_sample",
+                               lambda args, pid: next(samples)), \
+                mock.patch.object(run_experiment, "wait_exit",
+                                  return_value=False), \
+                mock.patch.object(run_experiment, "kill_hung_instance") \
+                as kill:
+            reason = run_experiment.watch_gem5_instance(args, 1)
+        if reason is not None:
+            kill.assert_called_once_with(args, 1, reason)
+        return reason
+
+    def test_silent_server_with_growing_cpu_is_livelock(self):
+        # gem5 spins inside an event, its stats server stops answering
+        samples = [sample(0, tick=10**9, insts=10**6, cpu=0)] + \
+                [sample(100 * i, cpu=100 * i) for i in range(1, 6)]
+        self.assertEqual(self.watch(samples), "livelock")
+
+    def test_silent_server_without_cpu_is_stalled(self):
+        samples = [sample(0, tick=10**9, insts=10**6, cpu=0)] + \
+                [sample(100 * i, cpu=1) for i in range(1, 6)]
+        self.assertEqual(self.watch(samples), "stalled")
+
+    def test_ticks_without_instructions_is_livelock(self):
+        samples = [sample(100 * i, tick=10**9 * (i + 1), insts=10**6,
+                          cpu=100 * i) for i in range(6)]
+        self.assertEqual(self.watch(samples), "livelock")
+
+    def test_unarmed_watchdog_waits(self):
+        # instantiate() may take longer than the timeout before the stats
+        # server answers, then the job advances
+        samples = [sample(100 * i, cpu=100 * i) for i in range(10)] + \
+                [sample(1000 + 100 * i, tick=10**9 * (i + 1),
+                        insts=10**6 * (i + 1), cpu=1000 + 100 * i)
+                 for i in range(10)]
+        with self.assertRaises(StopIteration):
+            self.watch(samples)
+# class TestWatchGem5Instance - end
+
+
+if __name__ == "__main__":
+    unittest.main()